@@ -2,23 +2,203 @@
 API endpoints for v1.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from typing import List, Optional
+from sqlalchemy import select, insert, or_, tuple_, update, values, column, cast, func, Float, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+import asyncio
+import numpy as np
 
+from app.config import settings
 from app.database import get_session
-from app.models.asset import Asset
+from app.models.asset import EXTRA_DATA_NUMERIC_KEYS, Asset
 from app.models.engagement import Engagement
 from app.models.event import Event
 from app.models.command import Command
-from app.schemas.assets import AssetCreate, AssetUpdate, AssetResponse, AssetListResponse
-from app.schemas.engagements import EngagementCreate, EngagementUpdate, EngagementResponse, EngagementListResponse
-from app.schemas.events import EventCreate, EventResponse
+from app.models.asset_position import AssetPosition
+from app.models.tombstone import Tombstone
+from app.schemas.assets import (
+    AssetCreate,
+    AssetUpdate,
+    AssetResponse,
+    AssetListResponse,
+    AssetDistanceResponse,
+    AssetTelemetryBatch,
+    AssetTelemetryResponse,
+    AssetTrackResponse,
+    ThreatListResponse,
+)
+from app.schemas.engagements import (
+    EngagementCreate,
+    EngagementUpdate,
+    EngagementResponse,
+    EngagementExpandedResponse,
+    EngagementListResponse,
+    EngagementActionBatch,
+    EngagementActionResult,
+    EngagementActionBatchResponse,
+    AssignmentRequest,
+    AssignmentResponse,
+)
+from app.schemas.events import EventCreate, EventResponse, EventStatsResponse
 from app.schemas.commands import CommandCreate, CommandResponse
+from app.schemas.imports import ImportResult
+from app.schemas.sync import SyncResponse
+from app.services.asset_index import asset_index
+from app.services.bulk_import import IMPORT_TARGETS, detect_format, import_records, read_records, spool_body
+from app.services.change_feed import (
+    asset_messages,
+    change_feed,
+    command_messages,
+    engagement_messages,
+    event_messages,
+)
+from app.services.command_dispatch import command_dispatcher
+from app.services.count_cache import count_cache
+from app.services.engagement_state import LIVE_STATUSES, TRANSITIONS, apply_transition, apply_transitions
+from app.services.entity_cache import entity_cache
+from app.services.event_buffer import EventBufferClosed, EventBufferFull, event_buffer
+from app.services.event_rollups import GROUP_BY_COLUMNS, stats_query
+from app.services.export import stream_ndjson
+from app.services.threat_scores import threat_scores
+from app.services.tile_cache import MAX_TILE_ZOOM, pack_tile, tile_cache
+from app.services.track_history import record_positions
+from app.utils.assignment import solve_assignment
+from app.utils.geo import distance_matrix_km, tile_bounds
+from app.utils.json_filter import compile_filters
+from app.utils.columnar import build_columnar
+from app.utils.fast_json import FastJSONResponse, rows_to_dicts
+from app.utils.pagination import decode_watermark, encode_watermark, fetch_page
+from app.utils.timestamps import naive_utc
+from app.utils.track import simplify_track
 
 router = APIRouter(tags=["v1"])
 
+# Rows per multi-row statement, keeping bind parameters under asyncpg's limit
+TELEMETRY_CHUNK_SIZE = 5000
+
+# Page size caps; columnar snapshots are compact enough for full-map pages
+LIST_MAX_LIMIT = 1000
+COLUMNAR_MAX_LIMIT = 100_000
+
+# Largest friendly x enemy cost matrix an assignment run may build
+ASSIGNMENT_MAX_PAIRS = 25_000_000
+
+# Related assets that engagement reads can embed, by foreign key column
+ENGAGEMENT_EXPANSIONS = {"friendly": "friendly_id", "enemy": "enemy_id"}
+EXPAND_PATTERN = "^(friendly|enemy)(,(friendly|enemy))*$"
+
+# Event stats bucket widths and the most buckets one request may span
+STATS_BUCKETS = {"1m": timedelta(minutes=1), "1h": timedelta(hours=1)}
+STATS_DEFAULT_BUCKETS = {"1m": 60, "1h": 24}
+STATS_MAX_BUCKETS = 1440
+
+# Sync watermarks trail the clock so rows committed by transactions that
+# started before the sync are not skipped; clients apply changes idempotently.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def _parse_bbox(bbox: str) -> tuple:
+    """Parse a min_lon,min_lat,max_lon,max_lat viewport string."""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lon,min_lat,max_lon,max_lat")
+    if min_lat > max_lat:
+        raise HTTPException(status_code=400, detail="bbox min_lat must not exceed max_lat")
+    # A viewport crossing the antimeridian has min_lon > max_lon
+    if min_lon > max_lon:
+        max_lon += 360
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def _cluster_to_dict(cluster) -> dict:
+    """Convert an index cluster to the AssetCluster response shape."""
+    return {
+        "lat": cluster.lat,
+        "lon": cluster.lon,
+        "count": cluster.count,
+        "friendly_count": cluster.friendly_count,
+        "enemy_count": cluster.enemy_count,
+        "asset_id": cluster.key,
+    }
+
+
+async def _fetch_page(session: AsyncSession, stmt, model, cursor: Optional[str], limit: int, offset: int = 0, column=None):
+    """Fetch a keyset page of plain rows as dicts, turning a malformed cursor into a 400."""
+    try:
+        rows, next_cursor = await fetch_page(session, stmt, model, cursor, limit, offset, scalars=False, column=column)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return rows_to_dicts(rows), next_cursor
+
+
+def _json_filters(filters: List[str], columns: dict, numeric_keys: Optional[dict] = None) -> list:
+    """Compile ``filter`` expressions on JSONB columns, turning bad ones into a 400."""
+    try:
+        return compile_filters(filters, columns, numeric_keys)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _page_headers(total: Optional[int], next_cursor: Optional[str]) -> dict:
+    """Pagination metadata for endpoints that return a bare list."""
+    headers = {}
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return headers
+
+
+async def _get_cached(session: AsyncSession, model, schema, entity_id):
+    """Read-through lookup of an entity snapshot by ID; None if missing."""
+    try:
+        key = UUID(str(entity_id))
+    except ValueError:
+        return None
+    table = model.__tablename__
+    cached = entity_cache.get(table, key)
+    if cached is None:
+        # Read the version first so a write committed while we load is not overwritten
+        version = entity_cache.version(table, key)
+        entity = await session.get(model, key)
+        if entity is None:
+            return None
+        cached = schema.model_validate(entity)
+        entity_cache.fill(table, key, cached, version)
+    return cached
+
+
+def _cache_entity(entity, schema, table: Optional[str] = None):
+    """Refresh the cached snapshot of an entity or result row after a write."""
+    snapshot = schema.model_validate(entity)
+    entity_cache.put(table or type(entity).__tablename__, entity.id, snapshot)
+    return snapshot
+
+
+async def _expand_engagements(session: AsyncSession, engagements: List[dict], expand: Optional[str]) -> List[dict]:
+    """Embed related assets into engagement dicts using one batched query."""
+    fields = list(dict.fromkeys(expand.split(","))) if expand else []
+    if not fields or not engagements:
+        return engagements
+    
+    asset_ids = {engagement[ENGAGEMENT_EXPANSIONS[field]] for engagement in engagements for field in fields}
+    asset_ids.discard(None)
+    assets = {}
+    if asset_ids:
+        result = await session.execute(select(Asset.__table__).where(Asset.id.in_(asset_ids)))
+        assets = {row.id: row._asdict() for row in result}
+    
+    for engagement in engagements:
+        for field in fields:
+            engagement[field] = assets.get(engagement[ENGAGEMENT_EXPANSIONS[field]])
+    return engagements
+
 
 # Assets endpoints
 @router.get("/assets", response_model=AssetListResponse)
@@ -27,23 +207,90 @@ async def list_assets(
     zone: str = None,
     status: str = None,
     is_friendly: bool = None,
-    limit: int = 100,
+    bbox: Optional[str] = Query(default=None, description="Viewport as min_lon,min_lat,max_lon,max_lat"),
+    zoom: Optional[int] = Query(default=None, ge=0, le=24),
+    format: str = Query(default="json", pattern="^(json|columnar)$"),
+    limit: int = Query(default=100, ge=1, le=COLUMNAR_MAX_LIMIT),
+    cursor: Optional[str] = None,
     offset: int = 0,
+    filters: List[str] = Query(default=[], alias="filter", description="JSON field filter such as extra_data.battery_level<20; repeatable"),
 ):
-    """List all assets."""
-    stmt = select(Asset)
+    """List all assets, newest first.
+    
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page.
+    With ``bbox`` and a ``zoom`` below the clustering threshold, returns
+    pre-aggregated clusters for the viewport instead of individual assets
+    (only ``is_friendly`` applies to clusters).
+    
+    ``format=columnar`` returns parallel ``ids``/``lat``/``lon``/``status``
+    arrays plus an ``is_friendly`` bitset instead of one object per asset,
+    and allows much larger pages for full operational snapshots.
+    """
+    if format == "json" and limit > LIST_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit above {LIST_MAX_LIMIT} requires format=columnar")
+    criteria = []
+    
+    if bbox is not None:
+        min_lon, min_lat, max_lon, max_lat = _parse_bbox(bbox)
+        if zoom is not None and zoom < asset_index.clusters.max_zoom:
+            await asset_index.ensure_loaded(session)
+            clusters = asset_index.cluster(min_lat, min_lon, max_lat, max_lon, zoom, is_friendly=is_friendly)
+            return FastJSONResponse({
+                "assets": [],
+                "total": sum(cluster.count for cluster in clusters),
+                "next_cursor": None,
+                "clusters": [_cluster_to_dict(cluster) for cluster in clusters],
+            })
+        criteria.append(Asset.lat.between(min_lat, max_lat))
+        if max_lon > 180:
+            criteria.append(or_(Asset.lon >= min_lon, Asset.lon <= max_lon - 360))
+        else:
+            criteria.append(Asset.lon.between(min_lon, max_lon))
     
     if zone:
-        stmt = stmt.where(Asset.zone == zone)
+        criteria.append(Asset.zone == zone)
     if status:
-        stmt = stmt.where(Asset.status == status)
+        criteria.append(Asset.status == status)
     if is_friendly is not None:
-        stmt = stmt.where(Asset.is_friendly == is_friendly)
+        criteria.append(Asset.is_friendly == is_friendly)
+    criteria.extend(_json_filters(
+        filters, {"extra_data": Asset.extra_data}, {"extra_data": EXTRA_DATA_NUMERIC_KEYS}
+    ))
+    
+    total = await count_cache.count(session, Asset, (bbox, zone, status, is_friendly, tuple(filters)), *criteria)
+    
+    if format == "columnar":
+        stmt = select(Asset.id, Asset.lat, Asset.lon, Asset.status, Asset.is_friendly, Asset.created_at).where(*criteria)
+        try:
+            rows, next_cursor = await fetch_page(session, stmt, Asset, cursor, limit, offset, scalars=False)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return FastJSONResponse({**build_columnar(rows), "total": total, "next_cursor": next_cursor})
+    
+    assets, next_cursor = await _fetch_page(session, select(Asset.__table__).where(*criteria), Asset, cursor, limit, offset)
+    return FastJSONResponse({"assets": assets, "total": total, "next_cursor": next_cursor, "clusters": None})
+
+
+@router.get("/assets/nearby", response_model=List[AssetResponse])
+async def get_nearby_assets(
+    lat: float,
+    lon: float,
+    radius_km: float = 100,
+    is_friendly: Optional[bool] = None,
+    session: AsyncSession = Depends(get_session),
+):
+    """Get assets within radius, nearest first."""
+    await asset_index.ensure_loaded(session)
+    matches = asset_index.nearby(lat, lon, radius_km, is_friendly=is_friendly)
+    if not matches:
+        return []
     
-    result = await session.execute(stmt.offset(offset).limit(limit))
+    # Only hydrate the rows the index matched
+    distances = dict(matches)
+    result = await session.execute(select(Asset).where(Asset.id.in_(distances)))
     assets = result.scalars().all()
     
-    return {"assets": assets, "total": len(assets)}
+    return sorted(assets, key=lambda asset: distances[asset.id])
 
 
 @router.get("/assets/{asset_id}", response_model=AssetResponse)
@@ -52,7 +299,7 @@ async def get_asset(
     session: AsyncSession = Depends(get_session),
 ):
     """Get asset by ID."""
-    asset = await session.get(Asset, asset_id)
+    asset = await _get_cached(session, Asset, AssetResponse, asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     return asset
@@ -66,11 +313,77 @@ async def create_asset(
     """Create a new asset."""
     db_asset = Asset(**asset.model_dump())
     session.add(db_asset)
+    await session.flush()
+    await record_positions(session, [(db_asset.id, db_asset.lat, db_asset.lon, datetime.utcnow())])
     await session.commit()
     await session.refresh(db_asset)
+    asset_index.sync(db_asset)
+    _cache_entity(db_asset, AssetResponse)
+    change_feed.publish(asset_messages("created", db_asset))
     return db_asset
 
 
+@router.post("/assets/telemetry", response_model=AssetTelemetryResponse)
+async def ingest_telemetry(
+    batch: AssetTelemetryBatch,
+    session: AsyncSession = Depends(get_session),
+):
+    """Apply a batch of position reports as set-based updates."""
+    now = datetime.utcnow()
+    
+    # Last report wins when an asset appears more than once in the batch
+    latest = {}
+    for item in batch.updates:
+        latest[item.id] = item
+    items = list(latest.values())
+    
+    updated = []
+    for start in range(0, len(items), TELEMETRY_CHUNK_SIZE):
+        chunk = items[start:start + TELEMETRY_CHUNK_SIZE]
+        reports = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("lat", Float),
+            column("lon", Float),
+            column("status", String),
+            column("last_seen", DateTime),
+            name="reports",
+        ).data([(item.id, item.lat, item.lon, item.status, item.last_seen or now) for item in chunk])
+        
+        stmt = (
+            update(Asset)
+            .where(Asset.id == reports.c.id)
+            .values(
+                lat=reports.c.lat,
+                lon=reports.c.lon,
+                status=func.coalesce(cast(reports.c.status, String), Asset.status),
+                last_seen=reports.c.last_seen,
+                updated_at=now,
+            )
+            .returning(Asset.id, Asset.lat, Asset.lon, Asset.status, Asset.is_friendly, Asset.is_active, Asset.last_seen)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+        await record_positions(session, [(row.id, row.lat, row.lon, row.last_seen) for row in rows])
+        updated.extend(rows)
+    
+    await session.commit()
+    
+    for row in updated:
+        asset_index.upsert(row.id, row.lat, row.lon, row.is_friendly, row.status, row.is_active, last_seen=row.last_seen)
+    entity_cache.invalidate_many(Asset.__tablename__, (row.id for row in updated))
+    for row in updated:
+        change_feed.publish(asset_messages("updated", row))
+    
+    updated_ids = {row.id for row in updated}
+    results = [
+        {"id": item.id, "result": "updated" if item.id in updated_ids else "not_found"}
+        for item in batch.updates
+    ]
+    not_found = sum(1 for item in items if item.id not in updated_ids)
+    return {"results": results, "updated": len(updated_ids), "not_found": not_found}
+
+
 @router.put("/assets/{asset_id}", response_model=AssetResponse)
 async def update_asset(
     asset_id: str,
@@ -83,11 +396,18 @@ async def update_asset(
         raise HTTPException(status_code=404, detail="Asset not found")
     
     update_data = asset.model_dump(exclude_unset=True)
+    previous_position = (db_asset.lat, db_asset.lon)
     for key, value in update_data.items():
         setattr(db_asset, key, value)
     
+    if (db_asset.lat, db_asset.lon) != previous_position:
+        await record_positions(session, [(db_asset.id, db_asset.lat, db_asset.lon, datetime.utcnow())])
+    
     await session.commit()
     await session.refresh(db_asset)
+    asset_index.sync(db_asset)
+    _cache_entity(db_asset, AssetResponse)
+    change_feed.publish(asset_messages("updated", db_asset))
     return db_asset
 
 
@@ -103,39 +423,155 @@ async def delete_asset(
     
     asset.is_active = False
     await session.commit()
+    asset_index.remove(asset.id)
+    entity_cache.invalidate(Asset.__tablename__, asset.id)
+    change_feed.publish(asset_messages("deleted", asset))
     return None
 
 
-@router.get("/assets/nearby", response_model=List[AssetResponse])
-async def get_nearby_assets(
-    lat: float,
-    lon: float,
-    radius_km: float = 100,
-    is_friendly: Optional[bool] = None,
+@router.get("/assets/{enemy_id}/nearest-friendlies", response_model=List[AssetDistanceResponse])
+async def get_nearest_friendlies(
+    enemy_id: str,
+    k: int = Query(default=1, ge=1, le=100),
+    status: Optional[str] = Query(default="available", description="Friendly status to match; empty for any status"),
     session: AsyncSession = Depends(get_session),
 ):
-    """Get assets within radius."""
-    # Get all assets
-    stmt = select(Asset)
-    if is_friendly is not None:
-        stmt = stmt.where(Asset.is_friendly == is_friendly)
+    """Get the k friendly assets closest to an enemy asset."""
+    enemy = await _get_cached(session, Asset, AssetResponse, enemy_id)
+    if not enemy:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    if enemy.lat is None or enemy.lon is None:
+        raise HTTPException(status_code=400, detail="Asset has no position")
     
-    result = await session.execute(stmt)
-    assets = result.scalars().all()
+    await asset_index.ensure_loaded(session)
+    matches = asset_index.nearest_friendlies(enemy.lat, enemy.lon, k, status=status or None)
+    matches = [(asset_id, distance) for asset_id, distance in matches if asset_id != enemy.id]
+    if not matches:
+        return []
+    
+    distances = dict(matches)
+    result = await session.execute(select(Asset).where(Asset.id.in_(distances)))
+    assets = sorted(result.scalars().all(), key=lambda asset: distances[asset.id])
+    
+    return [{"asset": asset, "distance_km": distances[asset.id]} for asset in assets]
+
+
+@router.get("/assets/{asset_id}/track", response_model=AssetTrackResponse)
+async def get_asset_track(
+    asset_id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_points: int = Query(default=500, ge=2, le=10000),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get an asset's position history, simplified to a point budget.
+    
+    The window defaults to the 24 hours before ``end`` (or now).
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(hours=24)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
     
-    # Filter by distance (simplified calculation)
-    nearby = []
-    for asset in assets:
-        if asset.lat and asset.lon:
-            # Simple Euclidean distance approximation
-            lat_diff = abs(asset.lat - lat)
-            lon_diff = abs(asset.lon - lon)
-            distance = (lat_diff ** 2 + lon_diff ** 2) ** 0.5 * 111  # Approx km
-            
-            if distance <= radius_km:
-                nearby.append(asset)
+    result = await session.execute(
+        select(AssetPosition.lat, AssetPosition.lon, AssetPosition.recorded_at)
+        .where(
+            AssetPosition.asset_id == asset_id,
+            AssetPosition.recorded_at >= start,
+            AssetPosition.recorded_at <= end,
+        )
+        .order_by(AssetPosition.recorded_at, AssetPosition.id)
+    )
+    rows = result.all()
+    
+    lats = np.fromiter((row.lat for row in rows), dtype=np.float64, count=len(rows))
+    lons = np.fromiter((row.lon for row in rows), dtype=np.float64, count=len(rows))
+    keep = simplify_track(lats, lons, max_points)
     
-    return nearby
+    return {
+        "asset_id": asset_id,
+        "start": start,
+        "end": end,
+        "total_points": len(rows),
+        "points": [
+            {"lat": rows[i].lat, "lon": rows[i].lon, "recorded_at": rows[i].recorded_at}
+            for i in keep
+        ],
+    }
+
+
+# Tiles endpoints
+@router.get("/tiles/assets/{z}/{x}/{y}", response_class=Response)
+async def get_asset_tile(
+    request: Request,
+    z: int = Path(..., ge=0, le=MAX_TILE_ZOOM),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get a packed binary tile of asset positions, status and side."""
+    if x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range for zoom level")
+    
+    # The index must be live so moves can invalidate cached tiles
+    await asset_index.ensure_loaded(session)
+    key = (z, x, y)
+    entry = tile_cache.get(key)
+    if entry is None:
+        version = tile_cache.version
+        min_lat, min_lon, max_lat, max_lon = tile_bounds(z, x, y)
+        result = await session.execute(
+            select(Asset.id, Asset.lat, Asset.lon, Asset.status, Asset.is_friendly).where(
+                Asset.is_active.isnot(False),
+                Asset.lat >= min_lat,
+                Asset.lat < max_lat,
+                Asset.lon >= min_lon,
+                Asset.lon < max_lon,
+            )
+        )
+        entry = tile_cache.put(key, pack_tile(result.all()), version)
+    
+    payload, etag = entry
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/octet-stream", headers={"ETag": etag})
+
+
+# Threats endpoints
+@router.get("/threats", response_model=ThreatListResponse)
+async def list_threats(
+    limit: int = Query(default=100, ge=1, le=LIST_MAX_LIMIT),
+    min_score: float = Query(default=0.0, ge=0),
+    session: AsyncSession = Depends(get_session),
+):
+    """List enemy assets by threat score, highest first.
+    
+    Only enemies whose inputs changed since the last read are rescored.
+    """
+    await asset_index.ensure_loaded(session)
+    rescored = await threat_scores.refresh()
+    ranked = threat_scores.ranked()
+    if min_score > 0:
+        ranked = [item for item in ranked if item[1].score >= min_score]
+    
+    threats = []
+    for asset_id, threat in ranked[:limit]:
+        entry = asset_index.assets.get(asset_id)
+        if entry is None:
+            continue
+        threats.append({
+            "asset_id": asset_id,
+            "asset_type": entry.asset_type,
+            "status": entry.status,
+            "lat": entry.lat,
+            "lon": entry.lon,
+            "score": round(threat.score, 3),
+            "speed_kmh": round(threat.speed_kmh, 3),
+            "nearest_friendly_id": threat.nearest_friendly_id,
+            "nearest_friendly_km": threat.nearest_friendly_km,
+        })
+    return FastJSONResponse({"threats": threats, "total": len(ranked), "rescored": rescored})
 
 
 # Engagements endpoints
@@ -145,34 +581,44 @@ async def list_engagements(
     status: str = None,
     friendly_id: str = None,
     enemy_id: str = None,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     offset: int = 0,
+    expand: Optional[str] = Query(default=None, pattern=EXPAND_PATTERN, description="friendly, enemy or both, comma-separated"),
+    filters: List[str] = Query(default=[], alias="filter", description="JSON field filter such as details.priority=high; repeatable"),
 ):
-    """List all engagements."""
-    stmt = select(Engagement)
+    """List all engagements, newest first, optionally with their assets embedded."""
+    criteria = []
     
     if status:
-        stmt = stmt.where(Engagement.status == status)
+        criteria.append(Engagement.status == status)
     if friendly_id:
-        stmt = stmt.where(Engagement.friendly_id == friendly_id)
+        criteria.append(Engagement.friendly_id == friendly_id)
     if enemy_id:
-        stmt = stmt.where(Engagement.enemy_id == enemy_id)
+        criteria.append(Engagement.enemy_id == enemy_id)
+    criteria.extend(_json_filters(filters, {"details": Engagement.details}))
     
-    result = await session.execute(stmt.offset(offset).limit(limit))
-    engagements = result.scalars().all()
+    engagements, next_cursor = await _fetch_page(
+        session, select(Engagement.__table__).where(*criteria), Engagement, cursor, limit, offset
+    )
+    total = await count_cache.count(session, Engagement, (status, friendly_id, enemy_id, tuple(filters)), *criteria)
+    engagements = await _expand_engagements(session, engagements, expand)
     
-    return {"engagements": engagements, "total": len(engagements)}
+    return FastJSONResponse({"engagements": engagements, "total": total, "next_cursor": next_cursor})
 
 
-@router.get("/engagements/{engagement_id}", response_model=EngagementResponse)
+@router.get("/engagements/{engagement_id}", response_model=EngagementExpandedResponse)
 async def get_engagement(
     engagement_id: str,
+    expand: Optional[str] = Query(default=None, pattern=EXPAND_PATTERN, description="friendly, enemy or both, comma-separated"),
     session: AsyncSession = Depends(get_session),
 ):
-    """Get engagement by ID."""
-    engagement = await session.get(Engagement, engagement_id)
+    """Get engagement by ID, optionally with its assets embedded."""
+    engagement = await _get_cached(session, Engagement, EngagementResponse, engagement_id)
     if not engagement:
         raise HTTPException(status_code=404, detail="Engagement not found")
+    if expand:
+        return (await _expand_engagements(session, [engagement.model_dump()], expand))[0]
     return engagement
 
 
@@ -186,9 +632,88 @@ async def create_engagement(
     session.add(db_engagement)
     await session.commit()
     await session.refresh(db_engagement)
+    _cache_entity(db_engagement, EngagementResponse)
+    change_feed.publish(engagement_messages("created", db_engagement))
     return db_engagement
 
 
+@router.post("/engagements/assign", response_model=AssignmentResponse)
+async def assign_engagements(
+    request: AssignmentRequest,
+    session: AsyncSession = Depends(get_session),
+):
+    """Pair friendlies with enemies to engage the most targets at the shortest range.
+    
+    Optionally inserts a pending engagement for every pair in one statement.
+    """
+    await asset_index.ensure_loaded(session)
+    busy = set()
+    if request.exclude_engaged:
+        result = await session.execute(
+            select(Engagement.friendly_id, Engagement.enemy_id).where(Engagement.status.in_(LIVE_STATUSES))
+        )
+        for friendly_id, enemy_id in result:
+            busy.update((friendly_id, enemy_id))
+    
+    friendlies, enemies = [], []
+    for asset_id, entry in asset_index.assets.items():
+        if asset_id in busy:
+            continue
+        if not entry.is_friendly:
+            enemies.append((asset_id, entry.lat, entry.lon))
+        elif entry.status == request.friendly_status:
+            friendlies.append((asset_id, entry.lat, entry.lon))
+    if len(friendlies) * len(enemies) > ASSIGNMENT_MAX_PAIRS:
+        raise HTTPException(status_code=400, detail="Too many friendly/enemy pairs for one assignment run")
+    
+    def solve():
+        friendly_pos = np.array([(lat, lon) for _, lat, lon in friendlies], dtype=np.float64).reshape(-1, 2)
+        enemy_pos = np.array([(lat, lon) for _, lat, lon in enemies], dtype=np.float64).reshape(-1, 2)
+        distances = distance_matrix_km(friendly_pos[:, 0], friendly_pos[:, 1], enemy_pos[:, 0], enemy_pos[:, 1])
+        rows, cols = solve_assignment(distances, request.max_range_km)
+        return rows, cols, distances[rows, cols]
+    
+    # The solver is CPU-bound; keep it off the event loop
+    rows, cols, pair_distances = await asyncio.to_thread(solve)
+    assignments = [
+        {"friendly_id": friendlies[row][0], "enemy_id": enemies[col][0], "distance_km": float(distance)}
+        for row, col, distance in zip(rows, cols, pair_distances)
+    ]
+    
+    if request.create_engagements and assignments:
+        for pair in assignments:
+            pair["engagement_id"] = uuid4()
+        await session.execute(insert(Engagement.__table__), [
+            {
+                "id": pair["engagement_id"],
+                "name": f"Engagement-{str(pair['friendly_id'])[:8]}-to-{str(pair['enemy_id'])[:8]}",
+                "friendly_id": pair["friendly_id"],
+                "enemy_id": pair["enemy_id"],
+                "status": "pending",
+                "progress": 0,
+                "details": {"assignment": {"distance_km": round(pair["distance_km"], 3)}},
+            }
+            for pair in assignments
+        ])
+        await session.commit()
+        count_cache.invalidate(Engagement)
+        for pair in assignments:
+            change_feed.publish(engagement_messages("created", {
+                "id": pair["engagement_id"],
+                "status": "pending",
+                "progress": 0,
+                "friendly_id": pair["friendly_id"],
+                "enemy_id": pair["enemy_id"],
+            }))
+    
+    return {
+        "assignments": assignments,
+        "total_distance_km": float(pair_distances.sum()),
+        "unassigned_friendlies": len(friendlies) - len(assignments),
+        "unassigned_enemies": len(enemies) - len(assignments),
+    }
+
+
 @router.put("/engagements/{engagement_id}", response_model=EngagementResponse)
 async def update_engagement(
     engagement_id: str,
@@ -206,6 +731,8 @@ async def update_engagement(
     
     await session.commit()
     await session.refresh(db_engagement)
+    _cache_entity(db_engagement, EngagementResponse)
+    change_feed.publish(engagement_messages("updated", db_engagement))
     return db_engagement
 
 
@@ -220,29 +747,104 @@ async def delete_engagement(
         raise HTTPException(status_code=404, detail="Engagement not found")
     
     await session.delete(engagement)
+    session.add(Tombstone(entity_type="engagement", entity_id=engagement.id))
     await session.commit()
+    entity_cache.invalidate(Engagement.__tablename__, engagement.id)
+    change_feed.publish(engagement_messages("deleted", engagement))
     return None
 
 
 # Engagement actions endpoints
+async def _transition_engagement(session: AsyncSession, engagement_id: str, action: str) -> EngagementResponse:
+    """Apply an engagement state transition in one statement and commit it."""
+    try:
+        key = UUID(str(engagement_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Engagement not found")
+    
+    result = await apply_transition(session, key, action)
+    if not result.found:
+        raise HTTPException(status_code=404, detail="Engagement not found")
+    if not result.applied:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{TRANSITIONS[action].error} (current status: {result.previous_status})",
+        )
+    
+    await session.commit()
+    response = _cache_entity(result.engagement, EngagementResponse, Engagement.__tablename__)
+    change_feed.publish(engagement_messages("updated", response))
+    return response
+
+
+@router.post("/engagements/actions", response_model=EngagementActionBatchResponse)
+async def batch_engagement_actions(
+    batch: EngagementActionBatch,
+    session: AsyncSession = Depends(get_session),
+):
+    """Apply many engagement actions in one transaction.
+    
+    Each round issues one statement per action type; when an engagement
+    appears more than once its actions run in request order, one per round.
+    Illegal actions are reported per item and do not block the others.
+    """
+    rounds: List[Dict[str, List[int]]] = []
+    occurrences: Dict[UUID, int] = {}
+    for position, item in enumerate(batch.actions):
+        round_index = occurrences.get(item.engagement_id, 0)
+        occurrences[item.engagement_id] = round_index + 1
+        if round_index == len(rounds):
+            rounds.append({})
+        rounds[round_index].setdefault(item.action.replace("-", "_"), []).append(position)
+    
+    results: List[Optional[EngagementActionResult]] = [None] * len(batch.actions)
+    for actions in rounds:
+        for action, positions in actions.items():
+            outcomes = await apply_transitions(
+                session, [batch.actions[position].engagement_id for position in positions], action
+            )
+            for position in positions:
+                item = batch.actions[position]
+                outcome = outcomes[item.engagement_id]
+                if outcome.applied:
+                    results[position] = EngagementActionResult(
+                        engagement_id=item.engagement_id,
+                        action=item.action,
+                        result="applied",
+                        previous_status=outcome.previous_status,
+                        engagement=EngagementResponse.model_validate(outcome.engagement),
+                    )
+                elif outcome.found:
+                    results[position] = EngagementActionResult(
+                        engagement_id=item.engagement_id,
+                        action=item.action,
+                        result="invalid_transition",
+                        previous_status=outcome.previous_status,
+                        detail=TRANSITIONS[action].error,
+                    )
+                else:
+                    results[position] = EngagementActionResult(
+                        engagement_id=item.engagement_id,
+                        action=item.action,
+                        result="not_found",
+                        detail="Engagement not found",
+                    )
+    
+    await session.commit()
+    applied = [result for result in results if result.result == "applied"]
+    for result in applied:
+        entity_cache.put(Engagement.__tablename__, result.engagement_id, result.engagement)
+        change_feed.publish(engagement_messages("updated", result.engagement))
+    return EngagementActionBatchResponse(results=results, applied=len(applied), failed=len(results) - len(applied))
+
+
 @router.post("/engagements/{engagement_id}/confirm", response_model=EngagementResponse)
 async def confirm_engagement(
     engagement_id: str,
     session: AsyncSession = Depends(get_session),
 ):
     """Confirm an engagement."""
-    engagement = await session.get(Engagement, engagement_id)
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
-    
-    if engagement.status != "pending":
-        raise HTTPException(status_code=400, detail="Engagement must be in pending status")
-    
-    engagement.status = "active"
-    engagement.progress = 0
-    await session.commit()
-    await session.refresh(engagement)
-    return engagement
+    return await _transition_engagement(session, engagement_id, "confirm")
 
 
 @router.post("/engagements/{engagement_id}/abort", response_model=EngagementResponse)
@@ -251,17 +853,7 @@ async def abort_engagement(
     session: AsyncSession = Depends(get_session),
 ):
     """Abort an engagement."""
-    engagement = await session.get(Engagement, engagement_id)
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
-    
-    if engagement.status not in ["pending", "active"]:
-        raise HTTPException(status_code=400, detail="Engagement must be in pending or active status")
-    
-    engagement.status = "cancelled"
-    await session.commit()
-    await session.refresh(engagement)
-    return engagement
+    return await _transition_engagement(session, engagement_id, "abort")
 
 
 @router.post("/engagements/{engagement_id}/engage", response_model=EngagementResponse)
@@ -270,17 +862,7 @@ async def engage_target(
     session: AsyncSession = Depends(get_session),
 ):
     """Start engagement (missile launch)."""
-    engagement = await session.get(Engagement, engagement_id)
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
-    
-    if engagement.status != "active":
-        raise HTTPException(status_code=400, detail="Engagement must be confirmed before engaging")
-    
-    engagement.status = "engaging"
-    await session.commit()
-    await session.refresh(engagement)
-    return engagement
+    return await _transition_engagement(session, engagement_id, "engage")
 
 
 @router.post("/engagements/{engagement_id}/complete", response_model=EngagementResponse)
@@ -289,18 +871,7 @@ async def complete_engagement(
     session: AsyncSession = Depends(get_session),
 ):
     """Mark engagement as complete."""
-    engagement = await session.get(Engagement, engagement_id)
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
-    
-    if engagement.status != "engaging":
-        raise HTTPException(status_code=400, detail="Engagement must be engaging to be completed")
-    
-    engagement.status = "completed"
-    engagement.progress = 100
-    await session.commit()
-    await session.refresh(engagement)
-    return engagement
+    return await _transition_engagement(session, engagement_id, "complete")
 
 
 @router.post("/engagements/{engagement_id}/missile-launch", response_model=EngagementResponse)
@@ -309,19 +880,7 @@ async def launch_missile(
     session: AsyncSession = Depends(get_session),
 ):
     """Simulate missile launch."""
-    engagement = await session.get(Engagement, engagement_id)
-    if not engagement:
-        raise HTTPException(status_code=404, detail="Engagement not found")
-    
-    if engagement.status != "engaging":
-        raise HTTPException(status_code=400, detail="Engagement must be in engaging status")
-    
-    # Update status to reflect missile in flight
-    engagement.status = "missile_in_flight"
-    engagement.progress = 0
-    await session.commit()
-    await session.refresh(engagement)
-    return engagement
+    return await _transition_engagement(session, engagement_id, "missile_launch")
 
 
 # Events endpoints
@@ -330,55 +889,171 @@ async def list_events(
     session: AsyncSession = Depends(get_session),
     event_type: str = None,
     severity: str = None,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     offset: int = 0,
+    filters: List[str] = Query(default=[], alias="filter", description="JSON field filter such as details.threshold_exceeded=battery; repeatable"),
+):
+    """List all events, newest first.
+    
+    The total and the cursor for the next page are returned in the
+    ``X-Total-Count`` and ``X-Next-Cursor`` headers.
+    """
+    criteria = []
+    
+    if event_type:
+        criteria.append(Event.event_type == event_type)
+    if severity:
+        criteria.append(Event.severity == severity)
+    criteria.extend(_json_filters(filters, {"details": Event.details}))
+    
+    # Paging on the partition key lets newest-first pages stop in the newest partitions
+    events, next_cursor = await _fetch_page(
+        session, select(Event.__table__).where(*criteria), Event, cursor, limit, offset, column=Event.timestamp
+    )
+    total = await count_cache.count(session, Event, (event_type, severity, tuple(filters)), *criteria)
+    return FastJSONResponse(events, headers=_page_headers(total, next_cursor))
+
+
+@router.get("/events/stats", response_model=EventStatsResponse)
+async def event_stats(
+    bucket: str = Query(default="1m", pattern="^(1m|1h)$"),
+    group_by: Optional[str] = Query(
+        default=None,
+        pattern="^(event_type|severity|asset_id)(,(event_type|severity|asset_id))*$",
+        description="Comma-separated grouping columns; omit for totals per bucket",
+    ),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    event_type: Optional[str] = None,
+    severity: Optional[str] = None,
+    asset_id: Optional[UUID] = None,
+    session: AsyncSession = Depends(get_session),
 ):
-    """List all events."""
-    query = session.query(Event)
+    """Get time-bucketed event counts from the incrementally maintained rollups.
+    
+    Defaults to the last hour by minute or the last day by hour. Buckets
+    with no events are omitted.
+    """
+    width = STATS_BUCKETS[bucket]
+    # Rollup buckets are naive UTC, like every stored timestamp
+    start, end = naive_utc(start), naive_utc(end)
+    end = end or datetime.utcnow()
+    start = start or end - width * STATS_DEFAULT_BUCKETS[bucket]
+    # Align to bucket boundaries so the first and last buckets are complete
+    start = datetime.min + (start - datetime.min) // width * width
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if (end - start) / width > STATS_MAX_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"At most {STATS_MAX_BUCKETS} buckets per request")
     
+    columns = [name for name in GROUP_BY_COLUMNS if group_by and name in group_by.split(",")]
+    result = await session.execute(
+        stats_query(bucket, columns, start, end, event_type=event_type, severity=severity, asset_id=asset_id)
+    )
+    return FastJSONResponse({
+        "bucket": bucket,
+        "start": start,
+        "end": end,
+        "group_by": columns,
+        "series": rows_to_dicts(result),
+    })
+
+
+@router.get("/events/export")
+async def export_events(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    event_type: Optional[str] = None,
+    severity: Optional[str] = None,
+    asset_id: Optional[UUID] = None,
+    engagement_id: Optional[UUID] = None,
+):
+    """Stream events as NDJSON in timestamp order, in constant memory."""
+    # Bind errors would surface mid-stream, after the 200 has been sent
+    start, end = naive_utc(start), naive_utc(end)
+    stmt = select(Event.__table__)
+    if start:
+        stmt = stmt.where(Event.timestamp >= start)
+    if end:
+        stmt = stmt.where(Event.timestamp < end)
     if event_type:
-        query = query.filter(Event.event_type == event_type)
+        stmt = stmt.where(Event.event_type == event_type)
     if severity:
-        query = query.filter(Event.severity == severity)
+        stmt = stmt.where(Event.severity == severity)
+    if asset_id:
+        stmt = stmt.where(Event.asset_id == asset_id)
+    if engagement_id:
+        stmt = stmt.where(Event.engagement_id == engagement_id)
     
-    events = await session.execute(query.offset(offset).limit(limit))
-    return events.scalars().all()
+    return StreamingResponse(
+        stream_ndjson(stmt.order_by(Event.timestamp, Event.id)),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get("/events/asset/{asset_id}", response_model=List[EventResponse])
 async def get_asset_events(
     asset_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get events for an asset."""
-    events = await session.execute(
-        session.query(Event).filter(Event.asset_id == asset_id)
+    """Get events for an asset, newest first."""
+    events, next_cursor = await _fetch_page(
+        session, select(Event.__table__).where(Event.asset_id == asset_id), Event, cursor, limit, column=Event.timestamp
     )
-    return events.scalars().all()
+    return FastJSONResponse(events, headers=_page_headers(None, next_cursor))
 
 
 @router.get("/events/engagement/{engagement_id}", response_model=List[EventResponse])
 async def get_engagement_events(
     engagement_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get events for an engagement."""
-    events = await session.execute(
-        session.query(Event).filter(Event.engagement_id == engagement_id)
+    """Get events for an engagement, newest first."""
+    events, next_cursor = await _fetch_page(
+        session, select(Event.__table__).where(Event.engagement_id == engagement_id), Event, cursor, limit,
+        column=Event.timestamp,
     )
-    return events.scalars().all()
+    return FastJSONResponse(events, headers=_page_headers(None, next_cursor))
+
+
+@router.get("/events/buffer")
+async def event_buffer_stats():
+    """Queue depth and throughput of buffered event ingestion."""
+    return event_buffer.stats()
 
 
 @router.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     event: EventCreate,
+    buffered: Optional[bool] = Query(default=None, description="Acknowledge now and insert in the next batch"),
     session: AsyncSession = Depends(get_session),
 ):
-    """Create a new event."""
+    """Create a new event.
+    
+    Buffered events are answered with 202 and their final ID before they are
+    written; a full buffer answers 429 and an unavailable one 503.
+    """
+    if buffered if buffered is not None else settings.EVENT_BUFFER_ENABLED:
+        now = datetime.utcnow()
+        row = {"id": uuid4(), **event.model_dump(), "timestamp": now}
+        try:
+            event_buffer.submit(row)
+        except EventBufferFull:
+            raise HTTPException(status_code=429, detail="Event buffer is full", headers={"Retry-After": "1"})
+        except EventBufferClosed:
+            raise HTTPException(status_code=503, detail="Event buffer is not accepting events")
+        return FastJSONResponse(row, status_code=status.HTTP_202_ACCEPTED)
+    
     db_event = Event(**event.model_dump())
     session.add(db_event)
     await session.commit()
     await session.refresh(db_event)
+    change_feed.publish(event_messages(db_event))
     return db_event
 
 
@@ -387,41 +1062,90 @@ async def create_event(
 async def list_commands(
     session: AsyncSession = Depends(get_session),
     status: str = None,
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     offset: int = 0,
+    filters: List[str] = Query(default=[], alias="filter", description="JSON field filter such as payload.speed>=10; repeatable"),
 ):
-    """List all commands."""
-    query = session.query(Command)
+    """List all commands, newest first.
+    
+    The total and the cursor for the next page are returned in the
+    ``X-Total-Count`` and ``X-Next-Cursor`` headers.
+    """
+    criteria = []
     
     if status:
-        query = query.filter(Command.status == status)
+        criteria.append(Command.status == status)
+    criteria.extend(_json_filters(filters, {"payload": Command.payload}))
     
-    commands = await session.execute(query.offset(offset).limit(limit))
-    return commands.scalars().all()
+    commands, next_cursor = await _fetch_page(session, select(Command.__table__).where(*criteria), Command, cursor, limit, offset)
+    total = await count_cache.count(session, Command, (status, tuple(filters)), *criteria)
+    return FastJSONResponse(commands, headers=_page_headers(total, next_cursor))
+
+
+@router.get("/commands/export")
+async def export_commands(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    command_type: Optional[str] = None,
+    status: Optional[str] = None,
+    asset_id: Optional[UUID] = None,
+    engagement_id: Optional[UUID] = None,
+):
+    """Stream commands as NDJSON in creation order, in constant memory."""
+    start, end = naive_utc(start), naive_utc(end)
+    stmt = select(Command.__table__)
+    if start:
+        stmt = stmt.where(Command.created_at >= start)
+    if end:
+        stmt = stmt.where(Command.created_at < end)
+    if command_type:
+        stmt = stmt.where(Command.command_type == command_type)
+    if status:
+        stmt = stmt.where(Command.status == status)
+    if asset_id:
+        stmt = stmt.where(Command.asset_id == asset_id)
+    if engagement_id:
+        stmt = stmt.where(Command.engagement_id == engagement_id)
+    
+    return StreamingResponse(
+        stream_ndjson(stmt.order_by(Command.created_at, Command.id)),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/commands/dispatch")
+async def command_dispatch_stats():
+    """Worker state and delivery outcome counters of command dispatch."""
+    return command_dispatcher.stats()
 
 
 @router.get("/commands/asset/{asset_id}", response_model=List[CommandResponse])
 async def get_asset_commands(
     asset_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get commands for an asset."""
-    commands = await session.execute(
-        session.query(Command).filter(Command.asset_id == asset_id)
+    """Get commands for an asset, newest first."""
+    commands, next_cursor = await _fetch_page(
+        session, select(Command.__table__).where(Command.asset_id == asset_id), Command, cursor, limit
     )
-    return commands.scalars().all()
+    return FastJSONResponse(commands, headers=_page_headers(None, next_cursor))
 
 
 @router.get("/commands/engagement/{engagement_id}", response_model=List[CommandResponse])
 async def get_engagement_commands(
     engagement_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
-    """Get commands for an engagement."""
-    commands = await session.execute(
-        session.query(Command).filter(Command.engagement_id == engagement_id)
+    """Get commands for an engagement, newest first."""
+    commands, next_cursor = await _fetch_page(
+        session, select(Command.__table__).where(Command.engagement_id == engagement_id), Command, cursor, limit
     )
-    return commands.scalars().all()
+    return FastJSONResponse(commands, headers=_page_headers(None, next_cursor))
 
 
 @router.post("/commands", response_model=CommandResponse, status_code=status.HTTP_201_CREATED)
@@ -434,6 +1158,9 @@ async def create_command(
     session.add(db_command)
     await session.commit()
     await session.refresh(db_command)
+    _cache_entity(db_command, CommandResponse)
+    change_feed.publish(command_messages("created", db_command))
+    command_dispatcher.notify()
     return db_command
 
 
@@ -443,7 +1170,106 @@ async def get_command(
     session: AsyncSession = Depends(get_session),
 ):
     """Get command by ID."""
-    command = await session.get(Command, command_id)
+    command = await _get_cached(session, Command, CommandResponse, command_id)
     if not command:
         raise HTTPException(status_code=404, detail="Command not found")
     return command
+
+
+# Import endpoints
+@router.post("/import/{kind}", response_model=ImportResult)
+async def bulk_import(
+    request: Request,
+    kind: str = Path(..., pattern="^(assets|events|commands)$"),
+    format: Optional[str] = Query(default=None, pattern="^(csv|ndjson)$", description="Defaults from Content-Type"),
+    session: AsyncSession = Depends(get_session),
+):
+    """Bulk load assets, events or commands from a CSV or NDJSON body.
+    
+    The load is all-or-nothing: if any record is invalid nothing is
+    written and the rejected records are returned with a 422.
+    """
+    fmt = format or detect_format(request.headers.get("content-type"))
+    stream = await spool_body(request.stream())
+    try:
+        result = await import_records(session, kind, read_records(stream, fmt))
+    except ValueError as exc:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail=str(exc))
+    finally:
+        stream.close()
+    
+    if result.errors:
+        await session.rollback()
+        raise HTTPException(status_code=422, detail=result.model_dump()["errors"])
+    
+    await session.commit()
+    count_cache.invalidate(IMPORT_TARGETS[kind].model)
+    if kind == "assets":
+        asset_index.invalidate()
+    return result
+
+
+# Sync endpoints
+@router.get("/sync", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[str] = Query(default=None, description="Watermark from the previous sync, or an ISO timestamp"),
+    limit: int = Query(default=1000, ge=1, le=10000, description="Maximum rows per entity type"),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get everything created, updated or deleted since a watermark.
+    
+    If any entity type has more than ``limit`` changes, ``has_more`` is set
+    and the watermark resumes that type right after the last row returned.
+    """
+    started = datetime.utcnow()
+    sources = {
+        "assets": (Asset, Asset.updated_at, ()),
+        "engagements": (Engagement, Engagement.updated_at, ()),
+        "events": (Event, Event.created_at, ()),
+        "commands": (Command, Command.updated_at, ()),
+        "tombstones": (Tombstone, Tombstone.deleted_at, (Tombstone.entity_type == "engagement",)),
+    }
+    positions = {}
+    if since is not None:
+        try:
+            positions = decode_watermark(since, list(sources))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid watermark")
+    
+    changes = {}
+    next_positions = {}
+    has_more = False
+    for name, (model, column, criteria) in sources.items():
+        stmt = select(model).where(*criteria)
+        if name in positions:
+            position, last_id = positions[name]
+            if last_id is None:
+                stmt = stmt.where(column >= position)
+            else:
+                stmt = stmt.where(tuple_(column, model.id) > tuple_(position, last_id))
+        result = await session.execute(stmt.order_by(column, model.id).limit(limit + 1))
+        rows = result.scalars().all()
+        
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+            last = rows[-1]
+            next_positions[name] = (getattr(last, column.key), last.id)
+        else:
+            next_positions[name] = (started - SYNC_OVERLAP, None)
+        changes[name] = rows
+    
+    assets = changes["assets"]
+    return {
+        "watermark": encode_watermark(next_positions),
+        "has_more": has_more,
+        "assets": [asset for asset in assets if asset.is_active is not False],
+        "engagements": changes["engagements"],
+        "events": changes["events"],
+        "commands": changes["commands"],
+        "deleted": {
+            "assets": [asset.id for asset in assets if asset.is_active is False],
+            "engagements": [tombstone.entity_id for tombstone in changes["tombstones"]],
+        },
+    }
@@ -28,6 +28,14 @@ class ConnectionManager:
         if channel in self.active_connections:
             self.active_connections[channel].discard(websocket)
 
+    def subscribe(self, websocket: WebSocket, channel: str):
+        """Add an accepted connection to another channel."""
+        self.active_connections.setdefault(channel, set()).add(websocket)
+
+    def is_subscribed(self, channel: str) -> bool:
+        """Whether any connection is listening on a channel."""
+        return bool(self.active_connections.get(channel))
+
     async def send_to_channel(self, channel: str, message: dict):
         """Send message to all connections in a channel."""
         if channel in self.active_connections:
@@ -74,6 +82,41 @@ async def all_updates_websocket(websocket: WebSocket):
         manager.disconnect(websocket, "all")
 
 
+@router.websocket("/topics")
+async def topics_websocket(websocket: WebSocket, channels: str = ""):
+    """WebSocket for change messages on topic channels.
+
+    Channels such as ``asset:{id}``, ``engagement:{id}`` or ``events:critical``
+    can be given comma separated in the query string, or changed later by
+    sending ``{"action": "subscribe" | "unsubscribe", "channel": ...}``.
+    """
+    await websocket.accept()
+    subscribed = set()
+    for channel in filter(None, (name.strip() for name in channels.split(","))):
+        manager.subscribe(websocket, channel)
+        subscribed.add(channel)
+
+    try:
+        while True:
+            try:
+                request = json.loads(await websocket.receive_text())
+                action, channel = request["action"], str(request["channel"])
+            except (ValueError, TypeError, KeyError):
+                await websocket.send_text(json.dumps({"type": "error", "detail": "Expected {action, channel}"}))
+                continue
+            if action == "subscribe":
+                manager.subscribe(websocket, channel)
+                subscribed.add(channel)
+            elif action == "unsubscribe":
+                manager.disconnect(websocket, channel)
+                subscribed.discard(channel)
+            await websocket.send_text(json.dumps({"type": "subscriptions", "channels": sorted(subscribed)}))
+
+    except WebSocketDisconnect:
+        for channel in subscribed:
+            manager.disconnect(websocket, channel)
+
+
 @router.get("/broadcast")
 async def broadcast_message(message: dict):
     """Broadcast message to all connections."""
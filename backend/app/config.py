@@ -28,6 +28,41 @@ class Settings(BaseSettings):
         """Build database URL."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    # Seconds between server-side engagement progress ticks
+    ENGAGEMENT_TICK_SECONDS: float = 0.5
+
+    # Write-behind event ingestion; POST /events?buffered=true overrides the default
+    EVENT_BUFFER_ENABLED: bool = False
+    EVENT_BUFFER_MAX_SIZE: int = 50_000
+    EVENT_BUFFER_BATCH_SIZE: int = 1000
+    EVENT_BUFFER_FLUSH_SECONDS: float = 0.25
+    EVENT_BUFFER_SHUTDOWN_SECONDS: float = 10.0
+
+    # Events partitioning: partition width (1 = daily, 7 = weekly), days of
+    # partitions created ahead, and days kept before rolling up (0 keeps all)
+    EVENT_PARTITION_DAYS: int = 1
+    EVENT_PARTITIONS_AHEAD_DAYS: int = 7
+    EVENT_RETENTION_DAYS: int = 30
+    EVENT_MAINTENANCE_SECONDS: float = 3600.0
+
+    # Days of per-minute event counts kept for /events/stats?bucket=1m
+    EVENT_MINUTE_ROLLUP_DAYS: int = 2
+
+    # Command dispatch: worker tasks, commands claimed per batch, idle poll
+    # interval, per-delivery timeout and the (longer) claim lease, and
+    # retries with exponential backoff before a command is marked failed.
+    # Off by default: enabling it without a real transport uses the in-process
+    # LocalTransport stub, which acknowledges commands without delivering them
+    COMMAND_DISPATCH_ENABLED: bool = False
+    COMMAND_DISPATCH_WORKERS: int = 4
+    COMMAND_DISPATCH_BATCH_SIZE: int = 50
+    COMMAND_DISPATCH_POLL_SECONDS: float = 1.0
+    COMMAND_DELIVERY_TIMEOUT_SECONDS: float = 10.0
+    COMMAND_LEASE_SECONDS: float = 60.0
+    COMMAND_MAX_ATTEMPTS: int = 5
+    COMMAND_RETRY_BASE_SECONDS: float = 1.0
+    COMMAND_RETRY_MAX_SECONDS: float = 300.0
+
     # CORS settings - accept comma-separated string or JSON array
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
 
@@ -11,8 +11,14 @@ from sqlalchemy import select
 
 from app.config import settings
 from app.api.v1 import router as v1_router
-from app.api.websocket import router as websocket_router
+from app.api.websocket import router as websocket_router, manager
 from app.database import get_session
+from app.services.change_feed import change_feed
+from app.services.command_dispatch import LocalTransport, command_dispatcher
+from app.services.engagement_engine import engagement_engine
+from app.services.entity_cache import entity_cache
+from app.services.event_buffer import event_buffer
+from app.services.event_partitions import event_partitions
 from app.models.devices import Device
 from app.models.locations import Location
 from app.utils.data_generator import generate_simulated_device, generate_simulated_location
@@ -74,6 +80,24 @@ async def on_startup():
                 await session.commit()
     except Exception:
         pass  # Silently fail if database is not ready
+    
+    change_feed.start(send=manager.send_to_channel, is_subscribed=manager.is_subscribed)
+    engagement_engine.start(broadcast=lambda frame: manager.send_to_channel("all", frame))
+    event_buffer.start()
+    event_partitions.start()
+    if settings.COMMAND_DISPATCH_ENABLED:
+        # Simulation only; a deployment passes its real CommandTransport here
+        command_dispatcher.start(LocalTransport())
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Stop background tasks, writing out buffered events first."""
+    await event_buffer.stop()
+    await engagement_engine.stop()
+    await event_partitions.stop()
+    await command_dispatcher.stop()
+    await change_feed.stop()
 
 
 # Include routers
@@ -87,6 +111,12 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.get("/cache/stats", tags=["System"])
+async def cache_stats():
+    """Entity cache hit rate and eviction counters."""
+    return entity_cache.stats()
+
+
 @app.get("/", tags=["System"])
 async def root():
     """Root endpoint with API information."""
@@ -5,6 +5,9 @@ Models package for GeoMap Simulation.
 from app.models.asset import Asset
 from app.models.engagement import Engagement
 from app.models.event import Event
+from app.models.event_rollup import EventMinuteRollup, EventRollup
 from app.models.command import Command
+from app.models.asset_position import AssetPosition
+from app.models.tombstone import Tombstone
 
-__all__ = ["Asset", "Engagement", "Event", "Command"]
+__all__ = ["Asset", "Engagement", "Event", "EventRollup", "EventMinuteRollup", "Command", "AssetPosition", "Tombstone"]
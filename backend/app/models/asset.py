@@ -4,11 +4,15 @@ Represents friendly and enemy assets in the geospatial simulation system.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, Enum, JSON, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, Enum, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 import uuid
 from app.database import Base
+from app.utils.json_filter import json_number
+
+# extra_data keys that always hold numbers and have a range index
+EXTRA_DATA_NUMERIC_KEYS = ("battery_level", "signal_strength")
 
 
 class Asset(Base):
@@ -23,13 +27,20 @@ class Asset(Base):
     lat = Column(Float, nullable=True)  # LA/San Diego area
     lon = Column(Float, nullable=True)
     last_seen = Column(DateTime, default=datetime.utcnow)
-    extra_data = Column(JSON, default=dict)
+    extra_data = Column(JSONB, default=dict)
     zone = Column(String(50), nullable=True)  # LA, San Diego, etc.
     is_active = Column(Boolean, default=True)
     is_friendly = Column(Boolean, default=True)  # True for friendly, False for enemy
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Range filters on EXTRA_DATA_NUMERIC_KEYS (see app/utils/json_filter.py)
+        Index("idx_assets_battery_level", json_number(extra_data, "battery_level")),
+        Index("idx_assets_signal_strength", json_number(extra_data, "signal_strength")),
+        Index("idx_assets_extra_data", "extra_data", postgresql_using="gin", postgresql_ops={"extra_data": "jsonb_path_ops"}),
+    )
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -0,0 +1,35 @@
+"""
+Asset position history model for GeoMap Simulation API.
+Append-only record of asset positions used for track playback.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Float, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class AssetPosition(Base):
+    """Position sample of an asset at a point in time."""
+
+    __tablename__ = "asset_positions"
+
+    # No foreign key so high-rate inserts skip the referential check
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    asset_id = Column(UUID(as_uuid=True), nullable=False)
+    lat = Column(Float, nullable=False)
+    lon = Column(Float, nullable=False)
+    recorded_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_asset_positions_asset_time", "asset_id", "recorded_at"),
+    )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "asset_id": str(self.asset_id),
+            "lat": self.lat,
+            "lon": self.lon,
+            "recorded_at": self.recorded_at.isoformat() if self.recorded_at else None,
+        }
@@ -4,8 +4,8 @@ Tracks commands sent to assets.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 from app.database import Base
 
@@ -19,14 +19,23 @@ class Command(Base):
     asset_id = Column(UUID(as_uuid=True), ForeignKey("assets.id"), nullable=True)
     engagement_id = Column(UUID(as_uuid=True), ForeignKey("engagements.id"), nullable=True)
     command_type = Column(String(50), nullable=False)  # patrol, survey, return, stop, resume, engage, disengage
-    payload = Column(JSON, default=dict)
+    payload = Column(JSONB, default=dict)
     status = Column(String(20), nullable=False, default="pending")  # pending, sent, acknowledged, failed
     error_message = Column(String(255), nullable=True)
     acknowledged_at = Column(DateTime, nullable=True)
     failed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")  # delivery attempts so far
+    next_attempt_at = Column(DateTime, nullable=True)  # pending: retry time; claimed: lease expiry
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Dispatch workers scan only pending commands, oldest first
+        Index("idx_commands_dispatch", "created_at", postgresql_where=text("status = 'pending'")),
+        Index("idx_commands_payload", "payload", postgresql_using="gin", postgresql_ops={"payload": "jsonb_path_ops"}),
+    )
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -39,6 +48,8 @@ class Command(Base):
             "error_message": self.error_message,
             "acknowledged_at": self.acknowledged_at.isoformat() if self.acknowledged_at else None,
             "failed_at": self.failed_at.isoformat() if self.failed_at else None,
+            "sent_at": self.sent_at.isoformat() if self.sent_at else None,
+            "attempts": self.attempts,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
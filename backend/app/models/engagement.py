@@ -4,8 +4,8 @@ Tracks friendly-enemy interactions and missile engagements.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 import uuid
 from app.database import Base
@@ -23,14 +23,18 @@ class Engagement(Base):
     status = Column(String(20), nullable=False, default="pending")  # pending, active, completed, cancelled
     progress = Column(Float, default=0)  # 0-100%
     estimated_completion = Column(DateTime, nullable=True)
-    details = Column(JSON, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    details = Column(JSONB, default=dict)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     friendly = relationship("Asset", foreign_keys=[friendly_id], backref="friendly_engagements")
     enemy = relationship("Asset", foreign_keys=[enemy_id], backref="enemy_engagements")
 
+    __table_args__ = (
+        Index("idx_engagements_details", "details", postgresql_using="gin", postgresql_ops={"details": "jsonb_path_ops"}),
+    )
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
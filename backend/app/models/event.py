@@ -1,11 +1,13 @@
 """
 Event model for GeoMap Simulation API.
 Tracks system events and engagement events.
+The table is range partitioned by day on ``timestamp``; see
+app/services/event_partitions.py for partition upkeep and retention.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 from app.database import Base
 
@@ -15,15 +17,26 @@ class Event(Base):
 
     __tablename__ = "events"
 
+    # The partition key must be part of the primary key; the ORM still
+    # identifies events by id alone
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     asset_id = Column(UUID(as_uuid=True), ForeignKey("assets.id"), nullable=True)
     engagement_id = Column(UUID(as_uuid=True), ForeignKey("engagements.id"), nullable=True)
     event_type = Column(String(50), nullable=False)  # alert, status_change, command_ack, engagement_start, engagement_end
-    details = Column(JSON, default=dict)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    details = Column(JSONB, default=dict)
+    timestamp = Column(DateTime, primary_key=True, nullable=False, default=datetime.utcnow)
     severity = Column(String(20), nullable=True)  # info, warning, critical
     resolved = Column(String(20), default="pending")  # pending, resolved, ignored
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_events_asset", "asset_id", "timestamp"),
+        Index("idx_events_engagement", "engagement_id", "timestamp"),
+        Index("idx_events_timestamp", "timestamp", "id"),
+        Index("idx_events_details", "details", postgresql_using="gin", postgresql_ops={"details": "jsonb_path_ops"}),
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
+    __mapper_args__ = {"primary_key": [id]}
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -0,0 +1,46 @@
+"""
+Event rollup models for GeoMap Simulation API.
+Per-minute and per-hour event counts, maintained by an insert trigger on
+events so aggregate reads never scan raw events. Minute counts are trimmed
+with event retention; hourly counts are kept after partitions are dropped.
+"""
+
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+# Stored instead of NULL, which primary key columns cannot hold
+NO_SEVERITY = ""
+NO_ASSET = "00000000-0000-0000-0000-000000000000"
+
+
+class _EventCounts:
+    """Columns shared by every rollup granularity."""
+
+    bucket = Column(DateTime, primary_key=True)  # start of the minute or hour
+    event_type = Column(String(50), primary_key=True)
+    severity = Column(String(20), primary_key=True, default=NO_SEVERITY)
+    asset_id = Column(UUID(as_uuid=True), primary_key=True, default=NO_ASSET)
+    event_count = Column(BigInteger, nullable=False, default=0)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "bucket": self.bucket.isoformat() if self.bucket else None,
+            "event_type": self.event_type,
+            "severity": self.severity or None,
+            "asset_id": str(self.asset_id) if self.asset_id and str(self.asset_id) != NO_ASSET else None,
+            "event_count": self.event_count,
+        }
+
+
+class EventMinuteRollup(_EventCounts, Base):
+    """Number of events of one type, severity and asset within a minute."""
+
+    __tablename__ = "event_rollups_minute"
+
+
+class EventRollup(_EventCounts, Base):
+    """Number of events of one type, severity and asset within an hour."""
+
+    __tablename__ = "event_rollups_hourly"
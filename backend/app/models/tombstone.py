@@ -0,0 +1,32 @@
+"""
+Tombstone model for GeoMap Simulation API.
+Records hard deletes so delta sync clients can drop removed rows.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class Tombstone(Base):
+    """Marker left behind when an entity is hard-deleted."""
+
+    __tablename__ = "tombstones"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    entity_type = Column(String(20), nullable=False)  # engagement
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_tombstones_deleted", "deleted_at"),
+    )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "entity_type": self.entity_type,
+            "entity_id": str(self.entity_id),
+            "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
+        }
@@ -4,24 +4,81 @@ Schemas for API responses.
 
 from datetime import datetime
 from pydantic import BaseModel
-from app.schemas.assets import AssetCreate, AssetUpdate, AssetResponse, AssetListResponse
-from app.schemas.engagements import EngagementCreate, EngagementUpdate, EngagementResponse, EngagementListResponse
-from app.schemas.events import EventCreate, EventResponse
+from app.schemas.assets import (
+    AssetCreate,
+    AssetUpdate,
+    AssetResponse,
+    AssetListResponse,
+    AssetDistanceResponse,
+    AssetCluster,
+    AssetTelemetry,
+    AssetTelemetryBatch,
+    AssetTelemetryResult,
+    AssetTelemetryResponse,
+    TrackPoint,
+    AssetTrackResponse,
+    ThreatResponse,
+    ThreatListResponse,
+)
+from app.schemas.engagements import (
+    EngagementCreate,
+    EngagementUpdate,
+    EngagementResponse,
+    EngagementExpandedResponse,
+    EngagementListResponse,
+    EngagementAction,
+    EngagementActionBatch,
+    EngagementActionResult,
+    EngagementActionBatchResponse,
+    AssignmentRequest,
+    AssignmentPair,
+    AssignmentResponse,
+)
+from app.schemas.events import EventCreate, EventResponse, EventStatsPoint, EventStatsResponse
 from app.schemas.commands import CommandCreate, CommandResponse
+from app.schemas.sync import SyncTombstones, SyncResponse
+from app.schemas.imports import AssetImport, EventImport, CommandImport, ImportRowError, ImportResult
 
 __all__ = [
     "AssetCreate",
     "AssetUpdate",
     "AssetResponse",
     "AssetListResponse",
+    "AssetDistanceResponse",
+    "AssetCluster",
+    "AssetTelemetry",
+    "AssetTelemetryBatch",
+    "AssetTelemetryResult",
+    "AssetTelemetryResponse",
+    "TrackPoint",
+    "AssetTrackResponse",
+    "ThreatResponse",
+    "ThreatListResponse",
     "EngagementCreate",
     "EngagementUpdate",
     "EngagementResponse",
+    "EngagementExpandedResponse",
     "EngagementListResponse",
+    "EngagementAction",
+    "EngagementActionBatch",
+    "EngagementActionResult",
+    "EngagementActionBatchResponse",
+    "AssignmentRequest",
+    "AssignmentPair",
+    "AssignmentResponse",
     "EventCreate",
     "EventResponse",
+    "EventStatsPoint",
+    "EventStatsResponse",
     "CommandCreate",
     "CommandResponse",
+    "SyncTombstones",
+    "SyncResponse",
+    "AssetImport",
+    "EventImport",
+    "CommandImport",
+    "ImportRowError",
+    "ImportResult",
     "HealthResponse",
     "RootResponse",
 ]
@@ -3,10 +3,22 @@ Schemas for asset-related operations.
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
+from app.models.asset import EXTRA_DATA_NUMERIC_KEYS
+from app.utils.timestamps import naive_utc
+
+
+def check_numeric_keys(extra_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reject non-numeric values for extra_data keys backed by a numeric index."""
+    for key in EXTRA_DATA_NUMERIC_KEYS:
+        value = (extra_data or {}).get(key)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"extra_data.{key} must be a number")
+    return extra_data
+
 
 class AssetBase(BaseModel):
     """Base asset schema."""
@@ -23,7 +35,11 @@ class AssetBase(BaseModel):
 
 class AssetCreate(AssetBase):
     """Schema for creating a new asset."""
-    pass
+
+    @field_validator("extra_data")
+    @classmethod
+    def numeric_keys_hold_numbers(cls, value: Dict[str, Any]) -> Dict[str, Any]:
+        return check_numeric_keys(value)
 
 
 class AssetUpdate(BaseModel):
@@ -38,6 +54,11 @@ class AssetUpdate(BaseModel):
     is_active: Optional[bool] = None
     extra_data: Optional[Dict[str, Any]] = None
 
+    @field_validator("extra_data")
+    @classmethod
+    def numeric_keys_hold_numbers(cls, value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return check_numeric_keys(value)
+
 
 class AssetResponse(AssetBase):
     """Schema for asset response."""
@@ -51,7 +72,94 @@ class AssetResponse(AssetBase):
         populate_by_name = True
 
 
+class AssetCluster(BaseModel):
+    """Schema for an aggregated group of assets at low zoom."""
+    lat: float
+    lon: float
+    count: int
+    friendly_count: int
+    enemy_count: int
+    asset_id: Optional[UUID] = Field(default=None, description="Set when the cluster holds a single asset")
+
+
 class AssetListResponse(BaseModel):
     """Schema for asset list response."""
     assets: list[AssetResponse]
     total: int
+    next_cursor: Optional[str] = None
+    clusters: Optional[list[AssetCluster]] = None
+
+
+class AssetDistanceResponse(BaseModel):
+    """Schema for an asset ranked by distance from a reference point."""
+    asset: AssetResponse
+    distance_km: float
+
+
+class AssetTelemetry(BaseModel):
+    """Schema for a single position report."""
+    id: UUID
+    lat: float = Field(..., ge=-90, le=90)
+    lon: float = Field(..., ge=-180, le=180)
+    status: Optional[str] = Field(default=None, pattern="^(available|in_use|maintenance|offline)$")
+    last_seen: Optional[datetime] = None
+
+    @field_validator("last_seen")
+    @classmethod
+    def last_seen_naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Store report times as naive UTC, like every other timestamp."""
+        return naive_utc(value)
+
+
+class AssetTelemetryBatch(BaseModel):
+    """Schema for a batch of position reports."""
+    updates: List[AssetTelemetry] = Field(..., min_length=1, max_length=10000)
+
+
+class AssetTelemetryResult(BaseModel):
+    """Schema for the outcome of one position report."""
+    id: UUID
+    result: str = Field(..., pattern="^(updated|not_found)$")
+
+
+class AssetTelemetryResponse(BaseModel):
+    """Schema for batch telemetry response."""
+    results: list[AssetTelemetryResult]
+    updated: int
+    not_found: int
+
+
+class TrackPoint(BaseModel):
+    """Schema for one position in an asset track."""
+    lat: float
+    lon: float
+    recorded_at: datetime
+
+
+class AssetTrackResponse(BaseModel):
+    """Schema for a simplified asset track over a time window."""
+    asset_id: UUID
+    start: datetime
+    end: datetime
+    total_points: int = Field(..., description="Samples in the window before simplification")
+    points: list[TrackPoint]
+
+
+class ThreatResponse(BaseModel):
+    """Schema for the threat score of one enemy asset."""
+    asset_id: UUID
+    asset_type: Optional[str] = None
+    status: str
+    lat: float
+    lon: float
+    score: float = Field(..., description="0-100, higher is more threatening")
+    speed_kmh: float
+    nearest_friendly_id: Optional[UUID] = None
+    nearest_friendly_km: Optional[float] = None
+
+
+class ThreatListResponse(BaseModel):
+    """Schema for enemy assets ranked by threat score."""
+    threats: list[ThreatResponse]
+    total: int
+    rescored: int = Field(..., description="Enemies rescored for this request")
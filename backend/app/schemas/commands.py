@@ -10,9 +10,9 @@ from uuid import UUID
 
 class CommandBase(BaseModel):
     """Base command schema."""
-    device_id: UUID
-    location_id: Optional[UUID] = None
-    command_type: str = Field(..., pattern="^(patrol|survey|return|stop|resume)$")
+    asset_id: Optional[UUID] = None
+    engagement_id: Optional[UUID] = None
+    command_type: str = Field(..., pattern="^(patrol|survey|return|stop|resume|engage|disengage)$")
     payload: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -28,6 +28,8 @@ class CommandResponse(CommandBase):
     error_message: Optional[str] = None
     acknowledged_at: Optional[datetime] = None
     failed_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+    attempts: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -4,9 +4,11 @@ Schemas for engagement-related operations.
 
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
+from app.schemas.assets import AssetResponse
+
 
 class EngagementBase(BaseModel):
     """Base engagement schema."""
@@ -45,7 +47,66 @@ class EngagementResponse(EngagementBase):
         from_attributes = True
 
 
+class EngagementExpandedResponse(EngagementResponse):
+    """Schema for engagement response with related assets embedded on request."""
+    friendly: Optional[AssetResponse] = Field(default=None, description="Present with expand=friendly")
+    enemy: Optional[AssetResponse] = Field(default=None, description="Present with expand=enemy")
+
+
 class EngagementListResponse(BaseModel):
     """Schema for engagement list response."""
-    engagements: list[EngagementResponse]
+    engagements: list[EngagementExpandedResponse]
     total: int
+    next_cursor: Optional[str] = None
+
+
+class EngagementAction(BaseModel):
+    """Schema for one action in a batch."""
+    engagement_id: UUID
+    action: str = Field(..., pattern="^(confirm|abort|engage|complete|missile-launch)$")
+
+
+class EngagementActionBatch(BaseModel):
+    """Schema for a batch of engagement actions applied in one transaction."""
+    actions: List[EngagementAction] = Field(..., min_length=1, max_length=1000)
+
+
+class EngagementActionResult(BaseModel):
+    """Schema for the outcome of one batched action."""
+    engagement_id: UUID
+    action: str
+    result: str = Field(..., pattern="^(applied|not_found|invalid_transition)$")
+    previous_status: Optional[str] = None
+    detail: Optional[str] = None
+    engagement: Optional[EngagementResponse] = None
+
+
+class EngagementActionBatchResponse(BaseModel):
+    """Schema for batch engagement action response."""
+    results: list[EngagementActionResult]
+    applied: int
+    failed: int
+
+
+class AssignmentRequest(BaseModel):
+    """Schema for a weapon-target assignment run."""
+    max_range_km: float = Field(default=100, gt=0, le=20000, description="Longest distance a friendly can engage")
+    friendly_status: str = Field(default="available", pattern="^(available|in_use|maintenance|offline)$")
+    exclude_engaged: bool = Field(default=True, description="Skip assets already in a live engagement")
+    create_engagements: bool = Field(default=False, description="Insert a pending engagement for every pair")
+
+
+class AssignmentPair(BaseModel):
+    """Schema for one friendly-enemy pairing."""
+    friendly_id: UUID
+    enemy_id: UUID
+    distance_km: float
+    engagement_id: Optional[UUID] = None
+
+
+class AssignmentResponse(BaseModel):
+    """Schema for weapon-target assignment response."""
+    assignments: list[AssignmentPair]
+    total_distance_km: float
+    unassigned_friendlies: int
+    unassigned_enemies: int
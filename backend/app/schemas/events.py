@@ -4,15 +4,15 @@ Schemas for event-related operations.
 
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 
 class EventBase(BaseModel):
     """Base event schema."""
-    device_id: UUID
-    location_id: Optional[UUID] = None
-    event_type: str = Field(..., pattern="^(alert|status_change|command_ack)$")
+    asset_id: Optional[UUID] = None
+    engagement_id: Optional[UUID] = None
+    event_type: str = Field(..., pattern="^(alert|status_change|command_ack|engagement_start|engagement_end)$")
     details: Dict[str, Any] = Field(default_factory=dict)
     severity: Optional[str] = Field(default=None, pattern="^(info|warning|critical)$")
     resolved: Optional[str] = Field(default="pending", pattern="^(pending|resolved|ignored)$")
@@ -33,6 +33,24 @@ class EventResponse(EventBase):
         from_attributes = True
 
 
+class EventStatsPoint(BaseModel):
+    """Schema for the event count of one bucket and group."""
+    bucket: datetime
+    event_type: Optional[str] = None
+    severity: Optional[str] = None
+    asset_id: Optional[UUID] = None
+    count: int
+
+
+class EventStatsResponse(BaseModel):
+    """Schema for time-bucketed event counts."""
+    bucket: str
+    start: datetime
+    end: datetime
+    group_by: List[str]
+    series: List[EventStatsPoint]
+
+
 class EventListResponse(BaseModel):
     """Schema for event list response."""
     events: list[EventResponse]
@@ -0,0 +1,51 @@
+"""
+Schemas for bulk import operations.
+Import rows may carry their own IDs and timestamps so that exercise logs
+can be replayed faithfully.
+"""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Optional
+from uuid import UUID
+
+from app.schemas.assets import AssetCreate
+from app.schemas.events import EventCreate
+from app.schemas.commands import CommandCreate
+
+
+class AssetImport(AssetCreate):
+    """Schema for one imported asset."""
+    id: Optional[UUID] = None
+    last_seen: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+
+class EventImport(EventCreate):
+    """Schema for one imported event."""
+    id: Optional[UUID] = None
+    timestamp: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+
+class CommandImport(CommandCreate):
+    """Schema for one imported command."""
+    id: Optional[UUID] = None
+    status: str = Field(default="pending", pattern="^(pending|sent|acknowledged|failed)$")
+    error_message: Optional[str] = Field(default=None, max_length=255)
+    acknowledged_at: Optional[datetime] = None
+    failed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+
+class ImportRowError(BaseModel):
+    """Schema for a row rejected during validation."""
+    line: int = Field(..., description="1-based record number in the input")
+    message: str
+
+
+class ImportResult(BaseModel):
+    """Schema for bulk import response."""
+    table: str
+    imported: int
+    errors: list[ImportRowError] = Field(default_factory=list)
@@ -0,0 +1,28 @@
+"""
+Schemas for delta sync operations.
+"""
+
+from pydantic import BaseModel, Field
+from uuid import UUID
+
+from app.schemas.assets import AssetResponse
+from app.schemas.engagements import EngagementResponse
+from app.schemas.events import EventResponse
+from app.schemas.commands import CommandResponse
+
+
+class SyncTombstones(BaseModel):
+    """IDs removed since the watermark."""
+    assets: list[UUID] = Field(default_factory=list, description="Assets soft-deleted (is_active=False)")
+    engagements: list[UUID] = Field(default_factory=list, description="Engagements hard-deleted")
+
+
+class SyncResponse(BaseModel):
+    """Schema for changes since a watermark."""
+    watermark: str = Field(..., description="Opaque token; pass as `since` on the next sync")
+    has_more: bool = Field(default=False, description="More changes remain; sync again immediately")
+    assets: list[AssetResponse]
+    engagements: list[EngagementResponse]
+    events: list[EventResponse]
+    commands: list[CommandResponse]
+    deleted: SyncTombstones
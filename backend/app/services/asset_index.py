@@ -0,0 +1,186 @@
+"""
+Process-wide spatial index of asset positions.
+Loaded lazily from the assets table and kept current by the asset write
+endpoints, so geographic lookups only go to the database to hydrate rows.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.asset import Asset
+from app.utils.clustering import Cluster, ClusterGrid
+from app.utils.spatial_index import GridIndex, PositionArrays
+
+# Compact integer codes for asset status, shared by array-backed structures
+ASSET_STATUS_CODES = {"available": 0, "in_use": 1, "maintenance": 2, "offline": 3}
+
+
+@dataclass
+class IndexedAsset:
+    """Attributes kept alongside an indexed position."""
+    lat: float
+    lon: float
+    is_friendly: bool
+    status: str
+    asset_type: Optional[str] = None
+    # Time of the report that produced this state; a newer report alone is not a change
+    last_seen: Optional[datetime] = field(default=None, compare=False)
+
+
+# Called with (asset_id, previous, current) whenever an indexed asset changes
+AssetListener = Callable[[UUID, Optional[IndexedAsset], Optional[IndexedAsset]], None]
+
+
+class AssetIndex:
+    """Grid and array indexes over active assets that have a position."""
+
+    def __init__(self, cell_size_deg: float = 0.1):
+        self.grid = GridIndex(cell_size_deg)
+        self.friendlies = PositionArrays()
+        self.clusters = ClusterGrid()
+        self.assets: Dict[UUID, IndexedAsset] = {}
+        self.loaded = False
+        self.generation = 0
+        self._listeners: List[AssetListener] = []
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Build the index from the database on first use."""
+        if self.loaded:
+            return
+        async with self._lock:
+            if self.loaded:
+                return
+            result = await session.execute(
+                select(
+                    Asset.id, Asset.lat, Asset.lon, Asset.is_friendly, Asset.status, Asset.is_active,
+                    Asset.asset_type, Asset.last_seen,
+                )
+            )
+            self.clear()
+            for row in result:
+                self.upsert(
+                    row.id, row.lat, row.lon, row.is_friendly, row.status, row.is_active, row.asset_type, row.last_seen
+                )
+            self.generation += 1
+            self.loaded = True
+
+    def clear(self) -> None:
+        """Drop every indexed asset."""
+        self.grid.clear()
+        self.friendlies.clear()
+        self.clusters.clear()
+        self.assets.clear()
+
+    def invalidate(self) -> None:
+        """Force a full reload on next use."""
+        self.loaded = False
+
+    def subscribe(self, listener: AssetListener) -> None:
+        """Register a callback for changes made after the index is loaded.
+
+        A full reload is signalled by ``generation`` changing instead.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, asset_id: UUID, previous: Optional[IndexedAsset], current: Optional[IndexedAsset]) -> None:
+        if not self.loaded or previous == current:
+            return
+        for listener in self._listeners:
+            listener(asset_id, previous, current)
+
+    def upsert(
+        self,
+        asset_id: UUID,
+        lat: Optional[float],
+        lon: Optional[float],
+        is_friendly: Optional[bool],
+        status: str,
+        is_active: Optional[bool] = True,
+        asset_type: Optional[str] = None,
+        last_seen: Optional[datetime] = None,
+    ) -> None:
+        """Insert, move or drop an asset depending on its current state.
+
+        An omitted ``asset_type`` keeps the type already indexed.
+        """
+        if lat is None or lon is None or is_active is False:
+            self.remove(asset_id)
+            return
+        previous = self.assets.get(asset_id)
+        if asset_type is None and previous is not None:
+            asset_type = previous.asset_type
+        current = IndexedAsset(lat, lon, is_friendly is not False, status, asset_type, last_seen)
+        self.grid.insert(asset_id, lat, lon)
+        self.clusters.insert(asset_id, lat, lon, is_friendly is not False)
+        self.assets[asset_id] = current
+        if is_friendly is not False:
+            self.friendlies.upsert(asset_id, lat, lon, ASSET_STATUS_CODES.get(status, -1))
+        else:
+            self.friendlies.remove(asset_id)
+        self._notify(asset_id, previous, current)
+
+    def sync(self, asset: Asset) -> None:
+        """Mirror the state of an ORM asset into the index."""
+        self.upsert(
+            asset.id, asset.lat, asset.lon, asset.is_friendly, asset.status, asset.is_active,
+            asset.asset_type, asset.last_seen,
+        )
+
+    def remove(self, asset_id: UUID) -> None:
+        """Remove an asset from the index."""
+        self.grid.remove(asset_id)
+        self.friendlies.remove(asset_id)
+        self.clusters.remove(asset_id)
+        previous = self.assets.pop(asset_id, None)
+        if previous is not None:
+            self._notify(asset_id, previous, None)
+
+    def nearby(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        is_friendly: Optional[bool] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """Return (asset_id, distance_km) pairs within a radius, nearest first."""
+        matches = self.grid.query_radius(lat, lon, radius_km)
+        if is_friendly is None:
+            return matches
+        return [(asset_id, distance) for asset_id, distance in matches if self.assets[asset_id].is_friendly == is_friendly]
+
+    def nearest_friendlies(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        status: Optional[str] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """Return the k nearest friendly (asset_id, distance_km) pairs."""
+        code = None
+        if status is not None:
+            code = ASSET_STATUS_CODES.get(status)
+            if code is None:
+                return []
+        return self.friendlies.nearest(lat, lon, k, code=code)
+
+    def cluster(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        zoom: int,
+        is_friendly: Optional[bool] = None,
+    ) -> List[Cluster]:
+        """Return marker clusters for a viewport, optionally for one side only."""
+        return self.clusters.query(min_lat, min_lon, max_lat, max_lon, zoom, is_friendly=is_friendly)
+
+
+asset_index = AssetIndex()
@@ -0,0 +1,153 @@
+"""
+Post-commit change notifications for WebSocket subscribers.
+Write endpoints publish a compact message per changed entity to topic
+channels (``asset:{id}``, ``engagement:{id}``, ``events:{severity}``) once
+their transaction has committed. Publishing only enqueues; one background
+task delivers messages in order, so slow sockets never hold up a request.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+# Messages waiting beyond this are dropped rather than slowing writers down
+MAX_QUEUED_MESSAGES = 10_000
+
+# Fields carried in change messages, per entity kind
+ASSET_FIELDS = ("id", "status", "lat", "lon", "is_active")
+ENGAGEMENT_FIELDS = ("id", "status", "progress", "friendly_id", "enemy_id")
+EVENT_FIELDS = ("id", "event_type", "severity", "asset_id", "engagement_id", "timestamp")
+COMMAND_FIELDS = ("id", "command_type", "status", "asset_id", "engagement_id")
+
+Send = Callable[[str, dict], Awaitable[None]]
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _getter(entity: Any) -> Callable[[str], Any]:
+    if isinstance(entity, dict):
+        return entity.get
+    return lambda name: getattr(entity, name, None)
+
+
+def change_message(kind: str, action: str, entity: Any, fields: Iterable[str]) -> dict:
+    """Build a JSON-safe change message from an ORM object, row or dict."""
+    get = _getter(entity)
+    return {
+        "type": f"{kind}.{action}",
+        "data": {name: _json_value(get(name)) for name in fields},
+    }
+
+
+def asset_messages(action: str, asset: Any) -> Iterable[Tuple[str, dict]]:
+    """Channel messages for a changed asset."""
+    yield f"asset:{_getter(asset)('id')}", change_message("asset", action, asset, ASSET_FIELDS)
+
+
+def engagement_messages(action: str, engagement: Any) -> Iterable[Tuple[str, dict]]:
+    """Channel messages for a changed engagement."""
+    yield f"engagement:{_getter(engagement)('id')}", change_message("engagement", action, engagement, ENGAGEMENT_FIELDS)
+
+
+def event_messages(event: Any) -> Iterable[Tuple[str, dict]]:
+    """Channel messages for a new event: its severity topic and related entities."""
+    get = _getter(event)
+    message = change_message("event", "created", event, EVENT_FIELDS)
+    yield f"events:{get('severity') or 'none'}", message
+    if get("asset_id"):
+        yield f"asset:{get('asset_id')}", message
+    if get("engagement_id"):
+        yield f"engagement:{get('engagement_id')}", message
+
+
+def command_messages(action: str, command: Any) -> Iterable[Tuple[str, dict]]:
+    """Channel messages for a changed command, on its asset and engagement topics."""
+    get = _getter(command)
+    message = change_message("command", action, command, COMMAND_FIELDS)
+    if get("asset_id"):
+        yield f"asset:{get('asset_id')}", message
+    if get("engagement_id"):
+        yield f"engagement:{get('engagement_id')}", message
+
+
+class ChangeFeed:
+    """Bounded FIFO of channel messages drained by one delivery task."""
+
+    def __init__(self, max_queued: int = MAX_QUEUED_MESSAGES):
+        self.max_queued = max_queued
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._send: Optional[Send] = None
+        self._is_subscribed: Callable[[str], bool] = lambda channel: True
+        self._queue: "asyncio.Queue[Tuple[str, dict]]" = asyncio.Queue(max_queued)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, send: Send, is_subscribed: Optional[Callable[[str], bool]] = None) -> None:
+        """Start delivering through ``send``; ``is_subscribed`` lets idle channels be skipped."""
+        self._send = send
+        if is_subscribed is not None:
+            self._is_subscribed = is_subscribed
+        if not self.running:
+            self._queue = asyncio.Queue(self.max_queued)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the delivery task; undelivered messages are discarded."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def publish(self, messages: Iterable[Tuple[str, dict]]) -> None:
+        """Queue (channel, message) pairs; call only after the write has committed."""
+        if not self.running:
+            return
+        for channel, message in messages:
+            if not self._is_subscribed(channel):
+                continue
+            try:
+                self._queue.put_nowait((channel, message))
+                self.published += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    async def _run(self) -> None:
+        while True:
+            channel, message = await self._queue.get()
+            try:
+                await self._send(channel, message)
+                self.delivered += 1
+            except Exception:
+                logger.exception("Change delivery to %s failed", channel)
+
+    def stats(self) -> dict:
+        """Return queue depth and delivery counters."""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize(),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+change_feed = ChangeFeed()
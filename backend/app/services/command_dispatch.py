@@ -0,0 +1,305 @@
+"""
+Command dispatch to assets.
+Worker tasks claim due pending commands in batches with
+``FOR UPDATE SKIP LOCKED``, so concurrent workers (in this process or
+others) never wait on or claim each other's rows. A claim bumps ``attempts``
+and leases the command by pushing ``next_attempt_at`` past the delivery
+timeout; delivery then happens outside any transaction and the outcome is
+written back only if the lease is still ours. Transient failures are retried
+with exponential backoff until ``max_attempts``.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, or_, select, update
+
+from app.config import settings
+from app.database import async_session
+from app.models.command import Command
+from app.services.change_feed import change_feed, command_messages
+from app.services.count_cache import count_cache
+from app.services.entity_cache import entity_cache
+
+logger = logging.getLogger(__name__)
+
+# Longest error text kept on a command (error_message is VARCHAR(255))
+MAX_ERROR_LENGTH = 255
+
+
+class DeliveryRejected(Exception):
+    """The asset refused the command; retrying will not help."""
+
+
+class CommandTransport(ABC):
+    """Delivers commands to assets.
+
+    ``deliver`` returns True when the asset acknowledged the command, False
+    when it was sent but not yet acknowledged. Raising DeliveryRejected fails
+    the command; any other exception is retried.
+    """
+
+    @abstractmethod
+    async def deliver(self, command: dict) -> bool:
+        """Send ``command`` to its asset."""
+
+
+class LocalTransport(CommandTransport):
+    """In-process transport for simulation and tests.
+
+    Records every delivered command and acknowledges it; ``failures`` maps a
+    command ID to exceptions raised on its successive attempts.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, acknowledge: bool = True, failures: Optional[dict] = None):
+        self.latency_seconds = latency_seconds
+        self.acknowledge = acknowledge
+        self.failures = failures or {}
+        self.delivered: List[dict] = []
+
+    async def deliver(self, command: dict) -> bool:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        pending = self.failures.get(command["id"])
+        if pending:
+            raise pending.pop(0)
+        self.delivered.append(command)
+        return self.acknowledge
+
+
+def backoff_seconds(attempts: int, base: float, cap: float) -> float:
+    """Delay before the retry following attempt number ``attempts``."""
+    return min(cap, base * 2 ** (attempts - 1))
+
+
+def claim_statement(batch_size: int):
+    """Lease up to ``batch_size`` due pending commands; ``now`` and ``lease_until`` are bound."""
+    due = (
+        select(Command.id)
+        .where(
+            Command.status == "pending",
+            or_(Command.next_attempt_at.is_(None), Command.next_attempt_at <= bindparam("now")),
+        )
+        .order_by(Command.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Command.__table__)
+        .where(Command.id.in_(due.scalar_subquery()))
+        .values(attempts=Command.attempts + 1, next_attempt_at=bindparam("lease_until"))
+        .returning(
+            Command.id,
+            Command.asset_id,
+            Command.engagement_id,
+            Command.command_type,
+            Command.payload,
+            Command.attempts,
+        )
+    )
+
+
+def record_statement():
+    """Write one delivery outcome, unless the lease was lost to another claim."""
+    return (
+        update(Command.__table__)
+        .where(
+            Command.id == bindparam("b_id"),
+            Command.attempts == bindparam("b_attempts"),
+            Command.status == "pending",
+        )
+        .values(
+            status=bindparam("b_status"),
+            sent_at=bindparam("b_sent_at"),
+            acknowledged_at=bindparam("b_acknowledged_at"),
+            failed_at=bindparam("b_failed_at"),
+            error_message=bindparam("b_error_message"),
+            next_attempt_at=bindparam("b_next_attempt_at"),
+            updated_at=bindparam("b_now"),
+        )
+    )
+
+
+class CommandDispatcher:
+    """Pool of worker tasks moving pending commands through the transport."""
+
+    def __init__(
+        self,
+        workers: int,
+        batch_size: int,
+        poll_seconds: float,
+        delivery_timeout_seconds: float,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        transport: Optional[CommandTransport] = None,
+        session_factory=async_session,
+    ):
+        if lease_seconds <= delivery_timeout_seconds:
+            raise ValueError("Command lease must outlast the delivery timeout")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.delivery_timeout_seconds = delivery_timeout_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.transport = transport
+        self.session_factory = session_factory
+        self.counts = {"claimed": 0, "sent": 0, "acknowledged": 0, "retried": 0, "failed": 0}
+        self._claim = claim_statement(batch_size)
+        self._record = record_statement()
+        self._wake = asyncio.Event()
+        self._failing = False
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self, transport: Optional[CommandTransport] = None) -> None:
+        """Start the workers if they are not already running.
+
+        A transport must be given here or at construction; there is no default.
+        """
+        if transport is not None:
+            self.transport = transport
+        if self.transport is None:
+            raise ValueError("Command dispatch needs a transport")
+        if not self.running:
+            self._wake = asyncio.Event()
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers; commands leased mid-delivery are retried after their lease."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers after new commands are committed."""
+        self._wake.set()
+
+    async def dispatch_batch(self) -> int:
+        """Claim, deliver and record one batch; returns the number claimed."""
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            result = await session.execute(
+                self._claim, {"now": now, "lease_until": now + timedelta(seconds=self.lease_seconds)}
+            )
+            claimed = result.all()
+            await session.commit()
+        if not claimed:
+            return 0
+        self.counts["claimed"] += len(claimed)
+
+        outcomes = await asyncio.gather(*(self._deliver(row) for row in claimed))
+        now = datetime.utcnow()
+        updates = [self.outcome(row, acknowledged, error, now) for row, (acknowledged, error) in zip(claimed, outcomes)]
+        async with self.session_factory() as session:
+            await session.execute(self._record, updates)
+            await session.commit()
+
+        entity_cache.invalidate_many(Command.__tablename__, [row.id for row in claimed])
+        count_cache.invalidate(Command)
+        for row, values in zip(claimed, updates):
+            change_feed.publish(command_messages("updated", {**row._mapping, "status": values["b_status"]}))
+        return len(claimed)
+
+    async def _deliver(self, row) -> Tuple[bool, Optional[Exception]]:
+        command = {
+            "id": row.id,
+            "asset_id": row.asset_id,
+            "engagement_id": row.engagement_id,
+            "command_type": row.command_type,
+            "payload": row.payload,
+            "attempt": row.attempts,
+        }
+        try:
+            acknowledged = await asyncio.wait_for(self.transport.deliver(command), self.delivery_timeout_seconds)
+            return bool(acknowledged), None
+        except asyncio.TimeoutError:
+            return False, TimeoutError(f"Delivery timed out after {self.delivery_timeout_seconds}s")
+        except Exception as exc:
+            return False, exc
+
+    def outcome(self, row, acknowledged: bool, error: Optional[Exception], now: datetime) -> dict:
+        """Parameters for record_statement after one delivery attempt of ``row``."""
+        values = {
+            "b_id": row.id,
+            "b_attempts": row.attempts,
+            "b_status": "pending",
+            "b_sent_at": None,
+            "b_acknowledged_at": None,
+            "b_failed_at": None,
+            "b_error_message": None,
+            "b_next_attempt_at": None,
+            "b_now": now,
+        }
+        if error is None:
+            values["b_status"] = "acknowledged" if acknowledged else "sent"
+            values["b_sent_at"] = now
+            values["b_acknowledged_at"] = now if acknowledged else None
+            self.counts[values["b_status"]] += 1
+            return values
+
+        values["b_error_message"] = (str(error) or type(error).__name__)[:MAX_ERROR_LENGTH]
+        if isinstance(error, DeliveryRejected) or row.attempts >= self.max_attempts:
+            values["b_status"] = "failed"
+            values["b_failed_at"] = now
+            self.counts["failed"] += 1
+        else:
+            delay = backoff_seconds(row.attempts, self.retry_base_seconds, self.retry_max_seconds)
+            values["b_next_attempt_at"] = now + timedelta(seconds=delay)
+            self.counts["retried"] += 1
+        return values
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                claimed = await self.dispatch_batch()
+                self._failing = False
+            except Exception:
+                # Log once per outage rather than on every poll
+                if not self._failing:
+                    logger.exception("Command dispatch failed")
+                self._failing = True
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+    def stats(self) -> dict:
+        """Return worker state and outcome counters."""
+        return {
+            "running": self.running,
+            "healthy": not self._failing,
+            "workers": self.workers,
+            "transport": type(self.transport).__name__ if self.transport else None,
+            **self.counts,
+        }
+
+
+command_dispatcher = CommandDispatcher(
+    workers=settings.COMMAND_DISPATCH_WORKERS,
+    batch_size=settings.COMMAND_DISPATCH_BATCH_SIZE,
+    poll_seconds=settings.COMMAND_DISPATCH_POLL_SECONDS,
+    delivery_timeout_seconds=settings.COMMAND_DELIVERY_TIMEOUT_SECONDS,
+    lease_seconds=settings.COMMAND_LEASE_SECONDS,
+    max_attempts=settings.COMMAND_MAX_ATTEMPTS,
+    retry_base_seconds=settings.COMMAND_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.COMMAND_RETRY_MAX_SECONDS,
+)
@@ -0,0 +1,74 @@
+"""
+Cheap row counts for paginated list endpoints.
+Unfiltered counts of large tables come from the planner's estimate in
+pg_class (summed over partitions for partitioned tables); everything else is an exact COUNT(*) cached for a short TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Below this many estimated rows an exact count is cheap enough
+ESTIMATE_THRESHOLD = 100_000
+
+
+class CountCache:
+    """TTL cache of list totals keyed by table and filter values."""
+
+    def __init__(self, ttl_seconds: float = 5.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, int]]" = OrderedDict()
+
+    async def count(self, session: AsyncSession, model: Any, filters: Hashable, *criteria) -> int:
+        """Return the number of rows matching ``criteria``.
+
+        ``filters`` is a hashable summary of the criteria used as the cache key.
+        """
+        key = (model.__tablename__, filters)
+        cached = self._entries.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            return cached[1]
+
+        total = None
+        if not criteria:
+            total = await self._estimate(session, model.__tablename__)
+        if total is None:
+            result = await session.execute(select(func.count()).select_from(model).where(*criteria))
+            total = result.scalar_one()
+
+        self._entries[key] = (now, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return total
+
+    def invalidate(self, model: Any) -> None:
+        """Drop cached totals for a table."""
+        for key in [key for key in self._entries if key[0] == model.__tablename__]:
+            del self._entries[key]
+
+    @staticmethod
+    async def _estimate(session: AsyncSession, table: str):
+        result = await session.execute(
+            # A partitioned parent has no reltuples of its own; add up its partitions.
+            # Never-analysed tables report -1 and are left out.
+            text(
+                "SELECT sum(reltuples) FILTER (WHERE reltuples >= 0)::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table) "
+                "OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(:table))"
+            ),
+            {"table": table},
+        )
+        estimate = result.scalar()
+        if estimate is None or estimate < ESTIMATE_THRESHOLD:
+            return None
+        return int(estimate)
+
+
+count_cache = CountCache()
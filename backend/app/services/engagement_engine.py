@@ -0,0 +1,165 @@
+"""
+Server-side engagement progress engine.
+A single background task advances every engaging and in-flight engagement
+on a fixed tick: one batched UPDATE per tick, and one coalesced progress
+frame broadcast to WebSocket clients, however many engagements are live.
+Every application worker runs the loop; a transaction-scoped advisory lock
+lets one of them advance engagements at a time, and each row is credited
+with the time since its last update, so N workers do not advance N times
+as fast.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import bindparam, case, cast, extract, func, or_, text, update, DateTime, Float
+
+from app.config import settings
+from app.database import async_session
+from app.models.engagement import Engagement
+from app.services.change_feed import change_feed, engagement_messages
+from app.services.entity_cache import entity_cache
+
+logger = logging.getLogger(__name__)
+
+# Progress gained per second in each live status; a missile flight takes
+# five seconds, matching the map animation.
+PROGRESS_PER_SECOND = {"engaging": 10.0, "missile_in_flight": 20.0}
+
+# Statuses that finish on their own once progress reaches 100
+COMPLETES_AT = {"missile_in_flight": "completed"}
+
+# Longest interval credited to one tick, so a stalled loop does not
+# finish every engagement at once when it resumes
+MAX_TICK_ELAPSED = 5.0
+
+# Serialises progress ticks across application workers
+PROGRESS_LOCK_KEY = 0x656E6761  # "enga"
+
+Broadcast = Callable[[dict], Awaitable[None]]
+
+
+def progress_statement():
+    """Build the per-tick UPDATE; ``now`` and the ``elapsed`` cap are bound at execution.
+
+    Each row is credited with the seconds since its ``updated_at``, capped at
+    ``elapsed``, so ticks from other workers in between are not counted twice.
+    """
+    now = bindparam("now", type_=DateTime)
+    cap = bindparam("elapsed", type_=Float)
+    since_update = cast(extract("epoch", now - Engagement.updated_at), Float)
+    elapsed = func.greatest(0, func.least(cap, func.coalesce(since_update, cap)))
+    current = func.coalesce(Engagement.progress, 0)
+    advanced = current + case(
+        *[(Engagement.status == status, rate * elapsed) for status, rate in PROGRESS_PER_SECOND.items()],
+        else_=0,
+    )
+    return (
+        update(Engagement)
+        .where(
+            Engagement.status.in_(PROGRESS_PER_SECOND),
+            or_(Engagement.status.in_(COMPLETES_AT), current < 100),
+        )
+        .values(
+            progress=func.least(100, advanced),
+            status=case(
+                *[((Engagement.status == status) & (advanced >= 100), done) for status, done in COMPLETES_AT.items()],
+                else_=Engagement.status,
+            ),
+            updated_at=now,
+        )
+        .returning(Engagement.id, Engagement.status, Engagement.progress, Engagement.friendly_id, Engagement.enemy_id)
+    )
+
+
+class EngagementEngine:
+    """Fixed-rate loop that advances live engagements and broadcasts progress."""
+
+    def __init__(self, tick_seconds: float, broadcast: Optional[Broadcast] = None, session_factory=async_session):
+        self.tick_seconds = tick_seconds
+        self.broadcast = broadcast
+        self.session_factory = session_factory
+        self.ticks = 0
+        self.skipped = 0
+        self._failing = False
+        self._statement = progress_statement()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, broadcast: Optional[Broadcast] = None) -> None:
+        """Start the background loop if it is not already running."""
+        if broadcast is not None:
+            self.broadcast = broadcast
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def tick(self, elapsed: float) -> List[dict]:
+        """Advance all live engagements by up to ``elapsed`` seconds and broadcast them.
+
+        Skipped, returning nothing, while another worker holds the tick lock.
+        """
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            locked = await session.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PROGRESS_LOCK_KEY})
+            if not locked.scalar():
+                self.skipped += 1
+                return []
+            result = await session.execute(self._statement, {"elapsed": min(elapsed, MAX_TICK_ELAPSED), "now": now})
+            rows = result.all()
+            await session.commit()
+        self.ticks += 1
+        if not rows:
+            return []
+
+        entity_cache.invalidate_many("engagements", [row.id for row in rows])
+        for row in rows:
+            # Only live statuses are advanced, so any other status was reached this tick
+            if row.status not in PROGRESS_PER_SECOND:
+                change_feed.publish(engagement_messages("updated", row))
+        updates = [{"id": str(row.id), "status": row.status, "progress": row.progress} for row in rows]
+        if self.broadcast is not None:
+            await self.broadcast({
+                "type": "engagement_progress",
+                "timestamp": now.isoformat(),
+                "engagements": updates,
+            })
+        return updates
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last = deadline = loop.time()
+        while True:
+            # Schedule against absolute deadlines so slow ticks do not drift
+            deadline += self.tick_seconds
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            now = loop.time()
+            try:
+                await self.tick(now - last)
+                self._failing = False
+            except Exception:
+                # Log once per outage rather than on every tick
+                if not self._failing:
+                    logger.exception("Engagement progress tick failed")
+                self._failing = True
+            last = now
+            if now - deadline > self.tick_seconds:
+                deadline = now
+
+
+engagement_engine = EngagementEngine(settings.ENGAGEMENT_TICK_SECONDS)
@@ -0,0 +1,97 @@
+"""
+Engagement state machine.
+Each operator action is a declared transition applied as one conditional
+UPDATE, so concurrent operators cannot overwrite each other's state change
+and a rejected action still costs a single round trip.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.engagement import Engagement
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A named action moving an engagement from any of ``sources`` to ``target``."""
+    sources: Tuple[str, ...]
+    target: str
+    error: str
+    values: Dict[str, Any] = field(default_factory=dict)
+
+
+TRANSITIONS: Dict[str, Transition] = {
+    "confirm": Transition(("pending",), "active", "Engagement must be in pending status", {"progress": 0}),
+    "abort": Transition(("pending", "active"), "cancelled", "Engagement must be in pending or active status"),
+    "engage": Transition(("active",), "engaging", "Engagement must be confirmed before engaging"),
+    "complete": Transition(("engaging",), "completed", "Engagement must be engaging to be completed", {"progress": 100}),
+    "missile_launch": Transition(("engaging",), "missile_in_flight", "Engagement must be in engaging status", {"progress": 0}),
+}
+
+
+# Statuses in which an engagement still ties up its friendly and enemy assets
+LIVE_STATUSES = ("pending", "active", "engaging", "missile_in_flight")
+
+
+@dataclass
+class TransitionResult:
+    """Outcome of applying a transition to one engagement."""
+    found: bool
+    applied: bool
+    previous_status: Optional[str] = None
+    engagement: Any = None
+
+
+def transition_values(transition: Transition, now: datetime) -> Dict[str, Any]:
+    """Column values written when a transition is applied."""
+    return {"status": transition.target, "updated_at": now, **transition.values}
+
+
+async def apply_transitions(
+    session: AsyncSession,
+    engagement_ids: Iterable[UUID],
+    action: str,
+) -> Dict[UUID, TransitionResult]:
+    """Apply one action to many engagements in one statement, without committing.
+
+    The UPDATE only matches rows whose current status is a legal source,
+    and the status seen alongside it tells a missing engagement apart from
+    an illegal transition. Applied results carry the updated row.
+    """
+    transition = TRANSITIONS[action]
+    ids = list(dict.fromkeys(engagement_ids))
+    current = (
+        select(Engagement.id, Engagement.status)
+        .where(Engagement.id.in_(ids))
+        .cte("current_engagement")
+    )
+    updated = (
+        update(Engagement)
+        .where(Engagement.id.in_(ids), Engagement.status.in_(transition.sources))
+        .values(**transition_values(transition, datetime.utcnow()))
+        .returning(*Engagement.__table__.columns)
+        .cte("updated_engagement")
+    )
+    stmt = (
+        select(current.c.id.label("requested_id"), current.c.status.label("previous_status"), *updated.c)
+        .select_from(current.outerjoin(updated, updated.c.id == current.c.id))
+    )
+    results = {engagement_id: TransitionResult(found=False, applied=False) for engagement_id in ids}
+    for row in await session.execute(stmt):
+        if row.id is None:
+            results[row.requested_id] = TransitionResult(found=True, applied=False, previous_status=row.previous_status)
+        else:
+            results[row.requested_id] = TransitionResult(
+                found=True, applied=True, previous_status=row.previous_status, engagement=row
+            )
+    return results
+
+
+async def apply_transition(session: AsyncSession, engagement_id: UUID, action: str) -> TransitionResult:
+    """Apply an action to one engagement in one statement, without committing."""
+    return (await apply_transitions(session, [engagement_id], action))[engagement_id]
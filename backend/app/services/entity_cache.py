@@ -0,0 +1,122 @@
+"""
+Read-through cache for by-ID entity lookups.
+Entries are immutable response snapshots rather than ORM instances, so they
+can be shared across sessions; the write endpoints refresh or invalidate
+them after commit. Every write stamps the entry's key with a new version, and
+a read-through fill only lands if no write happened since the reader looked,
+so a slow reader cannot replace a newer snapshot with the row it loaded.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+CacheKey = Tuple[str, Hashable]
+
+
+class EntityCache:
+    """Bounded LRU cache with a per-entry TTL and hit/eviction counters.
+
+    Write stamps are kept for ``max_stamps`` keys, and a fill older than the
+    newest forgotten stamp is never cached.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 30.0, max_stamps: int = 65536):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_stamps = max_stamps
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._clock = 0
+        self._stamps: "OrderedDict[CacheKey, int]" = OrderedDict()
+        self._stamp_floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, entity_id: Hashable) -> Optional[Any]:
+        """Return a cached entity, or None on miss or expiry."""
+        key = (kind, entity_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def version(self, kind: str, entity_id: Hashable) -> int:
+        """Write version of an entity, to pass to ``fill`` after loading it."""
+        return self._stamps.get((kind, entity_id), self._stamp_floor)
+
+    def fill(self, kind: str, entity_id: Hashable, value: Any, version: int) -> bool:
+        """Cache a snapshot loaded on a miss, unless the entity was written since ``version``."""
+        if self.version(kind, entity_id) != version:
+            return False
+        self._store((kind, entity_id), value)
+        return True
+
+    def put(self, kind: str, entity_id: Hashable, value: Any) -> None:
+        """Store or refresh an entity after a write."""
+        key = (kind, entity_id)
+        self._stamp(key)
+        self._store(key, value)
+
+    def _store(self, key: CacheKey, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _stamp(self, key: CacheKey) -> None:
+        self._clock += 1
+        self._stamps[key] = self._clock
+        self._stamps.move_to_end(key)
+        while len(self._stamps) > self.max_stamps:
+            _, stamp = self._stamps.popitem(last=False)
+            self._stamp_floor = max(self._stamp_floor, stamp)
+
+    def invalidate(self, kind: str, entity_id: Hashable) -> None:
+        """Drop an entity."""
+        key = (kind, entity_id)
+        self._stamp(key)
+        self._entries.pop(key, None)
+
+    def invalidate_many(self, kind: str, entity_ids: Iterable[Hashable]) -> None:
+        """Drop several entities of one kind."""
+        for entity_id in entity_ids:
+            self.invalidate(kind, entity_id)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._clock += 1
+        self._entries.clear()
+        self._stamps.clear()
+        self._stamp_floor = self._clock
+
+    def stats(self) -> dict:
+        """Return size, hit rate and eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+entity_cache = EntityCache()
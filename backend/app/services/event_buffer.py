@@ -0,0 +1,221 @@
+"""
+Write-behind buffer for event ingestion.
+Accepted events get their ID and timestamps up front and are acknowledged
+immediately; a single writer task inserts them in multi-row batches once a
+batch fills or the flush interval passes, so an alert storm costs one pooled
+connection instead of one per request.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.config import settings
+from app.database import async_session
+from app.models.event import Event
+from app.services.change_feed import change_feed, event_messages
+from app.services.count_cache import count_cache
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by a row's own values; retrying the same row cannot succeed
+ROW_ERRORS = (IntegrityError, DataError)
+
+# Backoff between attempts while the database is unavailable
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 10.0
+
+
+class EventBufferFull(Exception):
+    """The buffer is at capacity; the client should retry later."""
+
+
+class EventBufferClosed(Exception):
+    """The buffer is not accepting events (not started or shutting down)."""
+
+
+class EventBuffer:
+    """Bounded in-memory queue of event rows drained by one batching writer."""
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_seconds: float,
+        shutdown_seconds: float,
+        session_factory=async_session,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.shutdown_seconds = shutdown_seconds
+        self.session_factory = session_factory
+        self.accepted = 0
+        self.written = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.batches = 0
+        self._items: Deque[dict] = deque()
+        self._in_flight = 0
+        self._pending = asyncio.Event()
+        self._full = asyncio.Event()
+        self._closing = False
+        self._failing = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._items) + self._in_flight
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the writer task if it is not already running."""
+        if not self.running:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting events and wait for everything queued to be written.
+
+        Writes still failing after ``shutdown_seconds`` are given up and
+        counted as dropped.
+        """
+        if self._task is None:
+            return
+        self._closing = True
+        self._pending.set()
+        self._full.set()
+        await self._task
+        self._task = None
+
+    def submit(self, row: dict) -> None:
+        """Queue a complete event row for insert."""
+        if self._closing or not self.running:
+            raise EventBufferClosed()
+        if len(self) >= self.max_size:
+            self.rejected += 1
+            raise EventBufferFull()
+        self._items.append(row)
+        self.accepted += 1
+        self._pending.set()
+        if len(self._items) >= self.batch_size:
+            self._full.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._items:
+                if self._closing:
+                    return
+                self._pending.clear()
+                await self._pending.wait()
+                continue
+            if len(self._items) < self.batch_size and not self._closing:
+                # Let a partial batch fill up for at most one flush interval
+                self._full.clear()
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.flush_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            batch = [self._items.popleft() for _ in range(min(self.batch_size, len(self._items)))]
+            self._in_flight = len(batch)
+            try:
+                await self._write(batch)
+            except Exception:
+                # The writer must outlive any failure or every later submit is refused
+                logger.exception("Dropping %d buffered events after an unexpected error", len(batch))
+                self.dropped += len(batch)
+            finally:
+                self._in_flight = 0
+
+    async def _write(self, batch: List[dict]) -> None:
+        """Insert one batch, retrying with backoff while the database is down.
+
+        Rows still unwritten are left in ``batch``.
+        """
+        loop = asyncio.get_running_loop()
+        give_up_at = None
+        delay = RETRY_BASE_SECONDS
+        row_by_row = False
+        while True:
+            try:
+                if row_by_row:
+                    await self._insert_each(batch)
+                else:
+                    await self._insert(batch)
+                    batch.clear()
+                self._failing = False
+                return
+            except ROW_ERRORS:
+                # A bad row must not take the rest of the batch with it
+                row_by_row = True
+                continue
+            except Exception:
+                if not self._failing:
+                    logger.exception("Event buffer flush failed; retrying")
+                self._failing = True
+            if self._closing:
+                give_up_at = give_up_at or loop.time() + self.shutdown_seconds
+                if loop.time() >= give_up_at:
+                    logger.error("Dropping %d buffered events at shutdown", len(batch))
+                    self.dropped += len(batch)
+                    return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX_SECONDS)
+
+    async def _insert(self, rows: List[dict]) -> None:
+        # Stamped at commit time so /sync, which pages on created_at, sees
+        # rows in the order they became visible; timestamp keeps accept time
+        now = datetime.utcnow()
+        for row in rows:
+            row["created_at"] = now
+        async with self.session_factory() as session:
+            await session.execute(insert(Event.__table__), rows)
+            await session.commit()
+        self.written += len(rows)
+        self.batches += 1
+        count_cache.invalidate(Event)
+        for row in rows:
+            change_feed.publish(event_messages(row))
+
+    async def _insert_each(self, rows: List[dict]) -> None:
+        """Insert rows one at a time, dropping those the database rejects.
+
+        Rows are removed from ``rows`` as they are settled, so a connection
+        error leaves only the unwritten remainder for the retry.
+        """
+        while rows:
+            try:
+                await self._insert(rows[:1])
+            except ROW_ERRORS as exc:
+                logger.warning("Dropping buffered event %s: %s", rows[0]["id"], exc.orig)
+                self.dropped += 1
+            rows.pop(0)
+
+    def stats(self) -> dict:
+        """Return queue depth and throughput counters."""
+        return {
+            "running": self.running,
+            "healthy": not self._failing,
+            "queued": len(self),
+            "max_size": self.max_size,
+            "accepted": self.accepted,
+            "written": self.written,
+            "batches": self.batches,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+        }
+
+
+event_buffer = EventBuffer(
+    max_size=settings.EVENT_BUFFER_MAX_SIZE,
+    batch_size=settings.EVENT_BUFFER_BATCH_SIZE,
+    flush_seconds=settings.EVENT_BUFFER_FLUSH_SECONDS,
+    shutdown_seconds=settings.EVENT_BUFFER_SHUTDOWN_SECONDS,
+)
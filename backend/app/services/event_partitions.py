@@ -0,0 +1,221 @@
+"""
+Partition upkeep and retention for the events table.
+Events are range partitioned on ``timestamp``. A background job keeps
+partitions created ahead of time and drops partitions past the retention
+window; their hourly counts live on in the rollup table, which an insert
+trigger keeps current (see app/services/event_rollups.py). A default
+partition catches rows outside every range, such as imported history, and
+is expired row by row instead.
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models.event_rollup import EventMinuteRollup
+from app.services.event_rollups import ensure_rollup_trigger
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "events"
+DEFAULT_PARTITION = "events_default"
+
+# Weekly partitions start on a Monday
+PERIOD_EPOCH = date(2000, 1, 3)
+
+# Serialises maintenance across application workers
+MAINTENANCE_LOCK_KEY = 0x6576656E  # "even"
+
+BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+@dataclass(frozen=True)
+class Partition:
+    """An attached range partition and its [start, end) bounds."""
+    name: str
+    start: datetime
+    end: datetime
+
+
+def period_start(day: date, width_days: int) -> date:
+    """First day of the partition period containing ``day``."""
+    offset = (day - PERIOD_EPOCH).days % width_days
+    return day - timedelta(days=offset)
+
+
+def partition_name(start: date) -> str:
+    """Table name of the partition starting on ``start``."""
+    return f"{PARENT_TABLE}_p{start:%Y%m%d}"
+
+
+async def list_partitions(session: AsyncSession) -> List[Partition]:
+    """Return the attached range partitions, oldest first."""
+    result = await session.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    partitions = []
+    for name, bound in result:
+        match = BOUND_PATTERN.search(bound or "")
+        if match:
+            start, end = (datetime.fromisoformat(value) for value in match.groups())
+            partitions.append(Partition(name, start, end))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+async def create_partition(session: AsyncSession, start: date, end: date) -> str:
+    """Create and attach the partition for [start, end).
+
+    Rows for the range already sitting in the default partition are moved
+    into the new table first, otherwise the attach would be refused.
+    """
+    name = partition_name(start)
+    await session.execute(text(
+        f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    await session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE timestamp >= :start AND timestamp < :end "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start": start, "end": end},
+    )
+    await session.execute(text(
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+    return name
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    today: date,
+    ahead_days: int,
+    width_days: int,
+) -> List[str]:
+    """Create the default partition and any missing ones through ``today + ahead_days``.
+
+    Never creates partitions older than the oldest existing one, so
+    backfilled history stays in the default partition. Does not commit.
+    """
+    await session.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+    existing = await list_partitions(session)
+    covered = {partition.start.date() for partition in existing}
+    start = period_start(today, width_days)
+    if existing:
+        start = max(start, existing[-1].end.date())
+    created = []
+    while start <= today + timedelta(days=ahead_days):
+        end = start + timedelta(days=width_days)
+        if start not in covered:
+            created.append(await create_partition(session, start, end))
+        start = end
+    return created
+
+
+async def expire_partitions(session: AsyncSession, cutoff: datetime) -> List[str]:
+    """Drop partitions ending at or before ``cutoff``. Does not commit.
+
+    Their rows were counted into the hourly rollups when inserted. Expired
+    rows in the default partition are deleted too.
+    """
+    dropped = []
+    for partition in await list_partitions(session):
+        if partition.end > cutoff:
+            break
+        await session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"))
+        await session.execute(text(f"DROP TABLE {partition.name}"))
+        dropped.append(partition.name)
+
+    await session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE timestamp < :cutoff"), {"cutoff": cutoff})
+    return dropped
+
+
+async def trim_minute_rollups(session: AsyncSession, cutoff: datetime) -> None:
+    """Delete minute counts older than ``cutoff``; hourly counts are kept. Does not commit."""
+    await session.execute(
+        text(f"DELETE FROM {EventMinuteRollup.__tablename__} WHERE bucket < :cutoff"), {"cutoff": cutoff}
+    )
+
+
+class EventPartitionMaintainer:
+    """Background job creating upcoming event partitions and expiring old ones."""
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        width_days: int,
+        ahead_days: int,
+        retention_days: int,
+        minute_rollup_days: int,
+        session_factory=async_session,
+    ):
+        self.interval_seconds = interval_seconds
+        self.width_days = width_days
+        self.ahead_days = ahead_days
+        self.retention_days = retention_days
+        self.minute_rollup_days = minute_rollup_days
+        self.session_factory = session_factory
+        self._trigger_installed = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self, now: Optional[datetime] = None) -> dict:
+        """Run one maintenance pass in its own transaction."""
+        now = now or datetime.utcnow()
+        async with self.session_factory() as session:
+            await session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+            if not self._trigger_installed:
+                await ensure_rollup_trigger(session)
+            created = await ensure_partitions(session, now.date(), self.ahead_days, self.width_days)
+            dropped = []
+            if self.retention_days > 0:
+                dropped = await expire_partitions(session, now - timedelta(days=self.retention_days))
+            await trim_minute_rollups(session, now - timedelta(days=self.minute_rollup_days))
+            await session.commit()
+        self._trigger_installed = True
+        if created or dropped:
+            logger.info("Event partitions created %s, dropped %s", created, dropped)
+        return {"created": created, "dropped": dropped}
+
+    def start(self) -> None:
+        """Start the background loop if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Event partition maintenance failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+event_partitions = EventPartitionMaintainer(
+    interval_seconds=settings.EVENT_MAINTENANCE_SECONDS,
+    width_days=settings.EVENT_PARTITION_DAYS,
+    ahead_days=settings.EVENT_PARTITIONS_AHEAD_DAYS,
+    retention_days=settings.EVENT_RETENTION_DAYS,
+    minute_rollup_days=settings.EVENT_MINUTE_ROLLUP_DAYS,
+)
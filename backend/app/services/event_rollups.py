@@ -0,0 +1,88 @@
+"""
+Incrementally maintained event counts.
+A statement-level trigger on events folds every inserted batch into the
+minute and hourly rollup tables inside the inserting transaction, whichever
+path wrote it (ORM, write-behind buffer or COPY import). Stats reads then
+aggregate a few rollup rows per bucket instead of raw events.
+"""
+
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event_rollup import NO_ASSET, NO_SEVERITY, EventMinuteRollup, EventRollup
+
+# Stats bucket sizes and the rollup table each is read from
+BUCKET_TABLES = {"1m": EventMinuteRollup, "1h": EventRollup}
+
+GROUP_BY_COLUMNS = ("event_type", "severity", "asset_id")
+
+
+def _upsert_counts(table: str, unit: str) -> str:
+    # Sorted so concurrent batches lock shared counter rows in the same order
+    return f"""
+    INSERT INTO {table} (bucket, event_type, severity, asset_id, event_count)
+    SELECT date_trunc('{unit}', timestamp), event_type, coalesce(severity, '{NO_SEVERITY}'),
+           coalesce(asset_id, '{NO_ASSET}'), count(*)
+    FROM new_events GROUP BY 1, 2, 3, 4 ORDER BY 1, 2, 3, 4
+    ON CONFLICT (bucket, event_type, severity, asset_id)
+    DO UPDATE SET event_count = {table}.event_count + EXCLUDED.event_count;"""
+
+
+ROLLUP_TRIGGER_DDL = (
+    f"""CREATE OR REPLACE FUNCTION count_inserted_events() RETURNS TRIGGER AS $$
+BEGIN{_upsert_counts(EventMinuteRollup.__tablename__, "minute")}{_upsert_counts(EventRollup.__tablename__, "hour")}
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS count_inserted_events ON events",
+    """CREATE TRIGGER count_inserted_events
+    AFTER INSERT ON events
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION count_inserted_events()""",
+)
+
+
+async def ensure_rollup_trigger(session: AsyncSession) -> None:
+    """Install or replace the counting trigger on events. Does not commit."""
+    for statement in ROLLUP_TRIGGER_DDL:
+        await session.execute(text(statement))
+
+
+def stats_query(
+    bucket: str,
+    group_by: Sequence[str],
+    start: datetime,
+    end: datetime,
+    event_type: Optional[str] = None,
+    severity: Optional[str] = None,
+    asset_id: Optional[UUID] = None,
+) -> Select:
+    """Build the time-bucketed count query over the rollup table for ``bucket``.
+
+    Sentinel severity and asset values come back as NULL.
+    """
+    model = BUCKET_TABLES[bucket]
+    output = {
+        "event_type": model.event_type,
+        "severity": func.nullif(model.severity, NO_SEVERITY),
+        "asset_id": func.nullif(model.asset_id, literal_column(f"'{NO_ASSET}'::uuid")),
+    }
+    columns = [output[name].label(name) for name in group_by]
+    stmt = (
+        select(model.bucket, *columns, func.sum(model.event_count).label("count"))
+        .where(model.bucket >= start, model.bucket < end)
+        .group_by(model.bucket, *[getattr(model, name) for name in group_by])
+        .order_by(model.bucket, *columns)
+    )
+    if event_type:
+        stmt = stmt.where(model.event_type == event_type)
+    if severity:
+        stmt = stmt.where(model.severity == severity)
+    if asset_id:
+        stmt = stmt.where(model.asset_id == asset_id)
+    return stmt
@@ -0,0 +1,34 @@
+"""
+Streaming NDJSON export of large tables.
+Rows are read through a server-side cursor in fixed-size partitions and
+written out as they arrive, so memory stays constant however many rows
+match.
+"""
+
+from typing import AsyncIterator
+
+import orjson
+from sqlalchemy import Select
+
+from app.database import async_session
+
+EXPORT_BATCH_SIZE = 2000
+
+
+async def stream_ndjson(
+    stmt: Select,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    session_factory=async_session,
+) -> AsyncIterator[bytes]:
+    """Yield NDJSON chunks for a Core select, one partition at a time.
+
+    Opens its own session because the response body is produced after the
+    request's dependencies have been torn down.
+    """
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield b"".join(
+                orjson.dumps(row._asdict(), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+                for row in partition
+            )
@@ -0,0 +1,264 @@
+"""
+Incrementally maintained threat scores for enemy assets.
+The asset index reports every change; only enemies that moved, changed
+status, or had a friendly move within range of them are marked dirty, and
+the dirty set is rescored in one vectorized pass on the next read.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.services.asset_index import AssetIndex, IndexedAsset, asset_index
+from app.utils.geo import distance_matrix_km, haversine_km
+
+# Friendlies further away than this add nothing to an enemy's threat
+THREAT_RADIUS_KM = 100.0
+
+# Proximity is averaged over this many nearest friendlies
+NEAREST_FRIENDLIES = 3
+
+# Speeds at or above this count as fully threatening movement
+MAX_SPEED_KMH = 200.0
+
+# An enemy not seen moving for this long is treated as stationary
+SPEED_WINDOW = timedelta(seconds=60)
+
+# Share of the score driven by proximity; movement makes up the rest
+PROXIMITY_SHARE = 0.7
+
+TYPE_WEIGHTS = {"drone": 1.0, "vehicle": 0.8, "sensor": 0.5, "camera": 0.4}
+DEFAULT_TYPE_WEIGHT = 0.6
+
+STATUS_WEIGHTS = {"maintenance": 0.5, "offline": 0.2}
+
+# Enemy rows per distance block, bounding memory to about 32 MB of float64
+SCORE_BLOCK_PAIRS = 4_000_000
+
+
+@dataclass
+class ThreatScore:
+    """Latest score of one enemy and the inputs that produced it."""
+    score: float
+    speed_kmh: float
+    nearest_friendly_id: Optional[UUID]
+    nearest_friendly_km: Optional[float]
+
+
+def score_threats(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    weights: np.ndarray,
+    speed_kmh: np.ndarray,
+    friendly_lat: np.ndarray,
+    friendly_lon: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score enemies against every friendly.
+
+    Returns (scores, nearest friendly row or -1, nearest distance in km or inf).
+    """
+    count = len(lat)
+    scores = np.zeros(count)
+    nearest = np.full(count, -1, dtype=np.intp)
+    nearest_km = np.full(count, np.inf)
+    movement = np.minimum(speed_kmh / MAX_SPEED_KMH, 1.0)
+
+    num_friendlies = len(friendly_lat)
+    k = min(NEAREST_FRIENDLIES, num_friendlies)
+    block = max(1, SCORE_BLOCK_PAIRS // max(1, num_friendlies))
+    for start in range(0, count, block):
+        stop = min(start + block, count)
+        proximity = np.zeros(stop - start)
+        if k:
+            distances = distance_matrix_km(lat[start:stop], lon[start:stop], friendly_lat, friendly_lon)
+            nearest[start:stop] = distances.argmin(axis=1)
+            nearest_km[start:stop] = distances[np.arange(stop - start), nearest[start:stop]]
+            if k < num_friendlies:
+                distances = np.partition(distances, k - 1, axis=1)[:, :k]
+            closeness = np.clip(1.0 - distances / THREAT_RADIUS_KM, 0.0, 1.0)
+            proximity = closeness.sum(axis=1) / NEAREST_FRIENDLIES
+        scores[start:stop] = proximity * PROXIMITY_SHARE + movement[start:stop] * (1.0 - PROXIMITY_SHARE)
+
+    scores *= 100.0 * weights
+    return scores, nearest, nearest_km
+
+
+def within_radius(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    point_lat: np.ndarray,
+    point_lon: np.ndarray,
+    radius_km: float,
+) -> np.ndarray:
+    """Mask of positions within ``radius_km`` of any of the given points."""
+    mask = np.zeros(len(lat), dtype=bool)
+    if len(point_lat) == 0:
+        return mask
+    block = max(1, SCORE_BLOCK_PAIRS // len(point_lat))
+    for start in range(0, len(lat), block):
+        stop = min(start + block, len(lat))
+        distances = distance_matrix_km(lat[start:stop], lon[start:stop], point_lat, point_lon)
+        mask[start:stop] = (distances <= radius_km).any(axis=1)
+    return mask
+
+
+class ThreatScores:
+    """Threat scores of indexed enemies, kept current from index change events."""
+
+    def __init__(self, index: AssetIndex = asset_index):
+        self.index = index
+        self.scores: Dict[UUID, ThreatScore] = {}
+        self.rescored = 0
+        self._dirty: Set[UUID] = set()
+        self._friendly_moves: List[Tuple[float, float]] = []
+        self._rescore_all = False
+        self._speeds: Dict[UUID, float] = {}
+        self._last_fix: Dict[UUID, Tuple[float, float, datetime]] = {}
+        self._ranking: Optional[List[Tuple[UUID, ThreatScore]]] = None
+        self._generation: Optional[int] = None
+        self._lock = asyncio.Lock()
+        index.subscribe(self._asset_changed)
+
+    def _asset_changed(self, asset_id: UUID, previous: Optional[IndexedAsset], current: Optional[IndexedAsset]) -> None:
+        # A friendly only affects enemies within the threat radius of where it
+        # was or is; those are found in bulk on the next refresh
+        moved = (
+            previous is None or current is None
+            or (previous.lat, previous.lon, previous.is_friendly) != (current.lat, current.lon, current.is_friendly)
+        )
+        if moved and not self._rescore_all:
+            for entry in (previous, current):
+                if entry is not None and entry.is_friendly:
+                    self._friendly_moves.append((entry.lat, entry.lon))
+            if self._friendly_moves and len(self._friendly_moves) >= len(self.index.friendlies):
+                # Filtering would cost as much as rescoring every enemy, so
+                # stop collecting moves until the next refresh
+                self._friendly_moves = []
+                self._rescore_all = True
+
+        if current is None or current.is_friendly:
+            self._forget(asset_id)
+            return
+        if previous is None or (previous.lat, previous.lon) != (current.lat, current.lon):
+            self._record_fix(asset_id, current.lat, current.lon, current.last_seen)
+        self._dirty.add(asset_id)
+
+    def _record_fix(self, asset_id: UUID, lat: float, lon: float, seen_at: Optional[datetime]) -> None:
+        """Estimate speed from the report times of successive position changes.
+
+        Falls back to the arrival time when a report carries no usable
+        timestamp, such as an edit that did not touch ``last_seen``.
+        """
+        last = self._last_fix.get(asset_id)
+        if seen_at is None or (last is not None and seen_at <= last[2]):
+            seen_at = datetime.utcnow()
+        if last is not None and seen_at > last[2]:
+            hours = (seen_at - last[2]).total_seconds() / 3600.0
+            self._speeds[asset_id] = haversine_km(last[0], last[1], lat, lon) / hours
+        self._last_fix[asset_id] = (lat, lon, seen_at)
+
+    def _expire_speeds(self, now: datetime) -> None:
+        """Zero the speed of enemies with no move inside SPEED_WINDOW and rescore them."""
+        cutoff = now - SPEED_WINDOW
+        for asset_id in [asset_id for asset_id in self._speeds if self._last_fix[asset_id][2] < cutoff]:
+            del self._speeds[asset_id]
+            self._dirty.add(asset_id)
+
+    def _forget(self, asset_id: UUID) -> None:
+        self._dirty.discard(asset_id)
+        self._speeds.pop(asset_id, None)
+        self._last_fix.pop(asset_id, None)
+        if self.scores.pop(asset_id, None) is not None:
+            self._ranking = None
+
+    async def refresh(self) -> int:
+        """Rescore dirty enemies off the event loop; returns how many were rescored."""
+        async with self._lock:
+            if self._generation != self.index.generation:
+                # The index was reloaded wholesale; nothing carried over is trustworthy
+                self._generation = self.index.generation
+                self.scores.clear()
+                self._ranking = None
+                self._friendly_moves = []
+                self._rescore_all = True
+            if self._rescore_all:
+                self._rescore_all = False
+                self._friendly_moves = []
+                self._dirty = {
+                    asset_id for asset_id, entry in self.index.assets.items() if not entry.is_friendly
+                }
+            if self._friendly_moves:
+                await self._mark_near_friendly_moves()
+            self._expire_speeds(datetime.utcnow())
+            if not self._dirty:
+                return 0
+
+            dirty, self._dirty = self._dirty, set()
+            enemies = [
+                (asset_id, entry) for asset_id in dirty
+                if (entry := self.index.assets.get(asset_id)) is not None and not entry.is_friendly
+            ]
+            if not enemies:
+                return 0
+
+            friendlies = self.index.friendlies
+            size = len(friendlies)
+            friendly_ids = list(friendlies.keys)
+            lat = np.array([entry.lat for _, entry in enemies], dtype=np.float64)
+            lon = np.array([entry.lon for _, entry in enemies], dtype=np.float64)
+            weights = np.array([
+                TYPE_WEIGHTS.get(entry.asset_type, DEFAULT_TYPE_WEIGHT) * STATUS_WEIGHTS.get(entry.status, 1.0)
+                for _, entry in enemies
+            ])
+            speeds = np.array([self._speeds.get(asset_id, 0.0) for asset_id, _ in enemies])
+
+            scores, nearest, nearest_km = await asyncio.to_thread(
+                score_threats, lat, lon, weights, speeds, friendlies.lat[:size].copy(), friendlies.lon[:size].copy()
+            )
+
+            for i, (asset_id, _) in enumerate(enemies):
+                # Enemies removed while scoring were already forgotten
+                if asset_id not in self.index.assets:
+                    continue
+                found = nearest[i] >= 0
+                self.scores[asset_id] = ThreatScore(
+                    score=float(scores[i]),
+                    speed_kmh=float(speeds[i]),
+                    nearest_friendly_id=friendly_ids[nearest[i]] if found else None,
+                    nearest_friendly_km=float(nearest_km[i]) if found else None,
+                )
+            self._ranking = None
+            self.rescored += len(enemies)
+            return len(enemies)
+
+    async def _mark_near_friendly_moves(self) -> None:
+        moves, self._friendly_moves = self._friendly_moves, []
+        candidates = [
+            (asset_id, entry) for asset_id, entry in self.index.assets.items()
+            if not entry.is_friendly and asset_id not in self._dirty
+        ]
+        if not candidates:
+            return
+        points = np.array(moves, dtype=np.float64)
+        mask = await asyncio.to_thread(
+            within_radius,
+            np.array([entry.lat for _, entry in candidates], dtype=np.float64),
+            np.array([entry.lon for _, entry in candidates], dtype=np.float64),
+            points[:, 0],
+            points[:, 1],
+            THREAT_RADIUS_KM,
+        )
+        self._dirty.update(candidates[i][0] for i in np.flatnonzero(mask))
+
+    def ranked(self) -> List[Tuple[UUID, ThreatScore]]:
+        """Return (asset_id, score) pairs, highest threat first."""
+        if self._ranking is None:
+            self._ranking = sorted(self.scores.items(), key=lambda item: item[1].score, reverse=True)
+        return self._ranking
+
+
+threat_scores = ThreatScores()
@@ -0,0 +1,134 @@
+"""
+Packed binary map tiles of asset positions.
+Tiles are built from the assets table on demand, cached per (z, x, y) and
+dropped when an asset inside them moves or changes status.
+
+Tile layout (little-endian):
+    header  4s magic b"AST1", uint16 record size, uint32 record count
+    record  16s asset UUID bytes, float32 lat, float32 lon,
+            uint8 status code, uint8 flags (bit 0 = friendly)
+"""
+
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.services.asset_index import ASSET_STATUS_CODES, IndexedAsset, asset_index
+from app.utils.geo import point_to_tile
+
+TILE_MAGIC = b"AST1"
+MAX_TILE_ZOOM = 18
+
+HEADER = struct.Struct("<4sHI")
+RECORD_DTYPE = np.dtype([
+    ("id", "S16"),
+    ("lat", "<f4"),
+    ("lon", "<f4"),
+    ("status", "u1"),
+    ("flags", "u1"),
+])
+FLAG_FRIENDLY = 0x01
+
+TileKey = Tuple[int, int, int]
+
+
+def pack_tile(rows: Iterable) -> bytes:
+    """Pack (id, lat, lon, status, is_friendly) rows into tile bytes."""
+    records = np.array(
+        [
+            (
+                asset_id.bytes,
+                lat,
+                lon,
+                ASSET_STATUS_CODES.get(status, 255),
+                FLAG_FRIENDLY if is_friendly is not False else 0,
+            )
+            for asset_id, lat, lon, status, is_friendly in rows
+        ],
+        dtype=RECORD_DTYPE,
+    )
+    return HEADER.pack(TILE_MAGIC, RECORD_DTYPE.itemsize, len(records)) + records.tobytes()
+
+
+class TileCache:
+    """Bounded LRU cache of packed tiles with per-tile invalidation.
+
+    ``version`` counts invalidations; each tile remembers the count at which
+    it was last invalidated, so a build only loses its race against changes
+    inside that tile. Stamps are kept for ``max_stamps`` tiles, and a build
+    older than the newest forgotten stamp is never cached.
+    """
+
+    def __init__(self, max_tiles: int = 4096, max_stamps: int = 65536):
+        self.max_tiles = max_tiles
+        self.max_stamps = max_stamps
+        self._tiles: "OrderedDict[TileKey, Tuple[bytes, str]]" = OrderedDict()
+        self.version = 0
+        self._stamps: "OrderedDict[TileKey, int]" = OrderedDict()
+        self._stamp_floor = 0
+        self._generation = asset_index.generation
+        asset_index.subscribe(self._asset_changed)
+
+    def get(self, key: TileKey) -> Optional[Tuple[bytes, str]]:
+        """Return the cached (payload, etag) for a tile."""
+        if self._generation != asset_index.generation:
+            self.clear()
+            self._generation = asset_index.generation
+            return None
+        entry = self._tiles.get(key)
+        if entry is not None:
+            self._tiles.move_to_end(key)
+        return entry
+
+    def put(self, key: TileKey, payload: bytes, version: int) -> Tuple[bytes, str]:
+        """Cache a freshly built tile and return it with its ETag.
+
+        ``version`` is the cache version read before the tile was queried; if
+        this tile was invalidated in between it is served but not cached.
+        """
+        entry = (payload, f'"{zlib.crc32(payload):08x}-{len(payload)}"')
+        if self._stamps.get(key, self._stamp_floor) > version:
+            return entry
+        self._tiles[key] = entry
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return entry
+
+    def invalidate_point(self, lat: float, lon: float) -> None:
+        """Drop every cached tile containing a point."""
+        self.version += 1
+        for z in range(MAX_TILE_ZOOM + 1):
+            key = (z, *point_to_tile(lat, lon, z))
+            self._tiles.pop(key, None)
+            self._stamps[key] = self.version
+            self._stamps.move_to_end(key)
+        while len(self._stamps) > self.max_stamps:
+            _, stamp = self._stamps.popitem(last=False)
+            self._stamp_floor = max(self._stamp_floor, stamp)
+
+    def clear(self) -> None:
+        """Drop all cached tiles."""
+        self.version += 1
+        self._tiles.clear()
+        self._stamps.clear()
+        self._stamp_floor = self.version
+
+    def _asset_changed(self, asset_id: UUID, previous: Optional[IndexedAsset], current: Optional[IndexedAsset]) -> None:
+        # Only the fields packed into tile records matter
+        if previous is not None and current is not None and (
+            (previous.lat, previous.lon, previous.status, previous.is_friendly)
+            == (current.lat, current.lon, current.status, current.is_friendly)
+        ):
+            return
+        if previous is not None:
+            self.invalidate_point(previous.lat, previous.lon)
+        if current is not None and (previous is None or (previous.lat, previous.lon) != (current.lat, current.lon)):
+            self.invalidate_point(current.lat, current.lon)
+
+
+tile_cache = TileCache()
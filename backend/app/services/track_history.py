@@ -0,0 +1,28 @@
+"""
+Append-only asset position history.
+Position samples are written in the same transaction as the asset change
+that produced them, batched into a single multi-row insert.
+"""
+
+from datetime import datetime
+from typing import Iterable, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.asset_position import AssetPosition
+
+PositionSample = Tuple[UUID, float, float, datetime]
+
+
+async def record_positions(session: AsyncSession, samples: Iterable[PositionSample]) -> int:
+    """Queue position samples for insert in the current transaction."""
+    rows = [
+        {"asset_id": asset_id, "lat": lat, "lon": lon, "recorded_at": recorded_at}
+        for asset_id, lat, lon, recorded_at in samples
+        if lat is not None and lon is not None
+    ]
+    if rows:
+        await session.execute(insert(AssetPosition.__table__), rows)
+    return len(rows)
@@ -0,0 +1,183 @@
+"""
+Hierarchical grid clustering of map markers.
+Every point contributes to one cell per zoom level, and the per-cell
+aggregates are maintained on insert/move/remove, so answering a viewport
+query only reads the cells that overlap it.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Cells per tile edge; a zoom-z cell spans 360 / 2**z / CELLS_PER_TILE degrees
+CELLS_PER_TILE = 4
+
+Cell = Tuple[int, int]
+
+
+@dataclass
+class ClusterCell:
+    """Running aggregate for one grid cell; enemy figures are totals minus friendly ones."""
+    count: int = 0
+    friendly_count: int = 0
+    lat_sum: float = 0.0
+    lon_sum: float = 0.0
+    serial_xor: int = 0
+    friendly_lat_sum: float = 0.0
+    friendly_lon_sum: float = 0.0
+    friendly_serial_xor: int = 0
+
+
+@dataclass
+class Cluster:
+    """A cluster of points returned to the caller."""
+    lat: float
+    lon: float
+    count: int
+    friendly_count: int
+    enemy_count: int
+    key: Optional[Hashable] = None
+
+
+class ClusterGrid:
+    """Per-zoom-level cell aggregates over keyed points."""
+
+    def __init__(self, max_zoom: int = 14):
+        self.max_zoom = max_zoom
+        self._cell_sizes = [360.0 / (2 ** zoom) / CELLS_PER_TILE for zoom in range(max_zoom)]
+        self._levels: List[Dict[Cell, ClusterCell]] = [{} for _ in range(max_zoom)]
+        self._points: Dict[Hashable, Tuple[float, float, bool, int]] = {}
+        self._keys: Dict[int, Hashable] = {}
+        self._next_serial = 1
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell(self, zoom: int, lat: float, lon: float) -> Cell:
+        size = self._cell_sizes[zoom]
+        columns = int(math.ceil(360.0 / size))
+        return int(math.floor((lat + 90.0) / size)), int(math.floor((lon + 180.0) / size)) % columns
+
+    def insert(self, key: Hashable, lat: float, lon: float, is_friendly: bool = True) -> None:
+        """Insert or move a point."""
+        previous = self._points.get(key)
+        if previous is not None and previous[:3] == (lat, lon, is_friendly):
+            return
+        self.remove(key)
+
+        # Each cell XORs the serials of its members, which yields the key
+        # of a lone member directly without keeping per-cell member sets.
+        serial = self._next_serial
+        self._next_serial += 1
+        self._keys[serial] = key
+        self._points[key] = (lat, lon, is_friendly, serial)
+        for zoom, level in enumerate(self._levels):
+            cell = level.setdefault(self._cell(zoom, lat, lon), ClusterCell())
+            cell.count += 1
+            cell.friendly_count += 1 if is_friendly else 0
+            cell.lat_sum += lat
+            cell.lon_sum += lon
+            cell.serial_xor ^= serial
+            if is_friendly:
+                cell.friendly_lat_sum += lat
+                cell.friendly_lon_sum += lon
+                cell.friendly_serial_xor ^= serial
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a point if present."""
+        previous = self._points.pop(key, None)
+        if previous is None:
+            return
+        lat, lon, is_friendly, serial = previous
+        del self._keys[serial]
+        for zoom, level in enumerate(self._levels):
+            cell_key = self._cell(zoom, lat, lon)
+            cell = level[cell_key]
+            cell.count -= 1
+            if cell.count == 0:
+                del level[cell_key]
+                continue
+            cell.friendly_count -= 1 if is_friendly else 0
+            cell.lat_sum -= lat
+            cell.lon_sum -= lon
+            cell.serial_xor ^= serial
+            if is_friendly:
+                cell.friendly_lat_sum -= lat
+                cell.friendly_lon_sum -= lon
+                cell.friendly_serial_xor ^= serial
+
+    def clear(self) -> None:
+        """Drop all points."""
+        self._points.clear()
+        self._keys.clear()
+        for level in self._levels:
+            level.clear()
+
+    def query(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        zoom: int,
+        is_friendly: Optional[bool] = None,
+    ) -> List[Cluster]:
+        """Return the clusters for a bounding box at a zoom level, optionally for one side.
+
+        Single-point clusters carry the point key so callers can render them
+        as individual markers.
+        """
+        zoom = max(0, min(zoom, self.max_zoom - 1))
+        level = self._levels[zoom]
+        size = self._cell_sizes[zoom]
+        columns = int(math.ceil(360.0 / size))
+        min_row, min_col = self._cell(zoom, max(-90.0, min_lat), min_lon)
+        max_row, _ = self._cell(zoom, min(90.0, max_lat), max_lon)
+        col_span = int(math.floor((max_lon + 180.0) / size)) - int(math.floor((min_lon + 180.0) / size))
+        col_span = min(col_span, columns - 1)
+
+        if (max_row - min_row + 1) * (col_span + 1) > len(level):
+            cells = [
+                (cell_key, cell)
+                for cell_key, cell in level.items()
+                if min_row <= cell_key[0] <= max_row and (cell_key[1] - min_col) % columns <= col_span
+            ]
+        else:
+            cells = []
+            for row in range(min_row, max_row + 1):
+                for offset in range(col_span + 1):
+                    cell_key = (row, (min_col + offset) % columns)
+                    cell = level.get(cell_key)
+                    if cell is not None:
+                        cells.append((cell_key, cell))
+
+        clusters = []
+        for _, cell in cells:
+            count, lat_sum, lon_sum, serial_xor = cell.count, cell.lat_sum, cell.lon_sum, cell.serial_xor
+            if is_friendly is True:
+                count, lat_sum, lon_sum, serial_xor = (
+                    cell.friendly_count, cell.friendly_lat_sum, cell.friendly_lon_sum, cell.friendly_serial_xor
+                )
+            elif is_friendly is False:
+                count = cell.count - cell.friendly_count
+                lat_sum -= cell.friendly_lat_sum
+                lon_sum -= cell.friendly_lon_sum
+                serial_xor ^= cell.friendly_serial_xor
+            if count == 0:
+                continue
+            if count == 1:
+                key = self._keys[serial_xor]
+                lat, lon, _, _ = self._points[key]
+            else:
+                key = None
+                lat, lon = lat_sum / count, lon_sum / count
+            friendly_count = cell.friendly_count if is_friendly is None else (count if is_friendly else 0)
+            clusters.append(Cluster(
+                lat=lat,
+                lon=lon,
+                count=count,
+                friendly_count=friendly_count,
+                enemy_count=count - friendly_count,
+                key=key,
+            ))
+        return clusters
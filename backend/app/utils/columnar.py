@@ -0,0 +1,41 @@
+"""
+Columnar (struct-of-arrays) encoding of asset snapshots.
+Parallel arrays replace one object per asset, so keys are not repeated and
+the client can load coordinates straight into typed arrays.
+"""
+
+import base64
+from typing import Sequence
+
+import numpy as np
+
+from app.services.asset_index import ASSET_STATUS_CODES
+
+UNKNOWN_STATUS_CODE = 255
+
+
+def build_columnar(rows: Sequence) -> dict:
+    """Encode (id, lat, lon, status, is_friendly, ...) rows as parallel arrays.
+
+    Extra trailing columns (such as the pagination key) are ignored.
+    ``is_friendly`` is a base64 bitset, least significant bit first; missing
+    coordinates are null.
+    """
+    count = len(rows)
+    columns = list(zip(*rows))[:5] if count else [()] * 5
+    ids, lats, lons, statuses, friendly = (list(column) for column in columns)
+    is_friendly = np.fromiter((value is not False for value in friendly), dtype=bool, count=count)
+    return {
+        "format": "columnar",
+        "count": count,
+        "ids": ids,
+        "lat": np.array(lats, dtype=np.float64),
+        "lon": np.array(lons, dtype=np.float64),
+        "status": np.fromiter(
+            (ASSET_STATUS_CODES.get(status, UNKNOWN_STATUS_CODE) for status in statuses),
+            dtype=np.uint8,
+            count=count,
+        ),
+        "status_codes": ASSET_STATUS_CODES,
+        "is_friendly": base64.b64encode(np.packbits(is_friendly, bitorder="little").tobytes()).decode(),
+    }
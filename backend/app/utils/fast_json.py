@@ -0,0 +1,25 @@
+"""
+Fast JSON path for large list responses.
+Rows are selected as plain tuples and serialized with orjson, skipping ORM
+hydration and per-row Pydantic validation. The row keys already match the
+response schemas because those mirror the table columns.
+"""
+
+from typing import Any, Iterable, List
+
+import orjson
+from fastapi.responses import Response
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def rows_to_dicts(rows: Iterable) -> List[dict]:
+    """Convert Core result rows to plain dicts keyed by column name."""
+    return [row._asdict() for row in rows]
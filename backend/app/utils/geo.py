@@ -0,0 +1,90 @@
+"""
+Geospatial helper functions for the GeoMap Simulation API.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_km_array(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized great-circle distances in kilometres from one point to many."""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(lons) - math.radians(lon)
+    a = np.sin(d_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def distance_matrix_km(lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    """Great-circle distances in kilometres between every pair of two point sets.
+
+    Points are mapped to unit vectors so the pairwise step is one matrix
+    product; half the chord length is the sine of half the arc.
+    """
+    def unit_vectors(lats, lons):
+        phi = np.radians(np.asarray(lats, dtype=np.float64))
+        lam = np.radians(np.asarray(lons, dtype=np.float64))
+        cos_phi = np.cos(phi)
+        return np.column_stack((cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)))
+
+    # Work in place: these matrices can hold tens of millions of entries
+    distances = unit_vectors(lats1, lons1) @ unit_vectors(lats2, lons2).T
+    distances *= -0.5
+    distances += 0.5
+    np.clip(distances, 0.0, 1.0, out=distances)
+    np.sqrt(distances, out=distances)
+    np.arcsin(distances, out=distances)
+    distances *= 2 * EARTH_RADIUS_KM
+    return distances
+
+
+def radius_bbox(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """Bounding box (min_lat, min_lon, max_lat, max_lon) enclosing a radius around a point."""
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    min_lat = max(-90.0, lat - d_lat)
+    max_lat = min(90.0, lat + d_lat)
+
+    # Longitude degrees shrink towards the poles; use the widest latitude in the box
+    widest = max(abs(min_lat), abs(max_lat))
+    cos_lat = math.cos(math.radians(widest))
+    if cos_lat < 1e-6:
+        return min_lat, -180.0, max_lat, 180.0
+    d_lon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if d_lon >= 180.0:
+        return min_lat, -180.0, max_lat, 180.0
+    return min_lat, lon - d_lon, max_lat, lon + d_lon
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """Bounds (min_lat, min_lon, max_lat, max_lon) of a Web Mercator XYZ tile."""
+    n = 2 ** z
+    min_lon = x / n * 360.0 - 180.0
+    max_lon = (x + 1) / n * 360.0 - 180.0
+    max_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    min_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def point_to_tile(lat: float, lon: float, z: int) -> Tuple[int, int]:
+    """XYZ tile (x, y) containing a point at zoom z."""
+    n = 2 ** z
+    lat = max(-85.05112878, min(85.05112878, lat))
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
@@ -0,0 +1,104 @@
+"""
+Filters on JSONB document columns.
+Expressions such as ``extra_data.battery_level<20`` or
+``details.threshold_exceeded=battery`` compile as follows:
+
+- equality becomes containment (``@>``), served by the jsonb_path_ops GIN index
+- range comparisons on a column's declared numeric keys become a comparison
+  on ``(column->>'key')::numeric``, served by a btree expression index
+- any other comparison becomes a jsonpath predicate (``@@``), which the GIN
+  index cannot serve, so it is evaluated row by row
+"""
+
+import json
+import math
+import re
+from typing import Any, Collection, Dict, List, Optional
+
+from sqlalchemy import Boolean, Numeric, cast, literal, literal_column
+from sqlalchemy.dialects.postgresql import JSONPATH
+from sqlalchemy.sql.elements import ColumnElement
+
+FILTER_PATTERN = re.compile(
+    r"^(?P<column>[a-z_]+)\.(?P<path>[A-Za-z0-9_\-]+(?:\.[A-Za-z0-9_\-]+)*)"
+    r"(?P<op><=|>=|!=|=|<|>)(?P<value>.*)$"
+)
+
+# jsonpath spellings of the comparison operators
+JSONPATH_OPERATORS = {"!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+
+RANGE_OPERATORS = {"<": "__lt__", "<=": "__le__", ">": "__gt__", ">=": "__ge__"}
+
+KEY_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def json_number(column, key: str) -> ColumnElement:
+    """``(column->>'key')::numeric``, spelled identically for indexes and filters.
+
+    The key is inlined so the planner can match the expression index. Only
+    declare keys whose values are always numbers, or the cast fails.
+    """
+    if not KEY_PATTERN.match(key):
+        raise ValueError(f"Invalid numeric key: {key}")
+    return cast(column.op("->>")(literal_column(f"'{key}'")), Numeric)
+
+
+def parse_value(raw: str) -> Any:
+    """Read a filter value as a JSON scalar, falling back to a bare string."""
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return raw
+    if isinstance(value, (dict, list)):
+        raise ValueError("Filter values must be scalars")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("Filter values must be finite numbers")
+    return value
+
+
+def jsonpath_predicate(path: List[str], op: str, value: Any) -> str:
+    """Render a jsonpath predicate such as ``$."battery_level" < 20``."""
+    keys = "".join(f".{json.dumps(key)}" for key in path)
+    return f"${keys} {JSONPATH_OPERATORS[op]} {json.dumps(value)}"
+
+
+def compile_filter(
+    expression: str,
+    columns: Dict[str, Any],
+    numeric_keys: Optional[Dict[str, Collection[str]]] = None,
+) -> ColumnElement:
+    """Compile one filter expression against the allowed JSONB ``columns``.
+
+    ``numeric_keys`` lists, per column, top-level keys with a numeric
+    expression index. Raises ValueError for malformed expressions or
+    columns not in ``columns``.
+    """
+    match = FILTER_PATTERN.match(expression.strip())
+    if match is None:
+        raise ValueError(f"Invalid filter: {expression}")
+    name = match.group("column")
+    if name not in columns:
+        raise ValueError(f"Cannot filter on {name}; allowed: {', '.join(sorted(columns))}")
+    column = columns[name]
+    path = match.group("path").split(".")
+    op = match.group("op")
+    value = parse_value(match.group("value"))
+
+    if op == "=":
+        document: Any = value
+        for key in reversed(path):
+            document = {key: document}
+        return column.contains(document)
+    numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if numeric and op in RANGE_OPERATORS and len(path) == 1 and path[0] in (numeric_keys or {}).get(name, ()):
+        return getattr(json_number(column, path[0]), RANGE_OPERATORS[op])(literal(value, Numeric))
+    return column.op("@@", return_type=Boolean)(cast(jsonpath_predicate(path, op, value), JSONPATH))
+
+
+def compile_filters(
+    expressions: List[str],
+    columns: Dict[str, Any],
+    numeric_keys: Optional[Dict[str, Collection[str]]] = None,
+) -> List[ColumnElement]:
+    """Compile several filter expressions; they are meant to be ANDed."""
+    return [compile_filter(expression, columns, numeric_keys) for expression in expressions]
@@ -0,0 +1,112 @@
+"""
+Keyset (cursor) pagination helpers.
+Pages are ordered newest first on (created_at, id), or on another
+timestamp column such as a partition key; a cursor encodes the last row of a page so the next page starts with an index seek instead of
+scanning and discarding an offset.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.timestamps import naive_utc
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a (created_at, id) position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def keyset_page(
+    stmt: Select,
+    model: Any,
+    cursor: Optional[str],
+    limit: int,
+    offset: int = 0,
+    column: Any = None,
+) -> Select:
+    """Order a statement by (created_at, id) descending and seek past a cursor.
+
+    ``column`` replaces created_at as the leading sort key. Fetches one extra
+    row so the caller can tell whether another page exists. ``offset`` is
+    only honoured without a cursor, for older clients.
+    """
+    column = model.created_at if column is None else column
+    stmt = stmt.order_by(column.desc(), model.id.desc())
+    if cursor:
+        position, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(column, model.id) < tuple_(position, row_id))
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.limit(limit + 1)
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    model: Any,
+    cursor: Optional[str],
+    limit: int,
+    offset: int = 0,
+    scalars: bool = True,
+    column: Any = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """Execute a keyset page and return (rows, next_cursor).
+
+    With ``scalars=False`` the Core rows are returned as-is, which is what
+    the fast serialization path wants.
+    """
+    column = model.created_at if column is None else column
+    result = await session.execute(keyset_page(stmt, model, cursor, limit, offset, column))
+    rows = result.scalars().all() if scalars else result.all()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(getattr(last, column.key), last.id)
+
+
+# Per-entity sync position: rows at or after the timestamp, or strictly after
+# (timestamp, id) when the previous page was cut off mid-timestamp.
+SyncPosition = Tuple[datetime, Optional[UUID]]
+
+
+def encode_watermark(positions: Dict[str, SyncPosition]) -> str:
+    """Encode per-entity sync positions as an opaque watermark."""
+    raw = json.dumps({
+        name: [created_at.isoformat(), str(row_id) if row_id else None]
+        for name, (created_at, row_id) in positions.items()
+    }, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_watermark(watermark: str, names: List[str]) -> Dict[str, SyncPosition]:
+    """Decode a watermark; a plain ISO timestamp applies to every entity."""
+    try:
+        since = naive_utc(datetime.fromisoformat(watermark))
+        return {name: (since, None) for name in names}
+    except ValueError:
+        pass
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(watermark + "=" * (-len(watermark) % 4)))
+        return {
+            name: (datetime.fromisoformat(raw[name][0]), UUID(raw[name][1]) if raw[name][1] else None)
+            for name in names
+        }
+    except (ValueError, KeyError, TypeError, IndexError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid watermark") from exc
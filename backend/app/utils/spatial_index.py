@@ -0,0 +1,203 @@
+"""
+In-memory spatial indexes over point coordinates.
+GridIndex buckets points into fixed-size lat/lon cells so radius queries only
+touch the cells overlapping the search area; PositionArrays keeps the same
+points in flat NumPy arrays for vectorized nearest-neighbour scans.
+"""
+
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.utils.geo import haversine_km, haversine_km_array, radius_bbox
+
+Cell = Tuple[int, int]
+
+
+class GridIndex:
+    """Uniform grid index mapping keys to (lat, lon) points."""
+
+    def __init__(self, cell_size_deg: float = 0.1):
+        self.cell_size = cell_size_deg
+        self._columns = int(math.ceil(360.0 / cell_size_deg))
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._points: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        row = int(math.floor((lat + 90.0) / self.cell_size))
+        col = int(math.floor((lon + 180.0) / self.cell_size)) % self._columns
+        return row, col
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        """Return the indexed position of a key."""
+        return self._points.get(key)
+
+    def insert(self, key: Hashable, lat: float, lon: float) -> None:
+        """Insert or move a point."""
+        previous = self._points.get(key)
+        if previous is not None:
+            old_cell = self._cell(*previous)
+            new_cell = self._cell(lat, lon)
+            if old_cell == new_cell:
+                self._points[key] = (lat, lon)
+                return
+            self._discard(key, old_cell)
+
+        self._points[key] = (lat, lon)
+        self._cells.setdefault(self._cell(lat, lon), set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a point if present."""
+        previous = self._points.pop(key, None)
+        if previous is not None:
+            self._discard(key, self._cell(*previous))
+
+    def clear(self) -> None:
+        """Drop all points."""
+        self._cells.clear()
+        self._points.clear()
+
+    def _discard(self, key: Hashable, cell: Cell) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._cells[cell]
+
+    def _cells_in_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> Iterator[Cell]:
+        min_row, min_col = self._cell(min_lat, min_lon)
+        max_row, max_col = self._cell(max_lat, max_lon)
+        col_span = int(math.floor((max_lon + 180.0) / self.cell_size)) - int(math.floor((min_lon + 180.0) / self.cell_size))
+        col_span = min(col_span, self._columns - 1)
+        row_span = max_row - min_row
+
+        # A huge search area touches more grid cells than there are occupied
+        # buckets, so walking the occupied buckets is cheaper.
+        if (row_span + 1) * (col_span + 1) > len(self._cells):
+            for row, col in list(self._cells):
+                if min_row <= row <= max_row and (col - min_col) % self._columns <= col_span:
+                    yield row, col
+            return
+
+        for row in range(min_row, max_row + 1):
+            for offset in range(col_span + 1):
+                cell = (row, (min_col + offset) % self._columns)
+                if cell in self._cells:
+                    yield cell
+
+    def query_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[Hashable]:
+        """Return keys whose points fall inside a bounding box."""
+        matches = []
+        for cell in self._cells_in_bbox(min_lat, min_lon, max_lat, max_lon):
+            for key in self._cells[cell]:
+                lat, lon = self._points[key]
+                if min_lat <= lat <= max_lat and _lon_within(lon, min_lon, max_lon):
+                    matches.append(key)
+        return matches
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[Hashable, float]]:
+        """Return (key, distance_km) pairs within a radius, nearest first."""
+        matches = []
+        for cell in self._cells_in_bbox(*radius_bbox(lat, lon, radius_km)):
+            for key in self._cells[cell]:
+                point_lat, point_lon = self._points[key]
+                distance = haversine_km(lat, lon, point_lat, point_lon)
+                if distance <= radius_km:
+                    matches.append((key, distance))
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+
+class PositionArrays:
+    """Struct-of-arrays store of keyed positions for vectorized distance math.
+
+    Rows are updated in place and removals swap the last row into the hole,
+    so the arrays stay dense without being rebuilt on every write.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.keys: List[Hashable] = []
+        self.lat = np.empty(capacity, dtype=np.float64)
+        self.lon = np.empty(capacity, dtype=np.float64)
+        self.code = np.empty(capacity, dtype=np.int8)
+        self._rows: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def upsert(self, key: Hashable, lat: float, lon: float, code: int = 0) -> None:
+        """Insert or update the row for a key."""
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self.keys)
+            if row == len(self.lat):
+                self._grow()
+            self.keys.append(key)
+            self._rows[key] = row
+        self.lat[row] = lat
+        self.lon[row] = lon
+        self.code[row] = code
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the row for a key if present."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = len(self.keys) - 1
+        if row != last:
+            moved = self.keys[last]
+            self.keys[row] = moved
+            self.lat[row] = self.lat[last]
+            self.lon[row] = self.lon[last]
+            self.code[row] = self.code[last]
+            self._rows[moved] = row
+        self.keys.pop()
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        self.keys.clear()
+        self._rows.clear()
+
+    def _grow(self) -> None:
+        capacity = max(1, len(self.lat)) * 2
+        for name in ("lat", "lon", "code"):
+            current = getattr(self, name)
+            grown = np.empty(capacity, dtype=current.dtype)
+            grown[: len(current)] = current
+            setattr(self, name, grown)
+
+    def nearest(self, lat: float, lon: float, k: int, code: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """Return the k nearest (key, distance_km) pairs, optionally filtered by code."""
+        size = len(self.keys)
+        if size == 0 or k <= 0:
+            return []
+        distances = haversine_km_array(lat, lon, self.lat[:size], self.lon[:size])
+        candidates = np.arange(size)
+        if code is not None:
+            candidates = np.flatnonzero(self.code[:size] == code)
+            distances = distances[candidates]
+        if len(candidates) == 0:
+            return []
+        if k < len(candidates):
+            top = np.argpartition(distances, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(distances[top], kind="stable")]
+        return [(self.keys[candidates[i]], float(distances[i])) for i in top]
+
+
+def _lon_within(lon: float, min_lon: float, max_lon: float) -> bool:
+    """Check a longitude against a range that may cross the antimeridian."""
+    if max_lon - min_lon >= 360.0:
+        return True
+    return (lon - min_lon) % 360.0 <= (max_lon - min_lon)
@@ -0,0 +1,15 @@
+"""
+Timestamp normalisation.
+Every stored timestamp is naive UTC (``TIMESTAMP WITHOUT TIME ZONE``), so
+aware values from clients are converted before they are compared or bound.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive UTC; naive values and None pass through."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
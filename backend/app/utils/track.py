@@ -0,0 +1,60 @@
+"""
+Track simplification helpers.
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+
+def _segment_deviation(x: np.ndarray, y: np.ndarray, start: int, end: int) -> tuple:
+    """Index and distance of the interior point furthest from a segment."""
+    px = x[start + 1:end]
+    py = y[start + 1:end]
+    dx = x[end] - x[start]
+    dy = y[end] - y[start]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0.0:
+        distances = np.hypot(px - x[start], py - y[start])
+    else:
+        t = np.clip(((px - x[start]) * dx + (py - y[start]) * dy) / length_sq, 0.0, 1.0)
+        distances = np.hypot(px - (x[start] + t * dx), py - (y[start] + t * dy))
+    offset = int(np.argmax(distances))
+    return start + 1 + offset, float(distances[offset])
+
+
+def simplify_track(lats: np.ndarray, lons: np.ndarray, max_points: int) -> np.ndarray:
+    """Douglas-Peucker simplification to a point budget.
+
+    Instead of a fixed tolerance, segments are split in order of their largest
+    deviation until ``max_points`` vertices are kept, so the result is the
+    most shape-preserving subset of that size. Returns sorted indices.
+    """
+    count = len(lats)
+    if count <= max_points:
+        return np.arange(count)
+    if max_points < 2:
+        return np.array([0, count - 1][:max(max_points, 0)], dtype=np.intp)
+
+    # Equirectangular projection is accurate enough for ranking deviations
+    scale = math.cos(math.radians(float(np.mean(lats))))
+    x = np.asarray(lons, dtype=np.float64) * scale
+    y = np.asarray(lats, dtype=np.float64)
+
+    keep = [0, count - 1]
+    heap = []
+
+    def push(start: int, end: int) -> None:
+        if end - start > 1:
+            index, distance = _segment_deviation(x, y, start, end)
+            heapq.heappush(heap, (-distance, start, end, index))
+
+    push(0, count - 1)
+    while heap and len(keep) < max_points:
+        _, start, end, index = heapq.heappop(heap)
+        keep.append(index)
+        push(start, index)
+        push(index, end)
+
+    return np.sort(np.array(keep, dtype=np.intp))
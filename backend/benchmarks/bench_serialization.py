@@ -0,0 +1,83 @@
+"""
+Benchmark: ORM + Pydantic list serialization vs the orjson fast path.
+
+Runs without a database. The ORM path builds Asset instances (standing in
+for hydration), validates them into AssetListResponse and dumps JSON the way
+FastAPI does for a response_model. The fast path starts from Core-style row
+tuples and serializes plain dicts with orjson, as the list endpoints now do.
+
+Usage:
+    python -m benchmarks.bench_serialization [rows ...]
+"""
+
+import json
+import random
+import sys
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.asset import Asset
+from app.schemas.assets import AssetListResponse
+from app.utils.fast_json import FastJSONResponse, rows_to_dicts
+from app.utils.data_generator import generate_simulated_asset
+
+COLUMNS = [column.name for column in Asset.__table__.columns]
+AssetRow = namedtuple("AssetRow", COLUMNS)
+
+
+def make_rows(count: int) -> list:
+    """Generate asset rows as the database driver would return them."""
+    now = datetime.utcnow()
+    rows = []
+    for _ in range(count):
+        data = generate_simulated_asset(area=random.choice(["la", "san_diego"]))
+        data.update(id=uuid.uuid4(), last_seen=now, is_active=True, created_at=now, updated_at=now)
+        rows.append(AssetRow(**{column: data.get(column) for column in COLUMNS}))
+    return rows
+
+
+def orm_pydantic(rows: list) -> bytes:
+    """Hydrate ORM objects, validate with Pydantic and dump JSON."""
+    assets = [Asset(**row._asdict()) for row in rows]
+    return AssetListResponse.model_validate({"assets": assets, "total": len(assets)}).model_dump_json().encode()
+
+
+def orm_jsonable(rows: list) -> bytes:
+    """Hydrate ORM objects, validate, then jsonable_encoder + stdlib json."""
+    assets = [Asset(**row._asdict()) for row in rows]
+    response = AssetListResponse.model_validate({"assets": assets, "total": len(assets)})
+    return json.dumps(jsonable_encoder(response)).encode()
+
+
+def fast_path(rows: list) -> bytes:
+    """Plain dicts serialized with orjson."""
+    payload = {"assets": rows_to_dicts(rows), "total": len(rows), "next_cursor": None, "clusters": None}
+    return FastJSONResponse(payload).body
+
+
+def best_of(func, rows: list, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(sizes: list) -> None:
+    print(f"{'rows':>8} {'orm+jsonable':>14} {'orm+pydantic':>14} {'fast path':>11} {'speedup':>8}")
+    for size in sizes:
+        rows = make_rows(size)
+        repeat = 5 if size <= 10_000 else 2
+        legacy = best_of(orm_jsonable, rows, repeat)
+        pydantic = best_of(orm_pydantic, rows, repeat)
+        fast = best_of(fast_path, rows, repeat)
+        print(f"{size:>8} {legacy * 1000:>12.1f}ms {pydantic * 1000:>12.1f}ms {fast * 1000:>9.1f}ms {pydantic / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,53 @@
+"""
+Bulk import script for GeoMap Simulation API.
+Loads assets, events or commands from a CSV or NDJSON file using COPY.
+
+Usage:
+    python import_data.py events exercise_log.ndjson
+    python import_data.py assets scenario.csv --format csv
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.database import async_session
+from app.services.bulk_import import IMPORT_FORMATS, IMPORT_TARGETS, detect_format, import_records, read_records
+
+
+async def import_file(kind: str, path: str, fmt: str) -> int:
+    """Import one file and return a process exit code."""
+    started = time.perf_counter()
+    with open(path, encoding="utf-8-sig", newline="") as stream:
+        async with async_session() as session:
+            try:
+                result = await import_records(session, kind, read_records(stream, fmt))
+            except ValueError as exc:
+                await session.rollback()
+                print(exc, file=sys.stderr)
+                return 1
+            if result.errors:
+                await session.rollback()
+                for error in result.errors:
+                    print(f"record {error.line}: {error.message}", file=sys.stderr)
+                print("Nothing imported", file=sys.stderr)
+                return 1
+            await session.commit()
+    
+    print(f"Imported {result.imported} {kind} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Bulk import records with COPY")
+    parser.add_argument("kind", choices=sorted(IMPORT_TARGETS))
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults from the file extension")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(import_file(args.kind, args.path, args.format or detect_format(args.path))))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,11 @@ from app.database import engine, get_session
 from app.models.asset import Asset
 from app.models.engagement import Engagement
 from app.models.event import Event
+from app.models.event_rollup import EventMinuteRollup, EventRollup
 from app.models.command import Command
+from app.models.asset_position import AssetPosition
+from app.models.tombstone import Tombstone
+from app.services.event_partitions import event_partitions
 from app.utils.data_generator import (
     generate_simulated_asset,
     generate_simulated_engagement,
@@ -23,6 +27,14 @@ async def init_db():
         await conn.run_sync(Engagement.metadata.create_all)
         await conn.run_sync(Event.metadata.create_all)
         await conn.run_sync(Command.metadata.create_all)
+        await conn.run_sync(AssetPosition.metadata.create_all)
+        await conn.run_sync(Tombstone.metadata.create_all)
+        await conn.run_sync(EventRollup.metadata.create_all)
+        await conn.run_sync(EventMinuteRollup.metadata.create_all)
+    
+    # The partitioned events table accepts no rows until partitions exist,
+    # and its counting trigger is installed on the same pass
+    await event_partitions.run_once()
     
     # Generate and insert sample data
     async for session in get_session():
@@ -15,7 +15,7 @@ CREATE TABLE assets (
     zone VARCHAR(50),
     is_active BOOLEAN DEFAULT true,
     is_friendly BOOLEAN DEFAULT true,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -25,25 +25,53 @@ CREATE TABLE engagements (
     name VARCHAR(100) NOT NULL,
     friendly_id UUID REFERENCES assets(id) ON DELETE CASCADE,
     enemy_id UUID REFERENCES assets(id) ON DELETE CASCADE,
-    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'active', 'completed', 'cancelled')),
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'active', 'engaging', 'missile_in_flight', 'completed', 'cancelled')),
     progress FLOAT DEFAULT 0 CHECK (progress >= 0 AND progress <= 100),
     estimated_completion TIMESTAMP,
     details JSONB DEFAULT '{}',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- Events table
+-- Events table, range partitioned by day on timestamp. The application
+-- creates upcoming partitions and rolls expired ones up into
+-- event_rollups_hourly (see app/services/event_partitions.py); rows outside
+-- every partition land in events_default. Inserts are counted into the
+-- rollup tables below by the count_inserted_events trigger.
 CREATE TABLE events (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     asset_id UUID REFERENCES assets(id) ON DELETE CASCADE,
     engagement_id UUID REFERENCES engagements(id) ON DELETE SET NULL,
     event_type VARCHAR(50) NOT NULL CHECK (event_type IN ('alert', 'status_change', 'command_ack', 'engagement_start', 'engagement_end')),
     details JSONB DEFAULT '{}',
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     severity VARCHAR(20) CHECK (severity IN ('info', 'warning', 'critical')),
     resolved VARCHAR(20) DEFAULT 'pending' CHECK (resolved IN ('pending', 'resolved', 'ignored')),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE events_default PARTITION OF events DEFAULT;
+
+-- Event counts per minute (trimmed after a few days) and per hour (kept
+-- after expired event partitions are dropped). '' and the nil UUID stand in
+-- for a missing severity or asset.
+CREATE TABLE event_rollups_minute (
+    bucket TIMESTAMP NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    severity VARCHAR(20) NOT NULL DEFAULT '',
+    asset_id UUID NOT NULL DEFAULT '00000000-0000-0000-0000-000000000000',
+    event_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, event_type, severity, asset_id)
+);
+
+CREATE TABLE event_rollups_hourly (
+    bucket TIMESTAMP NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    severity VARCHAR(20) NOT NULL DEFAULT '',
+    asset_id UUID NOT NULL DEFAULT '00000000-0000-0000-0000-000000000000',
+    event_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, event_type, severity, asset_id)
 );
 
 -- Commands table
@@ -57,10 +85,30 @@ CREATE TABLE commands (
     error_message VARCHAR(255),
     acknowledged_at TIMESTAMP,
     failed_at TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Asset position history (append-only, no foreign key to keep inserts cheap)
+CREATE TABLE asset_positions (
+    id BIGSERIAL PRIMARY KEY,
+    asset_id UUID NOT NULL,
+    lat FLOAT NOT NULL,
+    lon FLOAT NOT NULL,
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tombstones for hard-deleted rows, read by delta sync
+CREATE TABLE tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    entity_type VARCHAR(20) NOT NULL,
+    entity_id UUID NOT NULL,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for better query performance
 CREATE INDEX idx_assets_zone ON assets(zone);
 CREATE INDEX idx_assets_status ON assets(status);
@@ -69,11 +117,31 @@ CREATE INDEX idx_assets_friendly ON assets(is_friendly);
 CREATE INDEX idx_engagements_status ON engagements(status);
 CREATE INDEX idx_engagements_friendly ON engagements(friendly_id);
 CREATE INDEX idx_engagements_enemy ON engagements(enemy_id);
-CREATE INDEX idx_events_asset ON events(asset_id);
-CREATE INDEX idx_events_engagement ON events(engagement_id);
-CREATE INDEX idx_events_timestamp ON events(timestamp);
+CREATE INDEX idx_events_asset ON events(asset_id, timestamp);
+CREATE INDEX idx_events_engagement ON events(engagement_id, timestamp);
+CREATE INDEX idx_events_timestamp ON events(timestamp, id);
 CREATE INDEX idx_commands_status ON commands(status);
 CREATE INDEX idx_commands_asset ON commands(asset_id);
+CREATE INDEX idx_assets_created ON assets(created_at, id);
+CREATE INDEX idx_engagements_created ON engagements(created_at, id);
+CREATE INDEX idx_events_created ON events(created_at, id);
+CREATE INDEX idx_commands_created ON commands(created_at, id);
+CREATE INDEX idx_asset_positions_asset_time ON asset_positions(asset_id, recorded_at);
+CREATE INDEX idx_assets_updated ON assets(updated_at);
+CREATE INDEX idx_engagements_updated ON engagements(updated_at);
+CREATE INDEX idx_commands_updated ON commands(updated_at);
+CREATE INDEX idx_commands_dispatch ON commands(created_at) WHERE status = 'pending';
+CREATE INDEX idx_tombstones_deleted ON tombstones(deleted_at);
+
+-- Containment and jsonpath filters on document columns (see app/utils/json_filter.py)
+CREATE INDEX idx_assets_extra_data ON assets USING gin (extra_data jsonb_path_ops);
+CREATE INDEX idx_engagements_details ON engagements USING gin (details jsonb_path_ops);
+CREATE INDEX idx_events_details ON events USING gin (details jsonb_path_ops);
+CREATE INDEX idx_commands_payload ON commands USING gin (payload jsonb_path_ops);
+
+-- Range filters on numeric document keys; these keys must always hold numbers
+CREATE INDEX idx_assets_battery_level ON assets (((extra_data->>'battery_level')::numeric));
+CREATE INDEX idx_assets_signal_strength ON assets (((extra_data->>'signal_strength')::numeric));
 
 -- Update updated_at trigger
 CREATE OR REPLACE FUNCTION update_updated_at()
@@ -99,3 +167,28 @@ CREATE TRIGGER update_commands_updated_at
     BEFORE UPDATE ON commands
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at();
+
+-- Fold every inserted batch of events into the rollup counters
+CREATE OR REPLACE FUNCTION count_inserted_events() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO event_rollups_minute (bucket, event_type, severity, asset_id, event_count)
+    SELECT date_trunc('minute', timestamp), event_type, coalesce(severity, ''),
+           coalesce(asset_id, '00000000-0000-0000-0000-000000000000'), count(*)
+    FROM new_events GROUP BY 1, 2, 3, 4 ORDER BY 1, 2, 3, 4
+    ON CONFLICT (bucket, event_type, severity, asset_id)
+    DO UPDATE SET event_count = event_rollups_minute.event_count + EXCLUDED.event_count;
+    INSERT INTO event_rollups_hourly (bucket, event_type, severity, asset_id, event_count)
+    SELECT date_trunc('hour', timestamp), event_type, coalesce(severity, ''),
+           coalesce(asset_id, '00000000-0000-0000-0000-000000000000'), count(*)
+    FROM new_events GROUP BY 1, 2, 3, 4 ORDER BY 1, 2, 3, 4
+    ON CONFLICT (bucket, event_type, severity, asset_id)
+    DO UPDATE SET event_count = event_rollups_hourly.event_count + EXCLUDED.event_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER count_inserted_events
+    AFTER INSERT ON events
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION count_inserted_events();
@@ -0,0 +1,90 @@
+"""
+Shared test fixtures.
+"""
+
+from typing import Any, Callable, List, Optional
+
+import pytest
+
+
+class FakeResult:
+    """Result stand-in over canned rows, iterable like a Result."""
+
+    def __init__(self, rows: Optional[List[Any]] = None):
+        self.rows = list(rows or [])
+        self.yield_per: Optional[int] = None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def all(self) -> List[Any]:
+        return self.rows
+
+    def scalar(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def scalars(self) -> "FakeResult":
+        """Rows are served as given, so scalars are the rows themselves."""
+        return self
+
+    async def partitions(self, size: Optional[int] = None):
+        """Yield the rows in chunks of ``size``, like a streamed result with yield_per."""
+        size = size or self.yield_per or len(self.rows) or 1
+        for start in range(0, len(self.rows), size):
+            yield self.rows[start:start + size]
+
+
+class FakeSession:
+    """Async session stand-in recording statements and answering through a handler.
+
+    ``handler(stmt, params)`` returns the rows for a statement or raises to
+    simulate a database error; with no handler every statement returns no rows.
+    """
+
+    def __init__(self, database: "FakeDatabase"):
+        self.database = database
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.database.executed.append((stmt, params))
+        rows = self.database.handler(stmt, params) if self.database.handler else None
+        return FakeResult(rows)
+
+    async def stream(self, stmt, params=None):
+        result = await self.execute(stmt, params)
+        result.yield_per = stmt.get_execution_options().get("yield_per")
+        return result
+
+    async def commit(self):
+        self.database.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+class FakeDatabase:
+    """Session factory whose sessions share one handler and statement log."""
+
+    def __init__(self):
+        self.handler: Optional[Callable[[Any, Any], Optional[List[Any]]]] = None
+        self.executed: List[tuple] = []
+        self.commits = 0
+
+    def __call__(self) -> FakeSession:
+        return FakeSession(self)
+
+    @property
+    def statements(self) -> List[str]:
+        """SQL text of every executed statement."""
+        return [str(stmt) for stmt, _ in self.executed]
+
+
+@pytest.fixture
+def fake_db() -> FakeDatabase:
+    """A fake session factory to pass as a service's ``session_factory``."""
+    return FakeDatabase()
@@ -2,13 +2,61 @@
 Tests for Command & Control API.
 """
 
+import asyncio
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
 import pytest
+from sqlalchemy.sql.dml import Update
 from fastapi.testclient import TestClient
+from app.database import get_session
+from app.api.v1 import _expand_engagements
 from app.main import app
+from app.models.asset import Asset
+from app.models.tombstone import Tombstone
+from app.schemas.engagements import EngagementResponse
+from app.services.entity_cache import entity_cache
+from app.schemas.assets import AssetResponse, AssetTelemetry
+from app.schemas.imports import AssetImport
+from app.utils.pagination import decode_watermark
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def session(fake_db):
+    """Serve requests from the fake database instead of Postgres."""
+    async def fake_session():
+        async with fake_db() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = fake_session
+    yield fake_db
+    app.dependency_overrides.pop(get_session, None)
+
+
+def _bound_datetimes(stmt):
+    """Datetime parameters bound into a statement."""
+    return [value for value in stmt.compile().params.values() if isinstance(value, datetime)]
+
+
+def _asset(changed_at, **fields):
+    values = dict(
+        id=uuid4(), name="Drone", asset_type="drone", status="available", lat=None, lon=None, zone=None,
+        is_friendly=True, is_active=True, extra_data={}, last_seen=None, created_at=changed_at, updated_at=changed_at,
+    )
+    return Asset(**{**values, **fields})
+
+
+def _rows_by_table(tables):
+    """Handler answering each select from the rows listed for its table."""
+    def handler(stmt, params):
+        return tables.get(stmt.column_descriptions[0]["entity"].__tablename__, [])
+    return handler
+
+
 def test_health_check():
     """Test health check endpoint."""
     response = client.get("/health")
@@ -75,3 +123,265 @@ def test_list_commands():
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
+
+
+def test_batch_engagement_actions_rejects_unknown_action():
+    """Test batch actions validate action names before touching the database."""
+    response = client.post(
+        "/api/v1/engagements/actions",
+        json={"actions": [{"engagement_id": "00000000-0000-0000-0000-000000000001", "action": "detonate"}]},
+    )
+    assert response.status_code == 422
+
+
+def test_list_engagements_rejects_unknown_expansion():
+    """Test expand only accepts the friendly and enemy relations."""
+    response = client.get("/api/v1/engagements?expand=friendly,commands")
+    assert response.status_code == 422
+
+
+def test_event_stats_rejects_unknown_grouping():
+    """Test event stats only group by rollup columns."""
+    response = client.get("/api/v1/events/stats?group_by=severity,resolved")
+    assert response.status_code == 422
+
+
+def test_event_stats_accepts_offset_timestamps():
+    """Test aware start/end are compared in UTC rather than failing."""
+    response = client.get(
+        "/api/v1/events/stats",
+        params={"start": "2026-10-17T00:30:00Z", "end": "2026-10-17T02:00:00+02:00"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "end must be after start"
+
+
+def test_asset_track_accepts_offset_timestamps(session):
+    """Test Z-suffixed track bounds are bound as naive UTC instead of failing."""
+    response = client.get(f"/api/v1/assets/{uuid4()}/track", params={"start": "2026-01-01T00:00:00Z"})
+    assert response.status_code == 200
+    assert response.json()["total_points"] == 0
+    (stmt, _), = session.executed
+    bounds = _bound_datetimes(stmt)
+    assert datetime(2026, 1, 1) in bounds
+    assert all(value.tzinfo is None for value in bounds)
+
+
+def test_sync_resumes_after_the_last_row_when_a_page_is_cut_off(session):
+    """Test has_more is set and the watermark resumes right after the last asset returned."""
+    assets = [_asset(datetime(2026, 10, 17, 8, minute)) for minute in range(3)]
+    session.handler = _rows_by_table({"assets": assets})
+
+    body = client.get("/api/v1/sync", params={"limit": 2}).json()
+    assert body["has_more"] is True
+    assert [item["id"] for item in body["assets"]] == [str(asset.id) for asset in assets[:2]]
+    position = decode_watermark(body["watermark"], ["assets", "events"])
+    assert position["assets"] == (assets[1].updated_at, assets[1].id)
+    assert position["events"][1] is None
+
+    session.executed.clear()
+    session.handler = _rows_by_table({})
+    body = client.get("/api/v1/sync", params={"since": body["watermark"], "limit": 2}).json()
+    assert body["has_more"] is False
+    stmt = next(stmt for stmt, _ in session.executed if "FROM assets" in str(stmt))
+    assert "(assets.updated_at, assets.id) >" in str(stmt)
+    assert assets[1].id in stmt.compile().params.values()
+
+
+def test_sync_reports_deleted_engagements_and_soft_deleted_assets(session):
+    """Test tombstones and inactive assets come back as deletions rather than changes."""
+    changed_at = datetime(2026, 10, 17, 8)
+    live, retired = _asset(changed_at), _asset(changed_at, is_active=False)
+    tombstone = Tombstone(id=1, entity_type="engagement", entity_id=uuid4(), deleted_at=changed_at)
+    session.handler = _rows_by_table({"assets": [live, retired], "tombstones": [tombstone]})
+
+    body = client.get("/api/v1/sync").json()
+    assert [item["id"] for item in body["assets"]] == [str(live.id)]
+    assert body["deleted"] == {"assets": [str(retired.id)], "engagements": [str(tombstone.entity_id)]}
+    stmt = next(stmt for stmt, _ in session.executed if "FROM tombstones" in str(stmt))
+    assert "tombstones.entity_type = " in str(stmt)
+
+
+def test_sync_accepts_offset_timestamps(session):
+    """Test an aware ``since`` is bound as naive UTC for every entity type."""
+    response = client.get("/api/v1/sync", params={"since": "2026-10-17T10:00:00+02:00"})
+    assert response.status_code == 200
+    assert len(session.executed) == 5
+    for stmt, _ in session.executed:
+        assert _bound_datetimes(stmt) == [datetime(2026, 10, 17, 8)]
+
+
+UpdatedAsset = namedtuple("UpdatedAsset", ["id", "lat", "lon", "status", "is_friendly", "is_active", "last_seen"])
+
+
+def _telemetry_reports(stmt):
+    """(id, lat, lon, status, last_seen) rows of the VALUES list in a telemetry update."""
+    reports = stmt.whereclause.right.table
+    return [row for rows in reports._data for row in rows]
+
+
+def _telemetry(known_ids=()):
+    """Handler updating the reported assets that exist, like the UPDATE ... FROM (VALUES ...)."""
+    def handler(stmt, params):
+        if not isinstance(stmt, Update):
+            return []
+        return [
+            UpdatedAsset(asset_id, lat, lon, status or "available", True, True, last_seen)
+            for asset_id, lat, lon, status, last_seen in _telemetry_reports(stmt)
+            if asset_id in known_ids
+        ]
+    return handler
+
+
+def _updates(session):
+    return [stmt for stmt, _ in session.executed if isinstance(stmt, Update)]
+
+
+@pytest.fixture
+def telemetry_index():
+    with patch("app.api.v1.asset_index") as index:
+        yield index
+
+
+def test_telemetry_keeps_the_last_report_per_asset_and_flags_unknown_ids(session, telemetry_index):
+    """Test repeated asset IDs collapse to the last report and missing assets are reported per item."""
+    known, unknown = uuid4(), uuid4()
+    session.handler = _telemetry({known})
+    response = client.post("/api/v1/assets/telemetry", json={"updates": [
+        {"id": str(known), "lat": 1.0, "lon": 1.0},
+        {"id": str(unknown), "lat": 3.0, "lon": 3.0},
+        {"id": str(known), "lat": 2.0, "lon": 2.0, "status": "in_use"},
+    ]})
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {"id": str(known), "result": "updated"},
+            {"id": str(unknown), "result": "not_found"},
+            {"id": str(known), "result": "updated"},
+        ],
+        "updated": 1,
+        "not_found": 1,
+    }
+    (stmt,) = _updates(session)
+    reports = {report[0]: report for report in _telemetry_reports(stmt)}
+    assert len(reports) == 2
+    assert reports[known][1:4] == (2.0, 2.0, "in_use")
+    telemetry_index.upsert.assert_called_once()
+    assert session.commits == 1
+
+
+def test_telemetry_is_applied_in_chunks(session, telemetry_index):
+    """Test a batch larger than one chunk becomes one set-based update per 5000 reports."""
+    updates = [{"id": str(uuid4()), "lat": 0.0, "lon": 0.0} for _ in range(5001)]
+    response = client.post("/api/v1/assets/telemetry", json={"updates": updates})
+    assert response.json()["not_found"] == 5001
+    assert [len(_telemetry_reports(stmt)) for stmt in _updates(session)] == [5000, 1]
+
+
+def test_telemetry_report_times_are_stored_as_naive_utc(session, telemetry_index):
+    """Test an offset last_seen is converted instead of failing the whole batch."""
+    asset_id = uuid4()
+    session.handler = _telemetry({asset_id})
+    response = client.post("/api/v1/assets/telemetry", json={"updates": [
+        {"id": str(asset_id), "lat": 1.0, "lon": 1.0, "last_seen": "2026-10-17T10:00:00+02:00"},
+    ]})
+    assert response.json()["updated"] == 1
+    (stmt,) = _updates(session)
+    assert _telemetry_reports(stmt)[0][4] == datetime(2026, 10, 17, 8)
+    assert AssetTelemetry(id=asset_id, lat=0, lon=0, last_seen="2026-10-17T08:00:00Z").last_seen.tzinfo is None
+
+
+@pytest.mark.parametrize("value", ["low", "", True, [1]])
+def test_indexed_extra_data_keys_must_be_numbers(session, value):
+    """Test create, update and import reject values the numeric expression indexes cannot cast."""
+    asset = {"name": "Drone", "asset_type": "drone", "extra_data": {"battery_level": value}}
+    assert client.post("/api/v1/assets", json=asset).status_code == 422
+    response = client.put(f"/api/v1/assets/{uuid4()}", json={"extra_data": {"signal_strength": value}})
+    assert response.status_code == 422
+    with pytest.raises(ValueError, match="extra_data.battery_level must be a number"):
+        AssetImport(**asset)
+    assert session.executed == []
+
+
+def test_indexed_extra_data_keys_accept_numbers_and_null():
+    """Test numbers, null and unrelated keys pass extra_data validation."""
+    extra_data = {"battery_level": 87.5, "signal_strength": None, "callsign": "low"}
+    assert AssetImport(name="Drone", asset_type="drone", extra_data=extra_data).extra_data == extra_data
+
+
+AssetRow = namedtuple("AssetRow", [column.key for column in Asset.__table__.c])
+
+
+def _asset_row(asset_id):
+    changed_at = datetime(2026, 10, 17, 8)
+    return AssetRow(**{**{key: None for key in AssetRow._fields}, **dict(
+        id=asset_id, name="Asset", asset_type="drone", status="available", extra_data={},
+        is_active=True, is_friendly=True, created_at=changed_at, updated_at=changed_at,
+    )})
+
+
+def _assets_by_id(stmt, params):
+    """Answer the batched asset lookup with one row per requested ID."""
+    return [_asset_row(asset_id) for asset_id in stmt.compile().params["id_1"]]
+
+
+def test_expand_embeds_assets_for_many_engagements_with_one_query(fake_db):
+    """Test N engagements are expanded with a single batched asset query, not N+1."""
+    shared = uuid4()
+    engagements = [{"id": uuid4(), "friendly_id": shared, "enemy_id": uuid4()} for _ in range(5)]
+    engagements.append({"id": uuid4(), "friendly_id": uuid4(), "enemy_id": None})
+    fake_db.handler = _assets_by_id
+
+    async def expand():
+        async with fake_db() as session:
+            return await _expand_engagements(session, engagements, "friendly,enemy,friendly")
+    expanded = asyncio.run(expand())
+
+    (stmt, _), = fake_db.executed
+    assert len(stmt.compile().params["id_1"]) == 7
+    for engagement in expanded:
+        assert engagement["friendly"]["id"] == engagement["friendly_id"]
+        enemy = engagement["enemy"]
+        assert (enemy and enemy["id"]) == engagement["enemy_id"]
+    assert expanded[-1]["enemy"] is None
+
+
+def test_engagement_detail_embeds_requested_assets(session):
+    """Test expand on the engagement detail endpoint embeds only the requested relations."""
+    changed_at = datetime(2026, 10, 17, 8)
+    engagement = EngagementResponse(
+        id=uuid4(), name="Intercept", friendly_id=uuid4(), enemy_id=uuid4(), created_at=changed_at, updated_at=changed_at,
+    )
+    entity_cache.put("engagements", engagement.id, engagement)
+    session.handler = _assets_by_id
+    try:
+        body = client.get(f"/api/v1/engagements/{engagement.id}", params={"expand": "enemy"}).json()
+    finally:
+        entity_cache.invalidate("engagements", engagement.id)
+
+    assert body["enemy"]["id"] == str(engagement.enemy_id)
+    assert body["friendly"] is None
+    (stmt, _), = session.executed
+    assert stmt.compile().params["id_1"] == [engagement.enemy_id]
+
+
+@pytest.mark.parametrize("query, status", [("", "available"), ("?status=in_use", "in_use"), ("?status=", None)])
+def test_nearest_friendlies_status_filter(session, query, status):
+    """Test the status filter defaults to available and an empty value matches any status."""
+    enemy = AssetResponse.model_validate(_asset(datetime(2026, 10, 17, 8), lat=34.0, lon=-118.0, is_friendly=False))
+    entity_cache.put("assets", enemy.id, enemy)
+    try:
+        with patch("app.api.v1.asset_index") as index:
+            index.ensure_loaded = AsyncMock()
+            index.nearest_friendlies.return_value = []
+            response = client.get(f"/api/v1/assets/{enemy.id}/nearest-friendlies{query}")
+    finally:
+        entity_cache.invalidate("assets", enemy.id)
+    assert response.json() == []
+    index.nearest_friendlies.assert_called_once_with(34.0, -118.0, 1, status=status)
+
+
+def test_list_assets_rejects_filter_on_other_column():
+    """Test JSON filters are limited to the endpoint's document column."""
+    response = client.get("/api/v1/assets?filter=details.threshold_exceeded=battery")
+    assert response.status_code == 400
@@ -0,0 +1,72 @@
+"""
+Tests for the weapon-target assignment solver.
+"""
+
+import itertools
+
+import numpy as np
+
+from app.utils.assignment import solve_assignment
+from app.utils.geo import distance_matrix_km, haversine_km
+
+
+def _best_margin(cost, max_cost):
+    """Brute-force the best total range margin over all partial matchings."""
+    n, m = cost.shape
+    best = 0.0
+    for cols in itertools.permutations(list(range(m)) + [None] * n, n):
+        margin = sum(max_cost - cost[row, col] for row, col in enumerate(cols) if col is not None and cost[row, col] <= max_cost)
+        best = max(best, margin)
+    return best
+
+
+def test_distance_matrix_matches_haversine():
+    """Test the matrix form against the scalar great-circle distance."""
+    lats1, lons1 = np.array([34.05, 32.72, 0.0]), np.array([-118.24, -117.16, 179.9])
+    lats2, lons2 = np.array([33.0, 0.0]), np.array([-117.5, -179.9])
+    distances = distance_matrix_km(lats1, lons1, lats2, lons2)
+    for i, j in itertools.product(range(3), range(2)):
+        assert abs(distances[i, j] - haversine_km(lats1[i], lons1[i], lats2[j], lons2[j])) < 1e-6
+
+
+def test_assignment_matches_brute_force():
+    """Test small random instances reach the optimal total margin."""
+    rng = np.random.default_rng(7)
+    for _ in range(25):
+        n, m = rng.integers(1, 5, size=2)
+        cost = rng.uniform(0, 100, size=(n, m))
+        rows, cols = solve_assignment(cost, 60.0, epsilon=1e-6)
+
+        assert len(set(rows)) == len(rows) and len(set(cols)) == len(cols)
+        assert (cost[rows, cols] <= 60.0).all()
+        margin = float((60.0 - cost[rows, cols]).sum())
+        assert abs(margin - _best_margin(cost, 60.0)) < 1e-3
+
+
+def test_assignment_respects_range_and_orientation():
+    """Test out-of-range targets stay unassigned whichever side is larger."""
+    cost = np.array([
+        [5.0, 50.0, 500.0],
+        [6.0, 40.0, 700.0],
+    ])
+    rows, cols = solve_assignment(cost, 100.0, epsilon=1e-6)
+    assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 0), (1, 1)]
+
+    rows, cols = solve_assignment(cost.T, 100.0, epsilon=1e-6)
+    assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 0), (1, 1)]
+
+    rows, cols = solve_assignment(np.zeros((0, 4)), 100.0)
+    assert rows.size == 0 and cols.size == 0
+
+
+def test_large_assignment_is_one_to_one():
+    """Test a few thousand by a few thousand solves into a valid matching."""
+    rng = np.random.default_rng(11)
+    friendlies = rng.uniform([32.5, -118.5], [34.5, -116.8], size=(2000, 2))
+    enemies = rng.uniform([32.5, -118.5], [34.5, -116.8], size=(2500, 2))
+    distances = distance_matrix_km(friendlies[:, 0], friendlies[:, 1], enemies[:, 0], enemies[:, 1])
+    rows, cols = solve_assignment(distances, 50.0)
+
+    assert len(rows) == 2000
+    assert len(set(rows.tolist())) == len(rows) and len(set(cols.tolist())) == len(cols)
+    assert (distances[rows, cols] <= 50.0).all()
@@ -0,0 +1,63 @@
+"""
+Tests for bulk import validation.
+"""
+
+import io
+import json
+from uuid import UUID
+
+from app.services.bulk_import import IMPORT_TARGETS, read_records, validate_batch
+
+
+def test_ndjson_events_fill_defaults_and_encode_json():
+    """Test NDJSON events become COPY tuples in column order."""
+    target = IMPORT_TARGETS["events"]
+    stream = io.StringIO(
+        '{"event_type": "alert", "severity": "critical", "details": {"battery": 12}}\n'
+        "\n"
+        '{"event_type": "status_change", "timestamp": "2024-05-01T12:00:00"}\n'
+    )
+    rows, errors, consumed = validate_batch(target, read_records(stream, "ndjson"), 0)
+
+    assert errors == []
+    assert consumed == 2
+    first = dict(zip(target.columns, rows[0]))
+    assert isinstance(first["id"], UUID)
+    assert json.loads(first["details"]) == {"battery": 12}
+    assert first["resolved"] == "pending"
+    assert first["timestamp"] is not None
+    second = dict(zip(target.columns, rows[1]))
+    assert second["timestamp"].isoformat() == "2024-05-01T12:00:00"
+
+
+def test_csv_assets_coerce_types():
+    """Test CSV cells are coerced and JSON columns parsed."""
+    target = IMPORT_TARGETS["assets"]
+    stream = io.StringIO(
+        "name,asset_type,lat,lon,is_friendly,extra_data\n"
+        'Hawk,drone,34.05,-118.24,false,"{""battery_level"": 80}"\n'
+        "Eye,sensor,,,,\n"
+    )
+    rows, errors, _ = validate_batch(target, read_records(stream, "csv"), 0)
+
+    assert errors == []
+    hawk = dict(zip(target.columns, rows[0]))
+    assert hawk["lat"] == 34.05 and hawk["is_friendly"] is False
+    assert json.loads(hawk["extra_data"]) == {"battery_level": 80}
+    eye = dict(zip(target.columns, rows[1]))
+    assert eye["lat"] is None and eye["status"] == "available"
+
+
+def test_invalid_records_report_line_numbers():
+    """Test rejected records carry their position across batches."""
+    target = IMPORT_TARGETS["commands"]
+    records = iter(['{"command_type": "patrol"}', '{"command_type": "dance"}', "{not json"])
+
+    rows, errors, consumed = validate_batch(target, records, 0, batch_size=2)
+    assert consumed == 2 and len(rows) == 1
+    assert [error.line for error in errors] == [2]
+    assert "command_type" in errors[0].message
+
+    rows, errors, consumed = validate_batch(target, records, 2, batch_size=2)
+    assert consumed == 1 and rows == []
+    assert errors[0].line == 3
@@ -0,0 +1,75 @@
+"""
+Tests for post-commit change publishing.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.change_feed import ChangeFeed, asset_messages, event_messages
+
+
+def test_event_messages_reach_severity_and_related_topics():
+    asset_id = uuid4()
+    event = {
+        "id": uuid4(),
+        "event_type": "alert",
+        "severity": None,
+        "asset_id": asset_id,
+        "engagement_id": None,
+        "timestamp": datetime(2024, 5, 1, 12, 0),
+    }
+    messages = list(event_messages(event))
+    assert [channel for channel, _ in messages] == ["events:none", f"asset:{asset_id}"]
+    assert messages[0][1] == {
+        "type": "event.created",
+        "data": {
+            "id": str(event["id"]),
+            "event_type": "alert",
+            "severity": None,
+            "asset_id": str(asset_id),
+            "engagement_id": None,
+            "timestamp": "2024-05-01T12:00:00",
+        },
+    }
+
+
+def test_delivers_in_order_off_the_caller_and_skips_idle_channels():
+    async def scenario():
+        delivered = []
+        release = asyncio.Event()
+
+        async def send(channel, message):
+            await release.wait()
+            delivered.append((channel, message["data"]["status"]))
+
+        feed = ChangeFeed(max_queued=2)
+        feed.start(send, is_subscribed=lambda channel: channel != "asset:idle")
+        watched = SimpleNamespace(id="watched", status="available", lat=1.0, lon=2.0, is_active=True)
+        idle = SimpleNamespace(id="idle", status="available", lat=1.0, lon=2.0, is_active=True)
+
+        feed.publish(asset_messages("updated", watched))
+        feed.publish(asset_messages("updated", idle))
+        watched.status = "in_use"
+        feed.publish(asset_messages("updated", watched))
+        await asyncio.sleep(0)
+        # The first message is held in send, so the queue has one free slot
+        feed.publish(asset_messages("updated", watched))
+        feed.publish(asset_messages("updated", watched))
+        assert delivered == []
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await feed.stop()
+        return delivered, feed.stats()
+
+    delivered, stats = asyncio.run(scenario())
+    assert delivered == [
+        ("asset:watched", "available"),
+        ("asset:watched", "in_use"),
+        ("asset:watched", "in_use"),
+    ]
+    assert stats["dropped"] == 1
+    assert stats["delivered"] == 3
@@ -0,0 +1,57 @@
+"""
+Tests for hierarchical marker clustering.
+"""
+
+import random
+
+from app.utils.clustering import ClusterGrid
+
+
+def test_low_zoom_aggregates_all_points():
+    """Test that a zoomed-out viewport collapses points into few clusters."""
+    rng = random.Random(7)
+    grid = ClusterGrid()
+    for key in range(5000):
+        grid.insert(key, rng.uniform(33.7, 34.5), rng.uniform(-118.5, -117.5), is_friendly=key % 2 == 0)
+
+    clusters = grid.query(30.0, -120.0, 36.0, -115.0, zoom=4)
+    assert sum(cluster.count for cluster in clusters) == 5000
+    assert sum(cluster.friendly_count for cluster in clusters) == 2500
+    assert len(clusters) <= 4
+
+
+def test_singleton_cluster_reports_its_key_after_moves():
+    """Test lone points are identified even after neighbours leave the cell."""
+    grid = ClusterGrid()
+    grid.insert("a", 34.0, -118.0)
+    grid.insert("b", 34.0001, -118.0001)
+    grid.insert("b", 32.7, -117.1)
+
+    clusters = grid.query(33.9, -118.1, 34.1, -117.9, zoom=12)
+    assert len(clusters) == 1
+    assert clusters[0].key == "a"
+    assert (clusters[0].lat, clusters[0].lon) == (34.0, -118.0)
+
+    grid.remove("a")
+    assert grid.query(33.9, -118.1, 34.1, -117.9, zoom=12) == []
+    assert len(grid) == 1
+
+
+def test_side_filter_uses_that_sides_centroid_and_singletons():
+    """Test a mixed cell filtered to one side is placed and keyed by that side alone."""
+    grid = ClusterGrid()
+    grid.insert("f1", 34.0, -118.0, is_friendly=True)
+    grid.insert("f2", 34.002, -118.002, is_friendly=True)
+    grid.insert("e1", 34.004, -118.004, is_friendly=False)
+
+    (friendly,) = grid.query(33.9, -118.1, 34.1, -117.9, zoom=8, is_friendly=True)
+    assert (friendly.count, friendly.friendly_count, friendly.enemy_count) == (2, 2, 0)
+    assert abs(friendly.lat - 34.001) < 1e-9 and abs(friendly.lon + 118.001) < 1e-9
+    assert friendly.key is None
+
+    (enemy,) = grid.query(33.9, -118.1, 34.1, -117.9, zoom=8, is_friendly=False)
+    assert (enemy.count, enemy.key, enemy.lat, enemy.lon) == (1, "e1", 34.004, -118.004)
+
+    grid.remove("f1")
+    grid.remove("f2")
+    assert grid.query(33.9, -118.1, 34.1, -117.9, zoom=8, is_friendly=True) == []
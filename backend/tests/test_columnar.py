@@ -0,0 +1,39 @@
+"""
+Tests for the columnar asset snapshot encoding.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+from app.utils.columnar import UNKNOWN_STATUS_CODE, build_columnar
+
+
+def test_columnar_arrays_and_bitset():
+    """Test rows become parallel arrays with a packed friendly bitset."""
+    ids = [uuid.uuid4() for _ in range(10)]
+    rows = [
+        (asset_id, 34.0 + i, -118.0 - i, "offline" if i == 3 else "available", i % 3 == 0, datetime(2026, 1, 1))
+        for i, asset_id in enumerate(ids)
+    ]
+    rows[5] = (ids[5], None, None, "unknown", True, datetime(2026, 1, 1))
+
+    snapshot = build_columnar(rows)
+    assert snapshot["count"] == 10
+    assert snapshot["ids"] == ids
+    assert snapshot["lat"][1] == 35.0 and np.isnan(snapshot["lat"][5])
+    assert snapshot["status"][3] == snapshot["status_codes"]["offline"]
+    assert snapshot["status"][5] == UNKNOWN_STATUS_CODE
+
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(snapshot["is_friendly"]), dtype=np.uint8), bitorder="little")
+    assert bits[:10].tolist() == [1, 0, 0, 1, 0, 1, 1, 0, 0, 1]
+
+
+def test_columnar_empty():
+    """Test an empty page encodes to empty arrays."""
+    snapshot = build_columnar([])
+    assert snapshot["count"] == 0
+    assert snapshot["ids"] == [] and len(snapshot["lat"]) == 0
+    assert snapshot["is_friendly"] == ""
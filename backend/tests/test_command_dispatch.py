@@ -0,0 +1,155 @@
+"""
+Tests for command dispatch workers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.command_dispatch import (
+    CommandDispatcher,
+    CommandTransport,
+    DeliveryRejected,
+    LocalTransport,
+    backoff_seconds,
+    claim_statement,
+)
+
+
+class _Row(SimpleNamespace):
+    """Row stand-in exposing ``_mapping`` like a RETURNING row."""
+
+    @property
+    def _mapping(self):
+        return vars(self)
+
+
+@pytest.fixture
+def dispatcher(fake_db):
+    """A dispatcher over the fake database; queue rows in ``fake_db.pending``."""
+    fake_db.pending = []
+    fake_db.recorded = []
+
+    def execute(stmt, params):
+        if isinstance(params, list):
+            fake_db.recorded.extend(params)
+            return []
+        claimed, fake_db.pending = fake_db.pending, []
+        return claimed
+
+    fake_db.handler = execute
+    return CommandDispatcher(
+        workers=2,
+        batch_size=10,
+        poll_seconds=0.05,
+        delivery_timeout_seconds=0.1,
+        lease_seconds=1.0,
+        max_attempts=3,
+        retry_base_seconds=1.0,
+        retry_max_seconds=5.0,
+        session_factory=fake_db,
+    )
+
+
+def _row(attempts=1):
+    """A claimed command row."""
+    return _Row(id=uuid4(), asset_id=uuid4(), engagement_id=None, command_type="patrol", payload={}, attempts=attempts)
+
+
+def test_claim_statement_uses_skip_locked_and_backoff_doubles_to_cap():
+    """Test the claim SQL skips locked rows and bumps attempts, and backoff is capped."""
+    sql = str(claim_statement(25).compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "attempts + " in sql
+    assert backoff_seconds(1, 1.0, 5.0) == 1.0
+    assert backoff_seconds(3, 1.0, 5.0) == 4.0
+    assert backoff_seconds(10, 1.0, 5.0) == 5.0
+
+
+def test_records_acknowledged_retried_and_failed_outcomes(dispatcher, fake_db):
+    """Test each delivery outcome is written back against the claimed attempt."""
+    ok, flaky, rejected, exhausted = _row(), _row(attempts=2), _row(), _row(attempts=3)
+    transport = LocalTransport(failures={
+        flaky.id: [ConnectionError("link down")],
+        rejected.id: [DeliveryRejected("unknown asset")],
+        exhausted.id: [ConnectionError("link down")],
+    })
+    fake_db.pending = [ok, flaky, rejected, exhausted]
+    dispatcher.transport = transport
+
+    async def scenario():
+        before = datetime.utcnow()
+        claimed = await dispatcher.dispatch_batch()
+        return before, claimed, await dispatcher.dispatch_batch()
+
+    before, claimed, again = asyncio.run(scenario())
+    assert (claimed, again) == (4, 0)
+    assert [command["id"] for command in transport.delivered] == [ok.id]
+
+    recorded = {values["b_id"]: values for values in fake_db.recorded}
+    assert recorded[ok.id]["b_status"] == "acknowledged"
+    assert recorded[ok.id]["b_acknowledged_at"] is not None
+    assert recorded[flaky.id]["b_status"] == "pending"
+    assert recorded[flaky.id]["b_error_message"] == "link down"
+    assert recorded[flaky.id]["b_next_attempt_at"] >= before + timedelta(seconds=2)
+    assert recorded[rejected.id]["b_status"] == "failed"
+    assert recorded[exhausted.id]["b_status"] == "failed"
+    assert recorded[exhausted.id]["b_failed_at"] is not None
+    assert all(values["b_attempts"] == row.attempts for row, values in zip(
+        [ok, flaky, rejected, exhausted], fake_db.recorded
+    ))
+    assert dispatcher.stats()["acknowledged"] == 1
+    assert dispatcher.stats()["retried"] == 1
+    assert dispatcher.stats()["failed"] == 2
+
+
+def test_slow_delivery_times_out_and_is_retried(dispatcher, fake_db):
+    """Test a delivery exceeding the timeout is recorded as a transient failure."""
+    fake_db.pending = [_row()]
+    dispatcher.transport = LocalTransport(latency_seconds=1.0)
+
+    asyncio.run(dispatcher.dispatch_batch())
+    (values,) = fake_db.recorded
+    assert values["b_status"] == "pending"
+    assert "timed out" in values["b_error_message"]
+
+
+def test_workers_pick_up_notified_commands(dispatcher, fake_db):
+    """Test notify wakes idle workers and unacknowledged deliveries are marked sent."""
+    dispatcher.poll_seconds = 10.0
+
+    async def scenario():
+        dispatcher.start(LocalTransport(acknowledge=False))
+        await asyncio.sleep(0.01)
+        fake_db.pending = [_row()]
+        dispatcher.notify()
+        for _ in range(50):
+            if fake_db.recorded:
+                break
+            await asyncio.sleep(0.01)
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+    (values,) = fake_db.recorded
+    assert values["b_status"] == "sent"
+    assert values["b_acknowledged_at"] is None
+
+
+def test_start_requires_an_explicit_transport(dispatcher):
+    """Test workers never start with an implicit stub transport."""
+    with pytest.raises(ValueError):
+        dispatcher.start()
+    assert not dispatcher.running
+
+
+def test_transports_must_implement_deliver():
+    """Test a transport without deliver cannot be constructed."""
+    class Silent(CommandTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        Silent()
@@ -0,0 +1,95 @@
+"""
+Tests for the engagement progress engine.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import TextClause
+from sqlalchemy.dialects import postgresql
+
+from app.services.engagement_engine import EngagementEngine, progress_statement
+from app.services.entity_cache import entity_cache
+
+
+def _lock_granted(rows=(), granted=True):
+    """Handler answering the tick lock, then the progress UPDATE with ``rows``."""
+    def handler(stmt, params):
+        if isinstance(stmt, TextClause):
+            return [granted]
+        return list(rows)
+    return handler
+
+
+def test_progress_statement_is_single_update():
+    """Test every live status is advanced by one UPDATE ... RETURNING."""
+    sql = str(progress_statement().compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE engagements SET")
+    assert "least(" in sql and "RETURNING" in sql
+    assert "EXTRACT(epoch FROM %(now)s::TIMESTAMP WITHOUT TIME ZONE - engagements.updated_at)" in sql
+
+
+def test_tick_broadcasts_one_coalesced_frame(fake_db):
+    """Test a tick sends one frame for all engagements and drops stale snapshots."""
+    rows = [SimpleNamespace(id=uuid4(), status="engaging", progress=15.0) for _ in range(500)]
+    rows.append(SimpleNamespace(id=uuid4(), status="completed", progress=100.0))
+    entity_cache.put("engagements", rows[0].id, object())
+    frames = []
+    fake_db.handler = _lock_granted(rows)
+
+    async def broadcast(frame):
+        frames.append(frame)
+
+    engine = EngagementEngine(0.5, broadcast=broadcast, session_factory=fake_db)
+    updates = asyncio.run(engine.tick(60.0))
+
+    assert len(fake_db.executed) == 2
+    assert "pg_try_advisory_xact_lock" in fake_db.statements[0]
+    assert fake_db.executed[1][1]["elapsed"] == 5.0
+    assert len(frames) == 1
+    assert frames[0]["type"] == "engagement_progress"
+    assert len(frames[0]["engagements"]) == 501 == len(updates)
+    assert entity_cache.get("engagements", rows[0].id) is None
+
+
+def test_idle_tick_sends_nothing(fake_db):
+    """Test a tick with no live engagements does not broadcast."""
+    frames = []
+
+    async def broadcast(frame):
+        frames.append(frame)
+
+    fake_db.handler = _lock_granted()
+    engine = EngagementEngine(0.5, broadcast=broadcast, session_factory=fake_db)
+    assert asyncio.run(engine.tick(0.5)) == []
+    assert frames == []
+    assert (engine.ticks, engine.skipped) == (1, 0)
+
+
+def test_tick_is_skipped_while_another_worker_holds_the_lock(fake_db):
+    """Test only the worker holding the advisory lock advances engagements."""
+    fake_db.handler = _lock_granted([SimpleNamespace(id=uuid4(), status="engaging", progress=15.0)], granted=False)
+    engine = EngagementEngine(0.5, session_factory=fake_db)
+    assert asyncio.run(engine.tick(0.5)) == []
+    assert len(fake_db.executed) == 1
+    assert fake_db.commits == 0
+    assert (engine.ticks, engine.skipped) == (0, 1)
+
+
+def test_tick_publishes_status_changes_to_engagement_topics(fake_db):
+    """Test engagements finishing in a tick reach their topic; progress-only rows do not."""
+    moving = SimpleNamespace(id=uuid4(), status="engaging", progress=40.0, friendly_id=None, enemy_id=None)
+    finished = SimpleNamespace(id=uuid4(), status="completed", progress=100.0, friendly_id=uuid4(), enemy_id=None)
+    fake_db.handler = _lock_granted([moving, finished])
+
+    engine = EngagementEngine(0.5, session_factory=fake_db)
+    with patch("app.services.engagement_engine.change_feed") as feed:
+        asyncio.run(engine.tick(0.5))
+
+    (call,) = feed.publish.call_args_list
+    ((channel, message),) = list(call.args[0])
+    assert channel == f"engagement:{finished.id}"
+    assert message["type"] == "engagement.updated"
+    assert message["data"]["status"] == "completed"
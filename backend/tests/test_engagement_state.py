@@ -0,0 +1,64 @@
+"""
+Tests for the engagement state machine.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.engagement_state import TRANSITIONS, apply_transition, apply_transitions
+
+
+class _RecordingSession:
+    """Captures the executed statement and returns a canned row."""
+
+    def __init__(self, *rows):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return self.rows
+
+
+def test_transitions_only_leave_reachable_states():
+    """Test every source state is the target of some transition or the initial state."""
+    targets = {transition.target for transition in TRANSITIONS.values()} | {"pending"}
+    for transition in TRANSITIONS.values():
+        assert set(transition.sources) <= targets
+        assert transition.target not in transition.sources
+
+
+def test_apply_transition_is_one_conditional_update():
+    """Test a transition issues a single guarded UPDATE ... RETURNING."""
+    engagement_id = uuid4()
+    session = _RecordingSession(SimpleNamespace(
+        requested_id=engagement_id, id=engagement_id, previous_status="pending", status="active"
+    ))
+    result = asyncio.run(apply_transition(session, engagement_id, "confirm"))
+
+    assert result.found and result.applied
+    assert result.engagement.status == "active"
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE engagements SET status=" in sql
+    assert "engagements.status IN" in sql
+    assert "RETURNING" in sql
+
+
+def test_apply_transition_reports_missing_and_illegal():
+    """Test missing engagements and illegal transitions are told apart."""
+    missing_id, done_id, live_id = uuid4(), uuid4(), uuid4()
+    session = _RecordingSession(
+        SimpleNamespace(requested_id=done_id, id=None, previous_status="completed"),
+        SimpleNamespace(requested_id=live_id, id=live_id, previous_status="active", status="cancelled"),
+    )
+    results = asyncio.run(apply_transitions(session, [missing_id, done_id, live_id, done_id], "abort"))
+
+    assert len(session.statements) == 1
+    assert not results[missing_id].found and not results[missing_id].applied
+    assert results[done_id].found and not results[done_id].applied
+    assert results[done_id].previous_status == "completed"
+    assert results[live_id].applied and results[live_id].engagement.status == "cancelled"
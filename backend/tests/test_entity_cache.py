@@ -0,0 +1,64 @@
+"""
+Tests for the entity cache.
+"""
+
+import time
+
+from app.services.entity_cache import EntityCache
+
+
+def test_hits_misses_and_lru_eviction():
+    """Test counters and least-recently-used eviction."""
+    cache = EntityCache(max_entries=2, ttl_seconds=60)
+    cache.put("assets", 1, "a")
+    cache.put("assets", 2, "b")
+    assert cache.get("assets", 1) == "a"
+    cache.put("assets", 3, "c")
+
+    assert cache.get("assets", 2) is None
+    assert cache.get("assets", 3) == "c"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_expiry_and_invalidation():
+    """Test expired and invalidated entries are not served."""
+    cache = EntityCache(ttl_seconds=0.01)
+    cache.put("engagements", "x", 1)
+    time.sleep(0.02)
+    assert cache.get("engagements", "x") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache.ttl_seconds = 60
+    cache.put("engagements", "x", 1)
+    cache.invalidate("engagements", "x")
+    assert cache.get("engagements", "x") is None
+
+
+def test_fill_after_a_concurrent_write_is_discarded():
+    """Test a read-through fill loses to any write made after the reader took its version."""
+    cache = EntityCache(ttl_seconds=60)
+    version = cache.version("assets", 1)
+    cache.put("assets", 1, "new")
+    assert not cache.fill("assets", 1, "stale", version)
+    assert cache.get("assets", 1) == "new"
+
+    version = cache.version("assets", 1)
+    cache.invalidate("assets", 1)
+    assert not cache.fill("assets", 1, "stale", version)
+    assert cache.get("assets", 1) is None
+
+    version = cache.version("assets", 1)
+    assert cache.fill("assets", 1, "fresh", version)
+    assert cache.get("assets", 1) == "fresh"
+
+
+def test_forgotten_stamps_block_older_fills():
+    """Test fills from before the newest forgotten write stamp are refused."""
+    cache = EntityCache(ttl_seconds=60, max_stamps=1)
+    version = cache.version("assets", 1)
+    cache.invalidate("assets", 1)
+    cache.invalidate("assets", 2)
+    assert not cache.fill("assets", 1, "stale", version)
+    assert cache.fill("assets", 1, "fresh", cache.version("assets", 1))
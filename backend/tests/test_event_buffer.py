@@ -0,0 +1,152 @@
+"""
+Tests for write-behind event ingestion.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
+
+from app.services.event_buffer import EventBuffer, EventBufferClosed, EventBufferFull
+
+
+@pytest.fixture
+def buffer(fake_db):
+    """A small buffer over the fake database, with ``batches`` of written IDs."""
+    fake_db.batches = []
+    fake_db.bad_ids = set()
+
+    def insert(stmt, rows):
+        if any(row["id"] in fake_db.bad_ids for row in rows):
+            raise IntegrityError("INSERT", rows, Exception("foreign key violation"))
+        fake_db.batches.append([row["id"] for row in rows])
+
+    fake_db.handler = insert
+    return EventBuffer(max_size=100, batch_size=3, flush_seconds=0.05, shutdown_seconds=1.0, session_factory=fake_db)
+
+
+def test_flushes_full_batches_and_partial_ones_on_timeout(buffer, fake_db):
+    """Test a filled batch is written at once and a remainder after the interval."""
+    batches = fake_db.batches
+
+    async def scenario():
+        buffer.start()
+        ids = [uuid4() for _ in range(4)]
+        for event_id in ids:
+            buffer.submit({"id": event_id})
+        await asyncio.sleep(0.01)
+        assert batches == [ids[:3]]
+        await asyncio.sleep(0.1)
+        assert batches == [ids[:3], ids[3:]]
+        await buffer.stop()
+
+    asyncio.run(scenario())
+
+
+def test_rejects_when_full_or_closed_and_drains_on_stop(buffer, fake_db):
+    """Test backpressure signals and that stop writes everything accepted."""
+    batches = fake_db.batches
+    buffer.max_size, buffer.batch_size, buffer.flush_seconds = 2, 10, 60
+
+    async def scenario():
+        with pytest.raises(EventBufferClosed):
+            buffer.submit({"id": uuid4()})
+        buffer.start()
+        buffer.submit({"id": uuid4()})
+        buffer.submit({"id": uuid4()})
+        with pytest.raises(EventBufferFull):
+            buffer.submit({"id": uuid4()})
+        await buffer.stop()
+        with pytest.raises(EventBufferClosed):
+            buffer.submit({"id": uuid4()})
+        return buffer.stats()
+
+    stats = asyncio.run(scenario())
+    assert sum(len(batch) for batch in batches) == 2
+    assert (stats["written"], stats["rejected"], stats["queued"]) == (2, 1, 0)
+
+
+def test_bad_row_does_not_drop_its_batch(buffer, fake_db):
+    """Test an integrity error falls back to per-row inserts."""
+    batches = fake_db.batches
+    good, bad = uuid4(), uuid4()
+    fake_db.bad_ids.add(bad)
+
+    async def scenario():
+        buffer.start()
+        buffer.submit({"id": good})
+        buffer.submit({"id": bad})
+        await buffer.stop()
+        return buffer.stats()
+
+    stats = asyncio.run(scenario())
+    assert batches == [[good]]
+    assert stats["dropped"] == 1
+
+
+def test_outage_during_row_fallback_retries_only_unwritten_rows(buffer, fake_db):
+    """Test a connection error after an integrity error backs off instead of killing the writer."""
+    first, bad, last = uuid4(), uuid4(), uuid4()
+    fake_db.bad_ids.add(bad)
+    insert = fake_db.handler
+    outages = [OperationalError("INSERT", {}, Exception("connection reset"))]
+
+    def flaky(stmt, rows):
+        if len(rows) == 1 and rows[0]["id"] == last and outages:
+            raise outages.pop()
+        return insert(stmt, rows)
+
+    fake_db.handler = flaky
+
+    async def scenario():
+        buffer.start()
+        for event_id in (first, bad, last):
+            buffer.submit({"id": event_id})
+        await buffer.stop()
+        return buffer.stats()
+
+    with patch("app.services.event_buffer.RETRY_BASE_SECONDS", 0.01):
+        stats = asyncio.run(scenario())
+    assert fake_db.batches == [[first], [last]]
+    assert (stats["written"], stats["dropped"]) == (2, 1)
+
+
+def test_data_error_drops_the_row_instead_of_blocking_the_queue(buffer, fake_db):
+    """Test a value the database cannot store is dropped like a bad reference."""
+    good, bad = uuid4(), uuid4()
+
+    def insert(stmt, rows):
+        if any(row["id"] == bad for row in rows):
+            raise DataError("INSERT", rows, Exception("value too long"))
+        fake_db.batches.append([row["id"] for row in rows])
+
+    fake_db.handler = insert
+
+    async def scenario():
+        buffer.start()
+        buffer.submit({"id": good})
+        buffer.submit({"id": bad})
+        await buffer.stop()
+        return buffer.stats()
+
+    stats = asyncio.run(scenario())
+    assert fake_db.batches == [[good]]
+    assert stats["dropped"] == 1
+
+
+def test_created_at_is_stamped_when_the_batch_is_written(buffer, fake_db):
+    """Test created_at reflects the flush, not the accept, so /sync does not skip late rows."""
+    accepted = datetime(2020, 1, 1)
+    row = {"id": uuid4(), "timestamp": accepted}
+
+    async def scenario():
+        buffer.start()
+        buffer.submit(row)
+        await buffer.stop()
+
+    asyncio.run(scenario())
+    assert row["timestamp"] == accepted
+    assert row["created_at"] > accepted
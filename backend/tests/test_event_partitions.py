@@ -0,0 +1,48 @@
+"""
+Tests for events partition upkeep and retention.
+"""
+
+import asyncio
+from datetime import date, datetime
+
+from app.services.event_partitions import ensure_partitions, expire_partitions, partition_name, period_start
+
+
+def _list_partitions(bounds):
+    """Handler answering the partition listing with canned bounds."""
+    def handler(stmt, params):
+        if "pg_inherits" in str(stmt):
+            return [
+                (partition_name(start), f"FOR VALUES FROM ('{start} 00:00:00') TO ('{end} 00:00:00')")
+                for start, end in bounds
+            ] + [("events_default", "DEFAULT")]
+        return []
+    return handler
+
+
+def test_period_start_aligns_days_and_weeks():
+    """Test daily periods are the day itself and weekly ones start on Monday."""
+    assert period_start(date(2026, 10, 17), 1) == date(2026, 10, 17)
+    assert period_start(date(2026, 10, 17), 7) == date(2026, 10, 12)
+    assert period_start(date(2026, 10, 12), 7).weekday() == 0
+
+
+def test_ensure_creates_only_missing_partitions_ahead(fake_db):
+    """Test partitions are added after the newest existing one through the horizon."""
+    fake_db.handler = _list_partitions([(date(2026, 10, 16), date(2026, 10, 17)), (date(2026, 10, 17), date(2026, 10, 18))])
+    created = asyncio.run(ensure_partitions(fake_db(), date(2026, 10, 17), 2, 1))
+    assert created == ["events_p20261018", "events_p20261019"]
+    attach = [sql for sql in fake_db.statements if "ATTACH PARTITION" in sql]
+    assert "FROM ('2026-10-18') TO ('2026-10-19')" in attach[0]
+    assert any("DELETE FROM events_default" in sql for sql in fake_db.statements)
+
+
+def test_expire_drops_only_partitions_past_the_cutoff(fake_db):
+    """Test expired partitions are detached and dropped and the default partition trimmed."""
+    fake_db.handler = _list_partitions([(date(2026, 9, 1), date(2026, 9, 2)), (date(2026, 9, 20), date(2026, 9, 21))])
+    dropped = asyncio.run(expire_partitions(fake_db(), datetime(2026, 9, 17)))
+    assert dropped == ["events_p20260901"]
+    sql = [statement for statement in fake_db.statements if "events_p20260901" in statement]
+    assert "DETACH PARTITION" in sql[0] and sql[1].startswith("DROP TABLE")
+    assert any(statement.startswith("DELETE FROM events_default") for statement in fake_db.statements)
+    assert not any("events_p20260920" in statement for statement in fake_db.statements)
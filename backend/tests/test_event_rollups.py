@@ -0,0 +1,35 @@
+"""
+Tests for incrementally maintained event counts.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.event_rollups import ROLLUP_TRIGGER_DDL, stats_query
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_trigger_counts_each_statement_into_both_granularities():
+    """Test the trigger aggregates the whole inserted batch into minute and hour counters."""
+    function = ROLLUP_TRIGGER_DDL[0]
+    assert "INSERT INTO event_rollups_minute" in function
+    assert "date_trunc('minute', timestamp)" in function
+    assert "INSERT INTO event_rollups_hourly" in function
+    assert "date_trunc('hour', timestamp)" in function
+    assert "FOR EACH STATEMENT" in ROLLUP_TRIGGER_DDL[-1]
+
+
+def test_stats_read_rollups_not_raw_events():
+    """Test stats queries hit the rollup table for the bucket size only."""
+    sql = _sql(stats_query("1m", ["severity"], datetime(2026, 1, 1), datetime(2026, 1, 1, 1)))
+    assert "FROM event_rollups_minute" in sql
+    assert "events " not in sql.replace("event_rollups_minute", "")
+    assert "GROUP BY event_rollups_minute.bucket, event_rollups_minute.severity" in sql
+
+    sql = _sql(stats_query("1h", [], datetime(2026, 1, 1), datetime(2026, 1, 2), event_type="alert"))
+    assert "FROM event_rollups_hourly" in sql
+    assert "event_rollups_hourly.event_type = " in sql
@@ -0,0 +1,97 @@
+"""
+Tests for streaming NDJSON export.
+"""
+
+import asyncio
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import orjson
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.main import app
+from app.models.event import Event
+from app.services.export import stream_ndjson
+
+client = TestClient(app)
+
+EventRow = namedtuple("EventRow", ["id", "event_type", "severity", "timestamp"])
+
+
+def _collect(stmt, fake_db, batch_size):
+    async def run():
+        return [chunk async for chunk in stream_ndjson(stmt, batch_size, session_factory=fake_db)]
+    return asyncio.run(run())
+
+
+def test_rows_are_framed_one_json_object_per_line_in_order(fake_db):
+    """Test each row becomes one newline-terminated object, chunked per partition, in query order."""
+    rows = [EventRow(uuid4(), "alert", "critical", datetime(2026, 10, 17, 0, minute)) for minute in range(5)]
+    fake_db.handler = lambda stmt, params: rows
+
+    chunks = _collect(select(Event.__table__), fake_db, batch_size=2)
+    assert len(chunks) == 3
+    lines = b"".join(chunks).split(b"\n")
+    assert lines[-1] == b""
+    decoded = [orjson.loads(line) for line in lines[:-1]]
+    assert [item["id"] for item in decoded] == [str(row.id) for row in rows]
+    assert decoded[0]["timestamp"] == "2026-10-17T00:00:00"
+    assert fake_db.executed[0][0].get_execution_options()["yield_per"] == 2
+
+
+def test_empty_result_streams_nothing(fake_db):
+    """Test an export with no matching rows yields no chunks."""
+    assert _collect(select(Event.__table__), fake_db, batch_size=10) == []
+
+
+def _export(path, params, fake_db):
+    """Call an export endpoint against the fake database and return (body, compiled SQL)."""
+    def factory_stream(stmt):
+        return stream_ndjson(stmt, session_factory=fake_db)
+
+    with patch("app.api.v1.stream_ndjson", factory_stream):
+        response = client.get(path, params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    (stmt, _), = fake_db.executed
+    return response.content, stmt.compile(dialect=postgresql.dialect())
+
+
+def test_event_export_applies_filters_and_timestamp_order(fake_db):
+    """Test event export filters become WHERE clauses and rows come out by timestamp."""
+    body, compiled = _export(
+        "/api/v1/events/export",
+        {"severity": "critical", "start": "2026-10-17T00:00:00", "asset_id": str(uuid4())},
+        fake_db,
+    )
+    sql = str(compiled)
+    assert body == b""
+    assert "events.severity = " in sql
+    assert "events.timestamp >= " in sql
+    assert "events.asset_id = " in sql
+    assert "events.event_type" not in sql.split("WHERE")[1]
+    assert sql.endswith("ORDER BY events.timestamp, events.id")
+
+
+def test_command_export_applies_filters_and_creation_order(fake_db):
+    """Test command export filters become WHERE clauses and rows come out by creation time."""
+    _, compiled = _export("/api/v1/commands/export", {"status": "failed", "command_type": "patrol"}, fake_db)
+    sql = str(compiled)
+    assert "commands.status = " in sql
+    assert "commands.command_type = " in sql
+    assert sql.endswith("ORDER BY commands.created_at, commands.id")
+
+
+def test_export_bounds_are_bound_as_naive_utc(fake_db):
+    """Test offset start/end are converted before the stream starts rather than failing mid-body."""
+    _, compiled = _export(
+        "/api/v1/commands/export",
+        {"start": "2026-10-17T02:00:00+02:00", "end": "2026-10-17T01:00:00Z"},
+        fake_db,
+    )
+    bounds = [value for value in compiled.params.values() if isinstance(value, datetime)]
+    assert bounds == [datetime(2026, 10, 17, 0), datetime(2026, 10, 17, 1)]
@@ -0,0 +1,58 @@
+"""
+Tests for JSONB field filters.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from sqlalchemy.schema import CreateIndex
+
+from app.models.asset import EXTRA_DATA_NUMERIC_KEYS, Asset
+from app.utils.json_filter import compile_filter, jsonpath_predicate
+
+COLUMNS = {"extra_data": Asset.extra_data}
+NUMERIC_KEYS = {"extra_data": EXTRA_DATA_NUMERIC_KEYS}
+
+
+def _sql(expression: str, numeric_keys=None):
+    compiled = compile_filter(expression, COLUMNS, numeric_keys).compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def test_equality_compiles_to_containment():
+    """Test equality uses @> with a nested document, typed from the value."""
+    sql, params = _sql("extra_data.sensors.mode=thermal")
+    assert "assets.extra_data @>" in sql
+    assert params == [{"sensors": {"mode": "thermal"}}]
+
+    _, params = _sql("extra_data.battery_level=20")
+    assert params == [{"battery_level": 20}]
+
+
+def test_comparison_compiles_to_jsonpath():
+    """Test range comparisons become an @@ jsonpath predicate."""
+    sql, params = _sql("extra_data.battery_level<20")
+    assert "assets.extra_data @@ CAST(" in sql and "AS JSONPATH)" in sql
+    assert params == ['$."battery_level" < 20']
+    assert jsonpath_predicate(["a b"], "!=", "x\"y") == '$."a b" != "x\\"y"'
+
+
+def test_ranges_on_numeric_keys_match_the_expression_index():
+    """Test declared numeric keys compile to the indexed cast, others stay on jsonpath."""
+    sql, params = _sql("extra_data.battery_level<20", NUMERIC_KEYS)
+    (index,) = [index for index in Asset.__table__.indexes if index.name == "idx_assets_battery_level"]
+    indexed = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    expression = "CAST(assets.extra_data ->> 'battery_level' AS NUMERIC)"
+    assert sql.startswith(expression + " <")
+    assert expression.replace("assets.", "") in indexed
+    assert params == [20]
+
+    for unindexed in ("extra_data.battery_level!=20", "extra_data.battery_level<low", "extra_data.firmware<2"):
+        assert "@@" in _sql(unindexed, NUMERIC_KEYS)[0]
+
+
+@pytest.mark.parametrize("expression", ["payload.speed>1", "extra_data", "extra_data.level~3", "extra_data.a={}"])
+def test_invalid_filters_are_rejected(expression):
+    """Test unknown columns, malformed expressions and non-scalar values raise ValueError."""
+    with pytest.raises(ValueError):
+        compile_filter(expression, COLUMNS)
@@ -0,0 +1,74 @@
+"""
+Tests for the in-memory spatial index.
+"""
+
+import random
+
+from app.utils.geo import haversine_km
+from app.utils.spatial_index import GridIndex, PositionArrays
+
+
+def test_haversine_known_distance():
+    """Test haversine against the LA to San Diego distance."""
+    distance = haversine_km(34.0522, -118.2437, 32.7157, -117.1611)
+    assert 178 < distance < 181
+
+
+def test_query_radius_matches_brute_force():
+    """Test radius query returns the same assets as a full scan."""
+    rng = random.Random(42)
+    index = GridIndex(cell_size_deg=0.1)
+    points = {}
+    for key in range(2000):
+        lat, lon = rng.uniform(32.5, 34.5), rng.uniform(-118.5, -116.8)
+        points[key] = (lat, lon)
+        index.insert(key, lat, lon)
+
+    center = (33.5, -117.8)
+    expected = {key for key, (lat, lon) in points.items() if haversine_km(*center, lat, lon) <= 25}
+    matches = index.query_radius(*center, 25)
+
+    assert {key for key, _ in matches} == expected
+    distances = [distance for _, distance in matches]
+    assert distances == sorted(distances)
+
+
+def test_insert_moves_and_remove():
+    """Test moving and removing points keeps buckets consistent."""
+    index = GridIndex(cell_size_deg=0.1)
+    index.insert("a", 34.0, -118.0)
+    index.insert("a", 32.7, -117.1)
+    assert len(index) == 1
+    assert index.query_radius(34.0, -118.0, 5) == []
+    assert [key for key, _ in index.query_radius(32.7, -117.1, 5)] == ["a"]
+
+    index.remove("a")
+    assert len(index) == 0
+    assert index.query_radius(32.7, -117.1, 5) == []
+
+
+def test_query_across_antimeridian():
+    """Test searches that wrap around longitude 180."""
+    index = GridIndex(cell_size_deg=0.5)
+    index.insert("east", 0.0, 179.9)
+    index.insert("west", 0.0, -179.9)
+    keys = {key for key, _ in index.query_radius(0.0, 179.95, 50)}
+    assert keys == {"east", "west"}
+    assert set(index.query_bbox(-1.0, 179.0, 1.0, 181.0)) == {"east", "west"}
+
+
+def test_position_arrays_nearest_with_code_filter():
+    """Test k-nearest lookup over the array store."""
+    arrays = PositionArrays(capacity=2)
+    arrays.upsert("near", 34.00, -118.00, code=0)
+    arrays.upsert("busy", 34.001, -118.001, code=1)
+    arrays.upsert("far", 34.50, -118.50, code=0)
+    arrays.upsert("mid", 34.10, -118.10, code=0)
+
+    assert [key for key, _ in arrays.nearest(34.0, -118.0, 2)] == ["near", "busy"]
+    assert [key for key, _ in arrays.nearest(34.0, -118.0, 5, code=0)] == ["near", "mid", "far"]
+
+    arrays.remove("near")
+    arrays.upsert("mid", 34.0, -118.0, code=0)
+    assert len(arrays) == 3
+    assert arrays.nearest(34.0, -118.0, 1, code=0)[0][0] == "mid"
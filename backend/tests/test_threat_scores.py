@@ -0,0 +1,107 @@
+"""
+Tests for incremental enemy threat scoring.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app.services.asset_index import AssetIndex
+from app.services.threat_scores import ThreatScores
+
+
+def _loaded_index():
+    index = AssetIndex()
+    index.loaded = True
+    index.generation = 1
+    return index
+
+
+def test_closer_and_deadlier_enemies_rank_first():
+    """Test proximity and asset type drive the ranking."""
+    index = _loaded_index()
+    scores = ThreatScores(index)
+    friendly, near_drone, near_camera, far_drone = (uuid.uuid4() for _ in range(4))
+    index.upsert(friendly, 34.0, -118.0, True, "available", asset_type="vehicle")
+    index.upsert(near_drone, 34.05, -118.0, False, "available", asset_type="drone")
+    index.upsert(near_camera, 34.05, -118.0, False, "available", asset_type="camera")
+    index.upsert(far_drone, 36.0, -118.0, False, "available", asset_type="drone")
+
+    assert asyncio.run(scores.refresh()) == 3
+    ranked = [asset_id for asset_id, _ in scores.ranked()]
+    assert ranked == [near_drone, near_camera, far_drone]
+    assert scores.scores[far_drone].score == 0
+    assert scores.scores[near_drone].nearest_friendly_id == friendly
+
+
+def test_only_affected_enemies_are_rescored():
+    """Test that moves only dirty the moved enemy or enemies near a moved friendly."""
+    index = _loaded_index()
+    scores = ThreatScores(index)
+    friendly, near, far = (uuid.uuid4() for _ in range(3))
+    index.upsert(friendly, 34.0, -118.0, True, "available")
+    for _ in range(3):
+        index.upsert(uuid.uuid4(), -30.0, 150.0, True, "available")
+    index.upsert(near, 34.1, -118.0, False, "available")
+    index.upsert(far, 40.0, -100.0, False, "available")
+    asyncio.run(scores.refresh())
+    before = scores.scores[near].score
+
+    assert asyncio.run(scores.refresh()) == 0
+
+    index.upsert(friendly, 34.09, -118.0, True, "available")
+    assert asyncio.run(scores.refresh()) == 1
+    assert scores.scores[near].score > before
+
+    index.upsert(far, 40.1, -100.0, False, "available")
+    assert asyncio.run(scores.refresh()) == 1
+    assert scores.scores[far].speed_kmh > 0
+
+    index.remove(near)
+    assert near not in scores.scores
+    assert [asset_id for asset_id, _ in scores.ranked()] == [far]
+
+
+def test_friendly_moves_stay_bounded_without_readers():
+    """Test unread friendly telemetry collapses into one rescore-all flag."""
+    index = _loaded_index()
+    scores = ThreatScores(index)
+    friendlies = [uuid.uuid4() for _ in range(5)]
+    enemy = uuid.uuid4()
+    for i, friendly in enumerate(friendlies):
+        index.upsert(friendly, 34.0 + i, -118.0, True, "available")
+    index.upsert(enemy, 34.0, -117.9, False, "available")
+    asyncio.run(scores.refresh())
+
+    for step in range(1000):
+        for friendly in friendlies:
+            index.upsert(friendly, 34.0 + step * 1e-4, -118.0, True, "available")
+    assert len(scores._friendly_moves) < len(friendlies)
+    assert asyncio.run(scores.refresh()) == 1
+
+
+def test_speed_uses_report_times_and_decays_when_stationary():
+    """Test speed comes from telemetry timestamps and lapses after SPEED_WINDOW."""
+    index = _loaded_index()
+    scores = ThreatScores(index)
+    enemy = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(minutes=10)
+    index.upsert(enemy, 34.0, -118.0, False, "available", last_seen=start)
+    index.upsert(enemy, 34.1, -118.0, False, "available", last_seen=start + timedelta(minutes=1))
+    assert asyncio.run(scores.refresh()) == 1
+    # The move was reported ten minutes ago, so the enemy counts as stopped
+    assert scores.scores[enemy].speed_kmh == 0
+
+    now = datetime.utcnow()
+    index.upsert(enemy, 34.2, -118.0, False, "available", last_seen=now)
+    index.upsert(enemy, 34.3, -118.0, False, "available", last_seen=now + timedelta(seconds=36))
+    asyncio.run(scores.refresh())
+    assert 1000 < scores.scores[enemy].speed_kmh < 1200
+
+    # A report without movement is not a change, but the window still lapses
+    index.upsert(enemy, 34.3, -118.0, False, "available", last_seen=now + timedelta(minutes=5))
+    with patch("app.services.threat_scores.datetime") as clock:
+        clock.utcnow.return_value = now + timedelta(minutes=5)
+        assert asyncio.run(scores.refresh()) == 1
+    assert scores.scores[enemy].speed_kmh == 0
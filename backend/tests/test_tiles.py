@@ -0,0 +1,68 @@
+"""
+Tests for binary asset tiles.
+"""
+
+import uuid
+
+import numpy as np
+
+from app.services.tile_cache import HEADER, RECORD_DTYPE, TileCache, pack_tile
+from app.utils.geo import point_to_tile, tile_bounds
+
+
+def test_point_falls_inside_its_tile():
+    """Test tile math round-trips for a point at several zoom levels."""
+    for z in (0, 5, 12, 18):
+        x, y = point_to_tile(34.0522, -118.2437, z)
+        min_lat, min_lon, max_lat, max_lon = tile_bounds(z, x, y)
+        assert min_lat <= 34.0522 < max_lat
+        assert min_lon <= -118.2437 < max_lon
+
+
+def test_pack_tile_layout():
+    """Test the packed header and records decode back to the inputs."""
+    asset_id = uuid.uuid4()
+    payload = pack_tile([(asset_id, 34.0, -118.0, "maintenance", False)])
+    magic, record_size, count = HEADER.unpack_from(payload)
+    assert (magic, record_size, count) == (b"AST1", RECORD_DTYPE.itemsize, 1)
+
+    record = np.frombuffer(payload, dtype=RECORD_DTYPE, offset=HEADER.size)[0]
+    assert uuid.UUID(bytes=record["id"].ljust(16, b"\0")) == asset_id
+    assert record["status"] == 2
+    assert record["flags"] == 0
+    assert len(payload) == HEADER.size + RECORD_DTYPE.itemsize
+
+
+def test_invalidation_drops_tiles_and_skips_stale_builds():
+    """Test that a move evicts tiles and races do not cache stale data."""
+    cache = TileCache()
+    key = (10, *point_to_tile(34.0, -118.0, 10))
+    cache.put(key, b"tile", cache.version)
+    assert cache.get(key) is not None
+
+    version = cache.version
+    cache.invalidate_point(34.0, -118.0)
+    assert cache.get(key) is None
+
+    cache.put(key, b"stale", version)
+    assert cache.get(key) is None
+
+
+def test_moves_elsewhere_do_not_block_caching():
+    """Test a build only loses its race to changes inside its own tile."""
+    cache = TileCache(max_stamps=64)
+    key = (10, *point_to_tile(34.0, -118.0, 10))
+    version = cache.version
+    cache.invalidate_point(-33.9, 151.2)
+    cache.put(key, b"tile", version)
+    assert cache.get(key) is not None
+
+    # Once stamps are forgotten, builds that predate them are not trusted
+    version = cache.version
+    for step in range(10):
+        cache.invalidate_point(-33.9 + step, 151.2)
+    other = (10, *point_to_tile(10.0, 10.0, 10))
+    cache.put(other, b"tile", version)
+    assert cache.get(other) is None
+    cache.put(other, b"tile", cache.version)
+    assert cache.get(other) is not None
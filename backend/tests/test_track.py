@@ -0,0 +1,35 @@
+"""
+Tests for track simplification.
+"""
+
+import numpy as np
+
+from app.utils.track import simplify_track
+
+
+def test_short_tracks_are_returned_unchanged():
+    """Test tracks within budget keep every point."""
+    lats = np.array([34.0, 34.1, 34.2])
+    lons = np.array([-118.0, -118.1, -118.2])
+    assert simplify_track(lats, lons, 10).tolist() == [0, 1, 2]
+
+
+def test_budget_is_respected_and_corners_are_kept():
+    """Test an L-shaped track keeps its endpoints and the corner."""
+    lats = np.concatenate([np.linspace(34.0, 34.5, 500), np.full(500, 34.5)])
+    lons = np.concatenate([np.full(500, -118.0), np.linspace(-118.0, -117.5, 500)])
+    keep = simplify_track(lats, lons, 3)
+    assert keep.tolist() == [0, 499, 999]
+
+    keep = simplify_track(lats, lons, 50)
+    assert len(keep) == 50
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_stationary_track():
+    """Test a track that never moves still honours the budget."""
+    lats = np.full(100, 34.0)
+    lons = np.full(100, -118.0)
+    keep = simplify_track(lats, lons, 5)
+    assert len(keep) == 5
+    assert keep[0] == 0 and keep[-1] == 99
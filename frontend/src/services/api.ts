@@ -27,6 +27,12 @@ export const locationsApi = {
     api.get(`/locations/nearby?lat=${lat}&lon=${lon}&radius_km=${radius}`),
 };
 
+// Asset endpoints
+export const assetsApi = {
+  getAll: () => api.get('/assets'),
+  getById: (id: string) => api.get(`/assets/${id}`),
+};
+
 // Event endpoints
 export const eventsApi = {
   getAll: () => api.get('/events'),